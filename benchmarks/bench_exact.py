@@ -0,0 +1,72 @@
+"""
+Benchmarks the exact (Bareiss) determinant and inverse of pylix.algebra.exact against the float64 LAPACK path and a
+naive Gaussian elimination on Fractions.
+
+The inputs are random integer matrices. Besides the times, the error of the float determinant relative to the exact
+one is printed, which shows where float64 stops being trustworthy.
+
+    python -m benchmarks.bench_exact --sizes 4 8 16 32 64 --max-naive 32 --entries 100
+"""
+import argparse
+import timeit
+from fractions import Fraction
+
+import numpy as np
+
+from pylix.algebra import exact
+
+
+def best_of(func, repeat: int = 3) -> float:
+    number: int = 1
+    while timeit.timeit(func, number=number) < 0.05 and number < 1_000_000:
+        number *= 10
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def naive_determinant(data: np.ndarray) -> Fraction:
+    m: list = [[Fraction(int(value)) for value in row] for row in data]
+    n: int = len(m)
+    det: Fraction = Fraction(1)
+    for k in range(n):
+        pivot: int = next((i for i in range(k, n) if m[i][k] != 0), -1)
+        if pivot == -1:
+            return Fraction(0)
+        if pivot != k:
+            m[k], m[pivot] = m[pivot], m[k]
+            det = -det
+        det *= m[k][k]
+        for i in range(k + 1, n):
+            factor: Fraction = m[i][k] / m[k][k]
+            for j in range(k, n):
+                m[i][j] -= factor * m[k][j]
+    return det
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    parser.add_argument("--max-naive", type=int, default=32, help="largest size for the naive Fraction elimination")
+    parser.add_argument("--entries", type=int, default=100, help="the entries are drawn from [-entries, entries]")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>4} {'float det (s)':>14} {'bareiss det (s)':>16} {'naive det (s)':>14} {'float inv (s)':>14} "
+          f"{'bareiss inv (s)':>16} {'float rel. error':>17}")
+    for n in args.sizes:
+        a: np.ndarray = rng.integers(-args.entries, args.entries + 1, (n, n))
+        a_float: np.ndarray = a.astype(float)
+        det: int = exact.determinant(a)
+        error: float = abs(float(np.linalg.det(a_float)) - det) / abs(det) if det != 0 else float("nan")
+        row: str = (f"{n:>4} {best_of(lambda: np.linalg.det(a_float)):>14.3e} "
+                    f"{best_of(lambda: exact.determinant(a)):>16.3e}")
+        if n <= args.max_naive:
+            row += f" {best_of(lambda: naive_determinant(a), repeat=1):>14.3e}"
+        else:
+            row += f" {'-':>14}"
+        row += (f" {best_of(lambda: np.linalg.inv(a_float)):>14.3e} "
+                f"{best_of(lambda: exact.inverse(a), repeat=1):>16.3e} {error:>17.3e}")
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
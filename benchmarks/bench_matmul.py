@@ -0,0 +1,54 @@
+"""
+Benchmarks the multiply kernels of pylix.algebra.matrix against each other.
+
+For every size the BLAS path (numpy matmul on float arrays), the Strassen-Winograd kernel on object arrays (what
+multiply() dispatches exact dtypes to), the dense object kernel and the pure python triple loop are timed, so the
+crossover between them can be read off the table.
+
+    python -m benchmarks.bench_matmul --sizes 8 16 32 64 128 256 --max-python 128 --leaf 32
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pylix.algebra.matrix import multiply, strassen_multiply, matrix_multiply_opt, STRASSEN_LEAF_SIZE
+
+
+def best_of(func, repeat: int = 5) -> float:
+    number: int = 1
+    while timeit.timeit(func, number=number) < 0.05 and number < 1_000_000:
+        number *= 10
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 128, 256])
+    parser.add_argument("--max-python", type=int, default=128,
+                        help="largest size for which the object / pure python kernels are timed")
+    parser.add_argument("--leaf", type=int, default=STRASSEN_LEAF_SIZE, help="leaf size of the Strassen kernel")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'blas (s)':>12} {'strassen (s)':>14} {'dense obj (s)':>14} {'loop (s)':>12}")
+    for n in args.sizes:
+        a: np.ndarray = rng.random((n, n))
+        b: np.ndarray = rng.random((n, n))
+        row: str = f"{n:>6} {best_of(lambda: multiply(a, b)):>12.3e}"
+        if n <= args.max_python:
+            a_obj: np.ndarray = rng.integers(-2 ** 40, 2 ** 40, (n, n)).astype(object) * 2 ** 40
+            b_obj: np.ndarray = rng.integers(-2 ** 40, 2 ** 40, (n, n)).astype(object) * 2 ** 40
+            a_list: list = a_obj.tolist()
+            b_list: list = b_obj.tolist()
+            strassen: float = best_of(lambda: strassen_multiply(a_obj, b_obj, args.leaf), repeat=1)
+            dense: float = best_of(lambda: a_obj @ b_obj, repeat=1)
+            loop: float = best_of(lambda: matrix_multiply_opt(a_list, b_list), repeat=1)
+            row += f" {strassen:>14.3e} {dense:>14.3e} {loop:>12.3e}"
+        else:
+            row += f" {'-':>14} {'-':>14} {'-':>12}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
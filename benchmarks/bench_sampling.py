@@ -0,0 +1,40 @@
+"""
+Benchmarks repeated draws from one distribution: Vector.rand_choice (np.random.choice, O(n) per draw) against an
+AliasSampler built once with Vector.sampler() (O(1) per draw, k draws in one call).
+
+    python -m benchmarks.bench_sampling --sizes 10 100 1000 10000 --draws 100000
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from pylix.algebra import Vector
+
+
+def best_of(func, repeat: int = 3) -> float:
+    number: int = 1
+    while timeit.timeit(func, number=number) < 0.05 and number < 1_000_000:
+        number *= 10
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--draws", type=int, default=100_000, help="number of draws for the batched sampler")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'rand_choice (s/draw)':>21} {'setup (s)':>10} {'draw() (s/draw)':>16} "
+          f"{'draw(k) (s/draw)':>17}")
+    for n in args.sizes:
+        v: Vector = Vector.from_numpy(rng.random(n))
+        sampler = v.sampler()
+        print(f"{n:>6} {best_of(lambda: v.rand_choice()):>21.3e} {best_of(lambda: v.sampler()):>10.3e} "
+              f"{best_of(lambda: sampler.draw()):>16.3e} "
+              f"{best_of(lambda: sampler.draw(args.draws)) / args.draws:>17.3e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Benchmarks the overhead of the validation levels of pylix.errors.assertion.
+
+Every workload is timed with the levels 'full', 'boundary' and 'off'.
+
+    python -m benchmarks.bench_validation
+"""
+import timeit
+
+import numpy as np
+
+from pylix.algebra import Matrix, Vector, Polynomial
+from pylix.errors import validation
+
+
+def best_of(func, number: int = 2_000, repeat: int = 5) -> float:
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    v: Vector = Vector(list(range(16)))
+    m: Matrix = Matrix(np.arange(16.0).reshape(4, 4))
+
+    def set_items() -> None:
+        v[3] = 2.5
+
+    workloads: dict = {
+        "Vector.__getitem__": lambda: v[3],
+        "Vector.__setitem__": set_items,
+        "Vector + Vector": lambda: v + v,
+        "Matrix * Matrix (4x4)": lambda: m * m,
+        "Matrix(list) (4x4)": lambda: Matrix([[1, 2, 3, 4]] * 4),
+        "Vector.sum": lambda: v.sum(),
+        "Polynomial(20, ...)": lambda: Polynomial(20, list(range(1, 22))),
+    }
+    levels: tuple = ("full", "boundary", "off")
+    print(f"{'workload':<24}" + "".join(f"{level + ' (us)':>16}" for level in levels))
+    for name, workload in workloads.items():
+        row: str = f"{name:<24}"
+        for level in levels:
+            with validation(level):
+                row += f"{best_of(workload) * 1e6:>16.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
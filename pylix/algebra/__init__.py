@@ -1,16 +1,32 @@
 from pylix.algebra.vector import Vector
 from pylix.algebra.matrix import Matrix, Axis
+from pylix.algebra.matrix_batch import MatrixBatch
+from pylix.algebra.vector_array import VectorArray
+from pylix.algebra.sparse_matrix import SparseMatrix
+from pylix.algebra.expression import Expression
 from pylix.algebra.equations import Polynomial
-from pylix.algebra.statics import rnd, variance, average, std
+from pylix.algebra.sampling import AliasSampler, spawn_rngs, sample_batch
+from pylix.algebra.statics import rnd, variance, average, std, Rounding, get_precision, set_precision, precision
 
 __all__ = [
     "Vector",
     "statics",
     "Matrix",
+    "MatrixBatch",
+    "VectorArray",
+    "SparseMatrix",
+    "Expression",
     "Polynomial",
+    "AliasSampler",
+    "spawn_rngs",
+    "sample_batch",
     "Axis",
     "rnd",
     "variance",
     "average",
-    "std"
+    "std",
+    "Rounding",
+    "get_precision",
+    "set_precision",
+    "precision"
 ]
@@ -1,9 +1,10 @@
 import numpy as np
 
-from typing import Self
+from typing import Self, Union
 
-from pylix.algebra.statics import rnd
-from pylix.types import AllLists, Int, Number
+from pylix.algebra.matrix import Matrix, NUMERIC_KINDS
+from pylix.algebra.statics import round_output, round_step
+from pylix.types import AllLists, Int, Number, Lists
 from pylix.errors import assertion, ArgumentError, MathError, ArgumentCodes, MathCodes, TypesTuple, StateError
 
 class Equation:
@@ -37,7 +38,7 @@ class Polynomial(Equation):
         :rtype Int:
         :param parameters: All parameters of the polynome: a * x^2 + 0 * x + b -> [a, 0, b]
         :rtype AllLists:
-        :param integrate_derive: Should the function be derived and integrated?
+        :param integrate_derive: Can the polynomial be derived and integrated? Both are computed on first use.
         :rtype bool:
         """
         assertion.assert_types(degree, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
@@ -53,12 +54,27 @@ class Polynomial(Equation):
         while len(parameters) < abs(degree) + 1:
             parameters.append(0)
 
-        super().__init__(self.generate_polynome(degree, parameters), parameters)
+        super().__init__(None, parameters)
         self._degree: int = int(degree)
-        self._integrale = self._integrate() if integrate_derive else None
-        self._derivative_1 = self._derive() if integrate_derive else None
-        self._derivative_2 = self._derive(2) if integrate_derive else None
-        self._derivative_3 = self._derive(3) if integrate_derive else None
+        self._integrate_derive: bool = integrate_derive
+        self._derivatives: dict[int, Polynomial] = dict()
+        self._integrals: dict[int, Polynomial] = dict()
+
+    @classmethod
+    def _wrap(cls, degree: int, parameters: list, integrate_derive: bool = False) -> Self:
+        """
+        Creates a polynomial from already validated and padded parameters, without checking them.
+
+        Crée un polynôme à partir de paramètres déjà validés et complétés, sans les vérifier.
+        """
+        polynomial: Polynomial = cls.__new__(cls)
+        polynomial._equation = None
+        polynomial._parameters = parameters
+        polynomial._degree = degree
+        polynomial._integrate_derive = integrate_derive
+        polynomial._derivatives = dict()
+        polynomial._integrals = dict()
+        return polynomial
 
     @classmethod
     def generate_polynome(cls, degree: Int, parameters: AllLists) -> str:
@@ -118,70 +134,105 @@ class Polynomial(Equation):
                     equation += f" + {parameters[index]} / x**{power}"
         return equation
 
+    def get_equation(self) -> str:
+        if self._equation is None:
+            self._equation = self.generate_polynome(self._degree, self._parameters)
+        return self._equation
+
     def get_degree(self) -> int:
         return self._degree
 
-    def y_at_x(self, x: Number) -> float:
-        assertion.assert_types(x, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        y: float = 0
-        for power in range(self._degree, -1, -1):
-            index: int = int(self._degree - power)
-            if index == len(self._parameters):
-                break
-            if self._parameters[index] == 0:
-                continue
-            y += rnd(self._parameters[index] * (x ** power))
+    def y_at_x(self, x: Union[Number, Lists, Matrix]) -> Union[float, np.ndarray, Matrix]:
+        """
+        Evaluates the polynomial with Horner's scheme: a_n, then y = y * x + a_i for every parameter, which needs one
+        multiplication and one addition per degree and no powers. Arrays, vectors and matrices are evaluated
+        element-wise in one numpy pass. A negative degree is evaluated in 1 / x.
+
+        Évalue le polynôme avec le schéma de Horner, sans puissances. Les tableaux, vecteurs et matrices sont évalués
+        élément par élément en une seule passe numpy. Un degré négatif est évalué en 1 / x.
+
+        :param x: A number, a list / ndarray of numbers, a Vector or a Matrix.
+        :return: A float for a number, else the same kind of object (ndarray, Vector, Matrix) with the values.
+        """
+        assertion.assert_types(x, (*TypesTuple.NUMBER.value, *TypesTuple.LISTS.value, *TypesTuple.TUPLE.value,
+                                   Matrix), ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        if isinstance(x, TypesTuple.NUMBER.value):
+            return round_output(float(self._horner(np.float64(x))))
+        data: np.ndarray = x._data if isinstance(x, Matrix) else np.asarray(x)
+        assertion.assert_true(data.dtype.kind in NUMERIC_KINDS, ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                              wrong_argument=data.dtype)
+        if data.dtype.kind in "biu":
+            # like the scalar path: int arrays would silently wrap around in Horner's scheme
+            data = data.astype(np.float64)
+        y: np.ndarray = round_output(np.asarray(self._horner(data)))
+        return type(x).from_numpy(y) if isinstance(x, Matrix) else y
+
+    def _horner(self, x: Union[np.floating, np.ndarray]) -> Union[np.floating, np.ndarray]:
+        if self._degree < 0:
+            assertion.assert_true(bool(np.all(x != 0)), MathError, code=MathCodes.ZERO,
+                                  msg="Division by Zero is not defined.")
+            x = 1 / x
+        y = self._parameters[0] + 0 * x
+        for parameter in self._parameters[1:]:
+            y = y * x + parameter
         return y
 
-    def area(self, start: Number, end: Number) -> float:
-        assertion.assert_types(start, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        assertion.assert_types(end, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        assertion.assert_is_not_none(self._integrale, StateError, msg="The integral is not defined. If this should "
-                                                                      "not be the case, use _integrate().")
-        return rnd(self._integrale.y_at_x(end) - self._integrale.y_at_x(start))
+    def area(self, start: Union[Number, Lists], end: Union[Number, Lists]) -> Union[float, np.ndarray]:
+        """
+        Computes the signed area between the polynomial and the x-axis from start to end. start and end can be
+        arrays, then the areas of all intervals [start[i]; end[i]] are computed in one pass.
+
+        Calcule l'aire signée entre le polynôme et l'axe des x de start à end. start et end peuvent être des
+        tableaux, alors les aires de tous les intervalles sont calculées en une passe.
+
+        :param start: The start of the interval, or an array of starts.
+        :param end: The end of the interval, or an array of ends (with the shape of start).
+        :return: A float for two numbers, else an ndarray.
+        """
+        assertion.assert_types(start, (*TypesTuple.NUMBER.value, *TypesTuple.LISTS.value, *TypesTuple.TUPLE.value),
+                               ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        assertion.assert_types(end, (*TypesTuple.NUMBER.value, *TypesTuple.LISTS.value, *TypesTuple.TUPLE.value),
+                               ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        self._assert_integrate_derive()
+        if np.shape(start) != np.shape(end) and np.ndim(start) > 0 and np.ndim(end) > 0:
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "start and end do not have the same shape.",
+                            (np.shape(start), np.shape(end)))
+        integral: Polynomial = self._integrate()
+        return round_output(integral.y_at_x(end) - integral.y_at_x(start))
 
     def get_roots(self, imaginary: bool = False) -> tuple:
         assertion.assert_type(imaginary, bool, ArgumentError, code=ArgumentCodes.NOT_BOOl)
         roots: list = list(np.roots(self._parameters))
         if not imaginary:
             roots: list = [r.real for r in roots if np.isreal(r)]
-            roots: list = [rnd(root) for root in roots]
+            roots: list = [round_output(float(root)) for root in roots]
             roots: list = sorted(roots)
         return tuple(roots)
 
     def get_local_maximum(self) -> list[tuple[float, float]]:
-        assertion.assert_is_not_none(self._derivative_1, StateError, msg="The first derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(1).")
-        assertion.assert_is_not_none(self._derivative_2, StateError, msg="The second derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(2).")
-        roots: tuple = self._derivative_1.get_roots()
+        self._assert_integrate_derive()
+        roots: tuple = self._derive().get_roots()
         local_maximum: list = list()
         for root in roots:
-            if self._derivative_2.y_at_x(root) < 0:
+            if self._derive(2).y_at_x(root) < 0:
                 local_maximum.append((root, self.y_at_x(root)))
         return local_maximum
 
     def get_local_minimum(self) -> list[tuple[float, float]]:
-        assertion.assert_is_not_none(self._derivative_1, StateError, msg="The first derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(1).")
-        assertion.assert_is_not_none(self._derivative_2, StateError, msg="The second derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(2).")
-        roots: tuple = self._derivative_1.get_roots()
+        self._assert_integrate_derive()
+        roots: tuple = self._derive().get_roots()
         local_minimum: list = list()
         for root in roots:
-            if self._derivative_2.y_at_x(root) > 0:
+            if self._derive(2).y_at_x(root) > 0:
                 local_minimum.append((root, self.y_at_x(root)))
         return local_minimum
 
     def get_infliction_point(self) -> list[tuple[float, float]]:
-        assertion.assert_is_not_none(self._derivative_2, StateError, msg="The second derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(2).")
-        assertion.assert_is_not_none(self._derivative_3, StateError, msg="The third derivative is not defined. If "
-                                                                         "this should not be the case, use _derive(3).")
-        roots: tuple = self._derivative_2.get_roots()
+        self._assert_integrate_derive()
+        roots: tuple = self._derive(2).get_roots()
         infliction_points = list()
         for root in roots:
-            if self._derivative_3.y_at_x(root) != 0:
+            if self._derive(3).y_at_x(root) != 0:
                 infliction_points.append((root, self.y_at_x(root)))
         return infliction_points
 
@@ -199,56 +250,88 @@ class Polynomial(Equation):
         assertion.assert_is_positiv(number, MathError, code=MathCodes.NOT_POSITIV)
         assertion.assert_not_zero(number, MathError, code=MathCodes.ZERO)
 
-        if number == 1:
-            return self._derivative_1.copy()
-        elif number == 2:
-            return self._derivative_2.copy()
-        elif number == 3:
-            return self._derivative_3.copy()
-        else:
-            return self._derive(number)
+        return self._derive(int(number)).copy()
+
+    def get_integral(self, number: Int = 1) -> Self:
+        """
+        Returns the antiderivative of the given order, with all integration constants set to 0.
+
+        Renvoie la primitive de l'ordre donné, avec toutes les constantes d'intégration à 0.
+
+        :param number: The order of the integral.
+        :return: The integral as a new polynomial.
+        :raises MathError: If number is not positive or if the degree is negative (the integral is not a polynomial).
+        """
+        assertion.assert_types(number, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_is_positiv(number, MathError, code=MathCodes.NOT_POSITIV)
+        assertion.assert_not_zero(number, MathError, code=MathCodes.ZERO)
+        return self._integrate(int(number)).copy()
 
     def copy(self) -> Self:
-        return Polynomial(self._degree, self.get_parameters())
+        return Polynomial._wrap(self._degree, self.get_parameters(), True)
 
-    def _integrate(self, amount: Int = 1) -> Self:
-        integrated_parameters: list = list()
-        integrated_degree: int = self._degree + 1
-        for index, parameter in enumerate(self._parameters):
-            if parameter == 0:
-                continue
-            integrated_parameters.append(rnd(parameter / (integrated_degree - index)))
-        if len(integrated_parameters) == 0:
-            return Polynomial(0, [0], False)
-        return Polynomial(integrated_degree, integrated_parameters, False)
+    def _assert_integrate_derive(self) -> None:
+        assertion.assert_true(self._integrate_derive, StateError, msg="The derivatives and the integral are not "
+                                                                      "defined. If this should not be the case, "
+                                                                      "create the polynomial with integrate_derive.")
+
+    def _integrate(self, amount: int = 1) -> Self:
+        """
+        Returns the integral of the given order. Integrals are computed on first access, each from the previous one,
+        and kept for the lifetime of the polynomial.
+
+        Renvoie l'intégrale de l'ordre donné. Les intégrales sont calculées au premier accès, chacune à partir de la
+        précédente, et gardées pendant la durée de vie du polynôme.
+        """
+        return self._chain(self._integrals, amount, Polynomial._integrate_once)
 
     def _derive(self, amount: int = 1) -> Self:
-        paras: list = self.get_parameters()
-        for a in range(1, amount + 1):
-            derived_parameters: list = list()
-            derived_degree: int = self._degree - a
-            if self._degree == 0 or derived_degree + 1 == 0:
-                return Polynomial(0, [0], False)
-            parameters: list = paras
-            if len(parameters) == self._degree + 1:
-                parameters: list = parameters[:-1]
-            for index, parameter in enumerate(parameters):
-                if parameter == 0:
-                    continue
-                derived_parameters.append(rnd(parameter * (derived_degree + 1 - index)))
-            paras: list = derived_parameters
-            while paras[-1] == 0:
-                paras = paras[:-1]
-        return Polynomial(self._degree - amount, paras, False)
+        """
+        Returns the derivative of the given order. Derivatives are computed on first access, each from the previous
+        one, and kept for the lifetime of the polynomial.
+
+        Renvoie la dérivée de l'ordre donné. Les dérivées sont calculées au premier accès, chacune à partir de la
+        précédente, et gardées pendant la durée de vie du polynôme.
+        """
+        return self._chain(self._derivatives, amount, Polynomial._derive_once)
+
+    def _chain(self, cache: dict, amount: int, step) -> Self:
+        if amount not in cache:
+            order: int = max((known for known in cache if known < amount), default=0)
+            polynomial: Polynomial = cache[order] if order else self
+            for order in range(order + 1, amount + 1):
+                polynomial = step(polynomial)
+                cache[order] = polynomial
+        return cache[amount]
+
+    def _integrate_once(self) -> Self:
+        assertion.assert_true(self._degree >= 0, MathError, code=MathCodes.NOT_DEFINED,
+                              msg="The integral of a polynomial with a negative degree is not a polynomial.")
+        integrated_degree: int = self._degree + 1
+        integrated_parameters: list = [round_step(parameter / (integrated_degree - index))
+                                       for index, parameter in enumerate(self._parameters)]
+        return Polynomial._wrap(integrated_degree, integrated_parameters + [0])
+
+    def _derive_once(self) -> Self:
+        if self._degree == 0:
+            return Polynomial._wrap(0, [0])
+        if self._degree < 0:
+            # a * x**-p -> -p * a * x**-(p + 1): every power moves one step down and the constant becomes 0
+            derived_parameters: list = [round_step(parameter * (self._degree + index))
+                                        for index, parameter in enumerate(self._parameters)]
+            return Polynomial._wrap(self._degree - 1, derived_parameters + [0])
+        derived_parameters: list = [round_step(parameter * (self._degree - index))
+                                    for index, parameter in enumerate(self._parameters[:-1])]
+        return Polynomial._wrap(self._degree - 1, derived_parameters)
 
     def __eq__(self, other: Self) -> bool:
         assertion.assert_type(other, Polynomial, ArgumentError, code=ArgumentCodes.NOT_POLYNOMIAL)
         return self._degree == other.get_degree() and self._parameters == other.get_parameters()
 
     def __str__(self):
-        return self._equation
+        return self.get_equation()
 
     def __repr__(self):
-        return f"Polynomial at {hex(id(self))} with: {self._equation}"
+        return f"Polynomial at {hex(id(self))} with: {self.get_equation()}"
 
 
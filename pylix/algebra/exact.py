@@ -0,0 +1,170 @@
+"""
+Exact linear algebra on integer and rational matrices with Bareiss' fraction-free elimination. Every intermediate
+value is an integer minor of the input, so the numbers only grow polynomially and no Fraction has to be reduced on
+the way. Rational inputs are scaled by the least common multiple of their denominators first.
+
+Algèbre linéaire exacte sur des matrices entières et rationnelles avec l'élimination sans fractions de Bareiss.
+Chaque valeur intermédiaire est un mineur entier de l'entrée, les nombres ne croissent donc que polynomialement.
+Les entrées rationnelles sont d'abord multipliées par le plus petit commun multiple de leurs dénominateurs.
+"""
+import math
+from fractions import Fraction
+from typing import Optional, Union
+
+import numpy as np
+
+from pylix.errors import MathError, MathCodes, assertion
+
+_to_fraction = np.frompyfunc(Fraction, 1, 1)
+
+
+def _rational(numerator: int, denominator: int) -> Union[int, Fraction]:
+    fraction: Fraction = Fraction(numerator, denominator)
+    return fraction.numerator if fraction.denominator == 1 else fraction
+
+_to_rational = np.frompyfunc(_rational, 2, 1)
+
+
+def to_rational(integers: np.ndarray, scale: int) -> np.ndarray:
+    """
+    Divides an object array of python ints by scale, the result holds ints where possible and Fractions elsewhere.
+
+    Divise un tableau d'entiers python par scale, le résultat contient des entiers si possible et des Fractions
+    sinon.
+    """
+    result: np.ndarray = np.empty(integers.shape, dtype=object)
+    result[...] = _to_rational(integers, scale)
+    return result
+
+
+def to_integers(data: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Scales a rational 2D array to an object array of python ints. data == integers / scale.
+
+    Transforme un tableau 2D rationnel en tableau d'entiers python. data == integers / scale.
+
+    Args:
+        data (np.ndarray): A 2D array of ints, bools, floats, or objects holding ints / Fractions.
+
+    Returns:
+        (integers, scale) (tuple[np.ndarray, int])
+
+    Raises:
+        MathError: If a component is not rational (e.g. complex, nan or inf).
+    """
+    if data.dtype.kind in "iub":
+        return data.astype(np.int64 if data.dtype.kind == "b" else data.dtype).astype(object), 1
+    try:
+        fractions: np.ndarray = _to_fraction(data)
+    except (TypeError, ValueError, OverflowError):
+        raise MathError(MathCodes.NOT_NUMBER, "Exact arithmetic needs rational components.", data)
+    scale: int = math.lcm(*(fraction.denominator for fraction in fractions.flat))
+    integers: np.ndarray = np.empty(data.shape, dtype=object)
+    integers.flat = [fraction.numerator * (scale // fraction.denominator) for fraction in fractions.flat]
+    return integers, scale
+
+def _eliminate(m: np.ndarray, row: int, column: int, previous: int, rows: Union[slice, np.ndarray]) -> None:
+    # one fraction-free step: m[i, j] = (m[row, column] * m[i, j] - m[i, column] * m[row, j]) / previous
+    m[rows] = (m[rows] * m[row, column] - np.outer(m[rows, column], m[row])) // previous
+
+def _pivot(m: np.ndarray, row: int, column: int) -> Optional[int]:
+    candidates: np.ndarray = np.flatnonzero(m[row:, column] != 0)
+    if len(candidates) == 0:
+        return None
+    pivot: int = row + int(candidates[0])
+    if pivot != row:
+        m[[row, pivot]] = m[[pivot, row]]
+    return pivot
+
+def determinant(data: np.ndarray) -> Union[int, Fraction]:
+    """
+    Computes the exact determinant of a quadratic rational matrix with Bareiss' algorithm.
+
+    Calcule le déterminant exact d'une matrice rationnelle carrée avec l'algorithme de Bareiss.
+
+    Args:
+        data (np.ndarray): A quadratic 2D array (see to_integers).
+
+    Returns:
+        The determinant (Union[int, Fraction])
+
+    Raises:
+        MathError: If data is not quadratic.
+        MathError: If a component is not rational.
+    """
+    assertion.assert_equals(data.shape[0], data.shape[1], MathError, code=MathCodes.UNFIT_DIMENSIONS)
+    m, scale = to_integers(data)
+    n: int = len(m)
+    sign: int = 1
+    previous: int = 1
+    for k in range(n - 1):
+        pivot: Optional[int] = _pivot(m, k, k)
+        if pivot is None:
+            return 0
+        if pivot != k:
+            sign = -sign
+        _eliminate(m, k, k, previous, slice(k + 1, None))
+        previous = m[k, k]
+    result: int = sign * m[n - 1, n - 1] if n > 0 else 1
+    return _rational(result, scale ** n)
+
+def rank(data: np.ndarray) -> int:
+    """
+    Computes the exact rank of a rational matrix with fraction-free row reduction.
+
+    Calcule le rang exact d'une matrice rationnelle par réduction sans fractions.
+
+    Args:
+        data (np.ndarray): A 2D array (see to_integers).
+
+    Returns:
+        The rank (int)
+
+    Raises:
+        MathError: If a component is not rational.
+    """
+    m, _ = to_integers(data)
+    row: int = 0
+    previous: int = 1
+    for column in range(m.shape[1]):
+        if row == m.shape[0]:
+            break
+        if _pivot(m, row, column) is None:
+            continue
+        _eliminate(m, row, column, previous, slice(row + 1, None))
+        previous = m[row, column]
+        row += 1
+    return row
+
+def inverse(data: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Computes the exact inverse of a quadratic rational matrix with fraction-free Gauss-Jordan elimination on
+    [A | I]. At the end the left block is d * I with d = ±det(A), so the inverse is the right block divided by d.
+
+    Calcule l'inverse exacte d'une matrice rationnelle carrée par élimination de Gauss-Jordan sans fractions sur
+    [A | I]. À la fin le bloc de gauche vaut d * I avec d = ±det(A), l'inverse est donc le bloc de droite divisé
+    par d.
+
+    Args:
+        data (np.ndarray): A quadratic 2D array (see to_integers).
+
+    Returns:
+        The inverse (Optional[np.ndarray]): An object array of ints and Fractions, None if data is singular.
+
+    Raises:
+        MathError: If data is not quadratic.
+        MathError: If a component is not rational.
+    """
+    assertion.assert_equals(data.shape[0], data.shape[1], MathError, code=MathCodes.UNFIT_DIMENSIONS)
+    integers, scale = to_integers(data)
+    n: int = len(integers)
+    m: np.ndarray = np.concatenate((integers, np.eye(n, dtype=int).astype(object)), axis=1)
+    previous: int = 1
+    for k in range(n):
+        if _pivot(m, k, k) is None:
+            return None
+        others: np.ndarray = np.arange(n) != k
+        _eliminate(m, k, k, previous, others)
+        previous = m[k, k]
+    # inv(A) = scale * inv(scale * A)
+    return to_rational(m[:, n:] * scale, previous)
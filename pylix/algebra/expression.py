@@ -0,0 +1,277 @@
+"""
+Lazy matrix expressions. Matrix.lazy() starts an expression; +, -, * and / on it only build a graph, evaluate()
+computes the whole graph at once:
+
+- Every expression is kept as a linear combination c_1 * T_1 + c_2 * T_2 + ... of matrices and products. Scalars are
+  folded into the coefficients, so they touch each array at most once; equal terms are merged (A + A -> 2 * A).
+- The linear combination is accumulated in place in one result buffer, with a single scratch buffer shared by all
+  terms which need one.
+- Chains of products are multiplied in the cheapest order (matrix chain order).
+- The result is validated and rounded once, no intermediate Matrix is created.
+
+Expressions matricielles paresseuses. Matrix.lazy() commence une expression ; +, -, * et / ne construisent qu'un
+graphe, evaluate() calcule tout le graphe en une fois : les scalaires sont regroupés dans les coefficients, la
+combinaison linéaire est accumulée sur place dans un seul tampon, les chaînes de produits sont multipliées dans
+l'ordre le moins coûteux et le résultat est arrondi une seule fois.
+"""
+from typing import Self, Union, Optional
+
+import numpy as np
+
+from pylix.algebra.matrix import Matrix, BLAS_KINDS, multiply, round_product
+from pylix.algebra.vector import Vector
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion, TypesTuple
+from pylix.types import Scalar
+
+
+class _Leaf:
+    def __init__(self, matrix: Matrix):
+        self.matrix: Matrix = matrix
+        self.shape: tuple = matrix._data.shape
+
+    def leaves(self) -> list[Matrix]:
+        return [self.matrix]
+
+    def compute(self) -> np.ndarray:
+        return self.matrix._data
+
+    def __repr__(self) -> str:
+        return f"{type(self.matrix).__name__}({self.shape[0]}x{self.shape[1]})"
+
+
+class _Product:
+    def __init__(self, factors: tuple):
+        self.factors: tuple = factors
+        self.shape: tuple = (factors[0].shape[0], factors[-1].shape[1])
+
+    def leaves(self) -> list[Matrix]:
+        return [leaf for factor in self.factors for leaf in factor.leaves()]
+
+    def compute(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        arrays: list = [factor.compute() for factor in self.factors]
+        return _chain(arrays, _chain_order(arrays), 0, len(arrays) - 1, out)
+
+    def __repr__(self) -> str:
+        return " * ".join(f"({factor})" if isinstance(factor, Expression) else f"{factor}"
+                          for factor in self.factors)
+
+
+def _chain_order(arrays: list) -> list:
+    # classic matrix chain DP: split[i][j] is where the product of arrays i..j is split
+    n: int = len(arrays)
+    dims: list = [arrays[0].shape[0]] + [array.shape[1] for array in arrays]
+    cost: list = [[0] * n for _ in range(n)]
+    split: list = [[0] * n for _ in range(n)]
+    for length in range(1, n):
+        for i in range(n - length):
+            j: int = i + length
+            cost[i][j], split[i][j] = min((cost[i][k] + cost[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1], k)
+                                          for k in range(i, j))
+    return split
+
+def _chain(arrays: list, split: list, i: int, j: int, out: Optional[np.ndarray]) -> np.ndarray:
+    if i == j:
+        return arrays[i]
+    a: np.ndarray = _chain(arrays, split, i, split[i][j], None)
+    b: np.ndarray = _chain(arrays, split, split[i][j] + 1, j, None)
+    if out is not None and a.dtype.kind in BLAS_KINDS and b.dtype.kind in BLAS_KINDS:
+        return np.matmul(a, b, out=out)
+    return multiply(a, b)
+
+
+class Expression:
+    """
+    A lazily evaluated matrix expression, created by Matrix.lazy(). Supports + and - with expressions and matrices,
+    * with numbers, matrices and expressions (matrix product) and / with numbers. Nothing is computed until
+    evaluate() is called. The expression has to be the left operand: in A.lazy() * B + C.lazy() * 2 every part is
+    lazy, while C * 2 would be computed eagerly.
+
+    Une expression matricielle évaluée paresseusement, créée par Matrix.lazy(). Rien n'est calculé avant l'appel
+    de evaluate().
+
+    Attributes:
+        _terms (tuple): The linear combination as (coefficient, term) pairs, a term is a leaf or a product.
+        shape (tuple): The dimension (rows, columns) of the result.
+    """
+    def __init__(self, matrix: Matrix):
+        """
+        Creates an expression which only holds matrix. The matrix is not copied, changes to it before evaluate()
+        are visible in the result.
+
+        Crée une expression qui ne contient que matrix. La matrice n'est pas copiée.
+
+        Raises:
+            ArgumentError: If matrix is not a Matrix.
+        """
+        assertion.assert_type(matrix, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+        leaf: _Leaf = _Leaf(matrix)
+        self._terms: tuple = ((1, leaf),)
+        self.shape: tuple = leaf.shape
+
+    @classmethod
+    def _wrap(cls, terms: tuple, shape: tuple) -> Self:
+        expression: Expression = cls.__new__(cls)
+        expression._terms = terms
+        expression.shape = shape
+        return expression
+
+    def get_dimension(self) -> tuple:
+        return self.shape
+
+    def leaves(self) -> list[Matrix]:
+        return [leaf for _, term in self._terms for leaf in term.leaves()]
+
+    def compute(self) -> np.ndarray:
+        return self._evaluate(None)
+
+    def evaluate(self, out: Optional[Matrix] = None) -> Matrix:
+        """
+        Computes the expression.
+
+        Calcule l'expression.
+
+        Args:
+            out (Optional[Matrix]): A matrix with the dimension of the result to write into. It may be one of the
+                matrices of the expression.
+
+        Returns:
+            The result (Matrix): out if given, else a new Matrix (a Vector if the expression only holds vectors).
+
+        Raises:
+            ArgumentError: If out is not a writeable matrix which can hold the dtype of the result.
+            MathError: If the dimension of out does not fit.
+        """
+        if out is not None:
+            assertion.assert_type(out, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+            Matrix._check_out(out, out, self.shape, self._dtype())
+            self._evaluate(out._data)
+            return out
+        result: np.ndarray = self._evaluate(None)
+        if all(isinstance(leaf, Vector) for leaf in self.leaves()):
+            return Vector.from_numpy(result)
+        return Matrix.from_numpy(result)
+
+    def _coefficients(self) -> list[Scalar]:
+        coefficients: list = [coefficient for coefficient, _ in self._terms]
+        for _, term in self._terms:
+            if isinstance(term, _Product):
+                coefficients += [coefficient for factor in term.factors if isinstance(factor, Expression)
+                                 for coefficient in factor._coefficients()]
+        return coefficients
+
+    def _dtype(self) -> np.dtype:
+        return np.result_type(*(leaf._data for leaf in self.leaves()), *self._coefficients())
+
+    def _evaluate(self, out: Optional[np.ndarray]) -> np.ndarray:
+        target: Optional[np.ndarray] = out
+        if out is not None and any(np.shares_memory(out, leaf._data) for leaf in self.leaves()):
+            out = None
+        result: np.ndarray = np.zeros(self.shape, dtype=self._dtype()) if out is None else out
+        scratch: Optional[np.ndarray] = None
+        has_product: bool = False
+        first: bool = True
+        for coefficient, term in self._terms:
+            if isinstance(term, _Product):
+                has_product = True
+                if first:
+                    value: np.ndarray = term.compute(result)
+                    if value is not result:
+                        np.copyto(result, value)
+                    if coefficient != 1:
+                        np.multiply(result, coefficient, out=result)
+                    first = False
+                    continue
+                if scratch is None:
+                    scratch = np.empty(self.shape, dtype=result.dtype)
+                value: np.ndarray = term.compute(scratch)
+            else:
+                value: np.ndarray = term.compute()
+            if first:
+                np.multiply(value, coefficient, out=result)
+                first = False
+            elif coefficient == 1:
+                np.add(result, value, out=result)
+            elif coefficient == -1:
+                np.subtract(result, value, out=result)
+            else:
+                if scratch is None:
+                    scratch = np.empty(self.shape, dtype=result.dtype)
+                np.multiply(value, coefficient, out=scratch)
+                np.add(result, scratch, out=result)
+        if has_product:
+            round_product(result, out=result)
+        if target is not None and result is not target:
+            np.copyto(target, result)
+            return target
+        return result
+
+    @staticmethod
+    def _operand(other: Union[Self, Matrix], msg: str) -> Self:
+        assertion.assert_types(other, (Expression, Matrix), MathError, code=MathCodes.NOT_MATRIX, msg=msg)
+        return other if isinstance(other, Expression) else Expression(other)
+
+    def _combine(self, other: Self, sign: int) -> Self:
+        if other.shape != self.shape:
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
+        terms: list = list(self._terms)
+        for coefficient, term in other._terms:
+            for index, (own, existing) in enumerate(terms):
+                if _same(existing, term):
+                    terms[index] = (own + sign * coefficient, existing)
+                    break
+            else:
+                terms.append((sign * coefficient, term))
+        terms = [(coefficient, term) for coefficient, term in terms if coefficient != 0] or [(0, terms[0][1])]
+        return Expression._wrap(tuple(terms), self.shape)
+
+    def _scale(self, factor: Scalar) -> Self:
+        return Expression._wrap(tuple((coefficient * factor, term) for coefficient, term in self._terms), self.shape)
+
+    def _factors(self) -> tuple:
+        if len(self._terms) > 1:
+            return (self,)
+        term = self._terms[0][1]
+        return term.factors if isinstance(term, _Product) else (term,)
+
+    def __add__(self, other: Union[Self, Matrix]) -> Self:
+        return self._combine(self._operand(other, "Only a matrix can be added to a matrix."), 1)
+
+    def __sub__(self, other: Union[Self, Matrix]) -> Self:
+        return self._combine(self._operand(other, "Only a matrix can be subtracted to a matrix."), -1)
+
+    def __neg__(self) -> Self:
+        return self._scale(-1)
+
+    def __mul__(self, other: Union[Self, Matrix, *TypesTuple.SCALAR.value]) -> Self:
+        if isinstance(other, TypesTuple.SCALAR.value):
+            return self._scale(other)
+        other = self._operand(other, "Only matrices, int, float can be multiplied to a matrix.")
+        assertion.assert_equals(self.shape[1], other.shape[0], MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="Columns of self do not equal rows of other.")
+        coefficient: Scalar = ((self._terms[0][0] if len(self._terms) == 1 else 1)
+                               * (other._terms[0][0] if len(other._terms) == 1 else 1))
+        product: _Product = _Product(self._factors() + other._factors())
+        return Expression._wrap(((coefficient, product),), product.shape)
+
+    def __rmul__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError, code=MathCodes.NOT_NUMBER,
+                               msg="Only int, float, complex can be multiplied to an expression from the left.")
+        return self._scale(other)
+
+    def __truediv__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError, code=MathCodes.NOT_NUMBER)
+        assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
+        return self._scale(1 / other)
+
+    def __str__(self) -> str:
+        return " + ".join(f"{coefficient} * {term}" if coefficient != 1 else f"{term}"
+                          for coefficient, term in self._terms)
+
+    def __repr__(self) -> str:
+        return f"Expression at {hex(id(self))} ({self.shape[0]}x{self.shape[1]}): {self}"
+
+
+def _same(a, b) -> bool:
+    if isinstance(a, _Leaf) and isinstance(b, _Leaf):
+        return a.matrix is b.matrix
+    return a is b
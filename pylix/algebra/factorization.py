@@ -0,0 +1,282 @@
+"""
+Reusable factorizations of a matrix. A factorization is computed once in O(n^3); afterwards every right-hand side is
+solved in O(n^2) with two triangular substitutions. Several right-hand sides can be solved in one call by passing a
+Matrix whose columns are the right-hand sides.
+
+Factorisations réutilisables d'une matrice. Une factorisation est calculée une seule fois en O(n^3) ; ensuite chaque
+second membre est résolu en O(n^2) par deux substitutions triangulaires. Plusieurs seconds membres peuvent être
+résolus en un seul appel en passant une Matrix dont les colonnes sont les seconds membres.
+"""
+from abc import ABC, abstractmethod
+from typing import Union
+
+import numpy as np
+
+from pylix.algebra.matrix import Matrix
+from pylix.algebra.vector import Vector
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion
+
+
+def _inexact(data: np.ndarray) -> np.ndarray:
+    return data.astype(complex if data.dtype.kind == "c" else float)
+
+def forward_substitution(lower: np.ndarray, b: np.ndarray, unit_diagonal: bool = False) -> np.ndarray:
+    """
+    Solves lower * x = b for a lower triangular matrix. b may hold several right-hand sides as columns.
+
+    Résout lower * x = b pour une matrice triangulaire inférieure. b peut contenir plusieurs seconds membres.
+    """
+    x: np.ndarray = np.array(b, dtype=np.result_type(lower, b))
+    for i in range(len(x)):
+        x[i] -= lower[i, :i] @ x[:i]
+        if not unit_diagonal:
+            x[i] /= lower[i, i]
+    return x
+
+def backward_substitution(upper: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Solves upper * x = b for an upper triangular matrix. b may hold several right-hand sides as columns.
+
+    Résout upper * x = b pour une matrice triangulaire supérieure. b peut contenir plusieurs seconds membres.
+    """
+    x: np.ndarray = np.array(b, dtype=np.result_type(upper, b))
+    for i in range(len(x) - 1, -1, -1):
+        x[i] -= upper[i, i + 1:] @ x[i + 1:]
+        x[i] /= upper[i, i]
+    return x
+
+
+class Factorization(ABC):
+    """
+    The common interface of LU, QR and Cholesky.
+
+    L'interface commune de LU, QR et Cholesky.
+
+    Attributes:
+        _rows (int): The number of rows of the factorized matrix.
+        _columns (int): The number of columns of the factorized matrix.
+    """
+    def __init__(self, matrix: Matrix):
+        assertion.assert_type(matrix, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+        self._rows: int = matrix.get_rows()
+        self._columns: int = matrix.get_columns()
+
+    def get_dimension(self) -> tuple:
+        return self._rows, self._columns
+
+    def solve(self, b: Union[Vector, Matrix]) -> Union[Vector, Matrix]:
+        """
+        Solves A * x = b. If b is a Matrix, every column is a right-hand side and all of them are solved at once.
+
+        Résout A * x = b. Si b est une Matrix, chaque colonne est un second membre et tous sont résolus à la fois.
+
+        Args:
+            b (Union[Vector, Matrix]): The right-hand side(s) with as many rows as A.
+
+        Returns:
+            x (Union[Vector, Matrix]): A Vector for a Vector, else a Matrix with one solution per column.
+
+        Raises:
+            MathError: If b is not a Vector or Matrix.
+            MathError: If the rows of b do not equal the rows of A.
+            MathError: If A is singular.
+        """
+        assertion.assert_type(b, Matrix, MathError, code=MathCodes.NOT_MATRIX)
+        assertion.assert_equals(b.get_rows(), self._rows, MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="The rows of b do not equal the rows of the factorized matrix.")
+        x: np.ndarray = self._solve(b._data)
+        return Vector.from_numpy(x) if isinstance(b, Vector) else Matrix.from_numpy(x)
+
+    @abstractmethod
+    def _solve(self, b: np.ndarray) -> np.ndarray:
+        """
+        Solves A * x = b for a 2D array b (one right-hand side per column).
+
+        Résout A * x = b pour un tableau 2D b (un second membre par colonne).
+        """
+
+    @abstractmethod
+    def det(self) -> float:
+        """
+        Returns the determinant of the factorized matrix in O(n).
+
+        Renvoie le déterminant de la matrice factorisée en O(n).
+        """
+
+    @abstractmethod
+    def logdet(self) -> float:
+        """
+        Returns the natural logarithm of the absolute value of the determinant. Unlike log(abs(det())) it does not
+        over- or underflow for large matrices; -inf for a singular matrix.
+
+        Renvoie le logarithme naturel de la valeur absolue du déterminant. Contrairement à log(abs(det())), il ne
+        déborde pas pour de grandes matrices ; -inf pour une matrice singulière.
+        """
+
+    def _assert_quadratic(self) -> None:
+        assertion.assert_equals(self._rows, self._columns, MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="The determinant is only defined for quadratic matrices.")
+
+
+class LU(Factorization):
+    """
+    P * A = L * U with partial pivoting. L (unit diagonal) and U are stored together in one array.
+
+    P * A = L * U avec pivot partiel. L (diagonale unité) et U sont stockées ensemble dans un seul tableau.
+
+    Attributes:
+        _lu (np.ndarray): L below and U on and above the diagonal.
+        _permutation (np.ndarray): Row i of P * A is row _permutation[i] of A.
+        _sign (int): The determinant of P.
+    """
+    def __init__(self, matrix: Matrix):
+        """
+        Factorizes a quadratic matrix. A singular matrix can be factorized, but not solved.
+
+        Factorise une matrice carrée. Une matrice singulière peut être factorisée, mais pas résolue.
+
+        Raises:
+            ArgumentError: If matrix is not a Matrix.
+            MathError: If matrix is not quadratic.
+        """
+        super().__init__(matrix)
+        self._assert_quadratic()
+        lu: np.ndarray = _inexact(matrix._data)
+        n: int = self._rows
+        permutation: np.ndarray = np.arange(n)
+        sign: int = 1
+        for k in range(n):
+            pivot: int = k + int(np.argmax(np.abs(lu[k:, k])))
+            if pivot != k:
+                lu[[k, pivot]] = lu[[pivot, k]]
+                permutation[[k, pivot]] = permutation[[pivot, k]]
+                sign = -sign
+            if lu[k, k] == 0:
+                continue
+            lu[k + 1:, k] /= lu[k, k]
+            lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+        self._lu: np.ndarray = lu
+        self._permutation: np.ndarray = permutation
+        self._sign: int = sign
+
+    def get_l(self) -> Matrix:
+        return Matrix.from_numpy(np.tril(self._lu, -1) + np.eye(self._rows))
+
+    def get_u(self) -> Matrix:
+        return Matrix.from_numpy(np.triu(self._lu))
+
+    def get_permutation(self) -> np.ndarray:
+        return self._permutation.copy()
+
+    def _solve(self, b: np.ndarray) -> np.ndarray:
+        if np.any(np.diagonal(self._lu) == 0):
+            raise MathError(MathCodes.NOT_DEFINED, "The matrix is singular.")
+        y: np.ndarray = forward_substitution(self._lu, b[self._permutation], unit_diagonal=True)
+        return backward_substitution(self._lu, y)
+
+    def det(self) -> float:
+        return (self._sign * np.prod(np.diagonal(self._lu))).item()
+
+    def logdet(self) -> float:
+        with np.errstate(divide="ignore"):
+            return float(np.sum(np.log(np.abs(np.diagonal(self._lu)))))
+
+
+class QR(Factorization):
+    """
+    A = Q * R with Householder reflections (LAPACK). Works for matrices with at least as many rows as columns; for
+    more rows, solve returns the least-squares solution.
+
+    A = Q * R avec des réflexions de Householder (LAPACK). Fonctionne pour des matrices avec au moins autant de
+    lignes que de colonnes ; avec plus de lignes, solve renvoie la solution des moindres carrés.
+
+    Attributes:
+        _q (np.ndarray): Q with orthonormal columns, shape (rows, columns).
+        _r (np.ndarray): The upper triangular R, shape (columns, columns).
+        _sign (Union[float, complex]): The determinant of Q (±1, a unit complex number for complex matrices) for
+            quadratic matrices, else None.
+    """
+    def __init__(self, matrix: Matrix):
+        """
+        Factorizes a matrix with rows >= columns.
+
+        Factorise une matrice avec lignes >= colonnes.
+
+        Raises:
+            ArgumentError: If matrix is not a Matrix.
+            MathError: If matrix has more columns than rows.
+        """
+        super().__init__(matrix)
+        assertion.assert_below(self._columns, self._rows + 1, MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                               msg="QR needs at least as many rows as columns.")
+        self._q, self._r = np.linalg.qr(_inexact(matrix._data))
+        # numpy does not hand out the Householder reflections, so det(Q) is computed once here instead of in det()
+        self._sign = np.linalg.slogdet(self._q)[0] if self._rows == self._columns else None
+
+    def get_q(self) -> Matrix:
+        return Matrix.from_numpy(self._q.copy())
+
+    def get_r(self) -> Matrix:
+        return Matrix.from_numpy(self._r.copy())
+
+    def _solve(self, b: np.ndarray) -> np.ndarray:
+        if np.any(np.diagonal(self._r) == 0):
+            raise MathError(MathCodes.NOT_DEFINED, "The matrix does not have full column rank.")
+        return backward_substitution(self._r, self._q.conj().T @ b)
+
+    def det(self) -> float:
+        self._assert_quadratic()
+        return (self._sign * np.prod(np.diagonal(self._r))).item()
+
+    def logdet(self) -> float:
+        self._assert_quadratic()
+        with np.errstate(divide="ignore"):
+            return float(np.sum(np.log(np.abs(np.diagonal(self._r)))))
+
+
+class Cholesky(Factorization):
+    """
+    A = L * L^H for a hermitian (symmetric) positive definite matrix. About twice as fast as LU and numerically
+    stable without pivoting.
+
+    A = L * L^H pour une matrice hermitienne (symétrique) définie positive. Environ deux fois plus rapide que LU et
+    numériquement stable sans pivot.
+
+    Attributes:
+        _l (np.ndarray): The lower triangular L.
+    """
+    def __init__(self, matrix: Matrix):
+        """
+        Factorizes a hermitian positive definite matrix.
+
+        Factorise une matrice hermitienne définie positive.
+
+        Raises:
+            ArgumentError: If matrix is not a Matrix.
+            MathError: If matrix is not quadratic.
+            MathError: If matrix is not hermitian positive definite.
+        """
+        super().__init__(matrix)
+        self._assert_quadratic()
+        data: np.ndarray = _inexact(matrix._data)
+        if not np.allclose(data, data.conj().T):
+            raise MathError(MathCodes.NOT_DEFINED, "The matrix is not symmetric.", matrix)
+        try:
+            self._l: np.ndarray = np.linalg.cholesky(data)
+        except np.linalg.LinAlgError:
+            raise MathError(MathCodes.NOT_DEFINED, "The matrix is not positive definite.", matrix)
+
+    def get_l(self) -> Matrix:
+        return Matrix.from_numpy(self._l.copy())
+
+    def _solve(self, b: np.ndarray) -> np.ndarray:
+        return backward_substitution(self._l.conj().T, forward_substitution(self._l, b))
+
+    def det(self) -> float:
+        return float(np.prod(np.diagonal(self._l)).real ** 2)
+
+    def logdet(self) -> float:
+        return 2 * float(np.sum(np.log(np.diagonal(self._l).real)))
+
+
+FACTORIZATIONS: dict = {"lu": LU, "qr": QR, "cholesky": Cholesky}
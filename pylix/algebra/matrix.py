@@ -1,57 +1,96 @@
 import math
-from typing import override, Optional, Self, Union, List, Iterable
+import numbers
+import os
+from typing import override, Optional, Self, Union, List, Iterable, TYPE_CHECKING
 from enum import Enum
 
 import numpy as np
 
 from pylix.errors import deprecated
-from pylix.algebra.statics import rnd
-from pylix.errors import ArgumentError, MathError, ArgumentCodes, assertion, MathCodes, TypesTuple
-from pylix.types import Number, Int, Lists, AllLists
-
-def add_matrix(A, B):
-    return [[A[i][j] + B[i][j] for j in range(len(A))] for i in range(len(A))]
-
-def sub_matrix(A, B):
-    return [[A[i][j] - B[i][j] for j in range(len(A))] for i in range(len(A))]
-
-def strassen_multiply(A, B):
-    n = len(A)
-    if n == 1:
-        return [[A[0][0] * B[0][0]]]
-
-    mid = n // 2
-    A11 = [[A[i][j] for j in range(mid)] for i in range(mid)]
-    A12 = [[A[i][j] for j in range(mid, n)] for i in range(mid)]
-    A21 = [[A[i][j] for j in range(mid)] for i in range(mid, n)]
-    A22 = [[A[i][j] for j in range(mid, n)] for i in range(mid, n)]
-
-    B11 = [[B[i][j] for j in range(mid)] for i in range(mid)]
-    B12 = [[B[i][j] for j in range(mid, n)] for i in range(mid)]
-    B21 = [[B[i][j] for j in range(mid)] for i in range(mid, n)]
-    B22 = [[B[i][j] for j in range(mid, n)] for i in range(mid, n)]
-
-    M1 = strassen_multiply(add_matrix(A11, A22), add_matrix(B11, B22))
-    M2 = strassen_multiply(add_matrix(A21, A22), B11)
-    M3 = strassen_multiply(A11, sub_matrix(B12, B22))
-    M4 = strassen_multiply(A22, sub_matrix(B21, B11))
-    M5 = strassen_multiply(add_matrix(A11, A12), B22)
-    M6 = strassen_multiply(sub_matrix(A21, A11), add_matrix(B11, B12))
-    M7 = strassen_multiply(sub_matrix(A12, A22), add_matrix(B21, B22))
-
-    C11 = add_matrix(sub_matrix(add_matrix(M1, M4), M5), M7)
-    C12 = add_matrix(M3, M5)
-    C21 = add_matrix(M2, M4)
-    C22 = add_matrix(sub_matrix(add_matrix(M1, M3), M2), M6)
-
-    C = [[0] * n for _ in range(n)]
-    for i in range(mid):
-        for j in range(mid):
-            C[i][j] = C11[i][j]
-            C[i][j + mid] = C12[i][j]
-            C[i + mid][j] = C21[i][j]
-            C[i + mid][j + mid] = C22[i][j]
+from pylix.algebra import exact as exact_algebra
+from pylix.algebra.statics import round_output
+from pylix.errors import ArgumentError, MathError, StateError, ArgumentCodes, assertion, MathCodes, TypesTuple
+from pylix.types import Number, Int, Scalar, DType, Lists, AllLists
 
+if TYPE_CHECKING:
+    from pylix.algebra.vector import Vector
+    from pylix.algebra.factorization import Factorization
+    from pylix.algebra.expression import Expression
+
+STRASSEN_LEAF_SIZE: int = 64
+
+def strassen_multiply(A: Union[Lists, np.ndarray], B: Union[Lists, np.ndarray],
+                      leaf_size: Int = STRASSEN_LEAF_SIZE) -> np.ndarray:
+    """
+    Multiplies two 2D arrays with the Strassen-Winograd algorithm (7 multiplications and 15 additions per level).
+    The quadrants are views of the operands, odd dimensions are padded with a zero row / column and below
+    `leaf_size` the dense kernel (np.matmul) takes over. It is meant for exact dtypes (object arrays of Fractions or
+    big ints) where BLAS is not available and every saved multiplication counts.
+
+    Multiplie deux tableaux 2D avec l'algorithme de Strassen-Winograd. Les quadrants sont des vues des opérandes, les
+    dimensions impaires sont complétées par des zéros et en dessous de `leaf_size` le noyau dense prend le relais.
+
+    Args:
+        A (Union[Lists, np.ndarray]): The left 2D array (m x k).
+        B (Union[Lists, np.ndarray]): The right 2D array (k x n).
+        leaf_size (Int): Below this size the dense kernel is used. default = STRASSEN_LEAF_SIZE
+
+    Returns:
+        The product (np.ndarray): A @ B with the shape m x n.
+
+    Raises:
+        ArgumentError: If leaf_size is not an int or smaller 1.
+        MathError: If the columns of A do not equal the rows of B.
+    """
+    assertion.assert_types(leaf_size, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+    assertion.assert_above(leaf_size, 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+    A = _count_bools(np.asarray(A))
+    B = _count_bools(np.asarray(B))
+    assertion.assert_equals(A.shape[1], B.shape[0], MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                            msg="Columns of A do not equal rows of B.")
+    return _strassen_winograd(A, B, int(leaf_size))
+
+def _strassen_winograd(A: np.ndarray, B: np.ndarray, leaf_size: int) -> np.ndarray:
+    m, k = A.shape
+    n: int = B.shape[1]
+    if min(m, k, n) <= leaf_size:
+        return A @ B
+    if m % 2 or k % 2 or n % 2:
+        A_padded: np.ndarray = np.zeros((m + m % 2, k + k % 2), dtype=A.dtype)
+        B_padded: np.ndarray = np.zeros((k + k % 2, n + n % 2), dtype=B.dtype)
+        A_padded[:m, :k] = A
+        B_padded[:k, :n] = B
+        return _strassen_winograd(A_padded, B_padded, leaf_size)[:m, :n]
+
+    hm, hk, hn = m // 2, k // 2, n // 2
+    A11, A12, A21, A22 = A[:hm, :hk], A[:hm, hk:], A[hm:, :hk], A[hm:, hk:]
+    B11, B12, B21, B22 = B[:hk, :hn], B[:hk, hn:], B[hk:, :hn], B[hk:, hn:]
+
+    S1 = A21 + A22
+    S2 = S1 - A11
+    S3 = A11 - A21
+    S4 = A12 - S2
+    T1 = B12 - B11
+    T2 = B22 - T1
+    T3 = B22 - B12
+    T4 = T2 - B21
+
+    M1 = _strassen_winograd(A11, B11, leaf_size)
+    M2 = _strassen_winograd(A12, B21, leaf_size)
+    M3 = _strassen_winograd(S4, B22, leaf_size)
+    M4 = _strassen_winograd(A22, T4, leaf_size)
+    M5 = _strassen_winograd(S1, T1, leaf_size)
+    M6 = _strassen_winograd(S2, T2, leaf_size)
+    M7 = _strassen_winograd(S3, T3, leaf_size)
+
+    C: np.ndarray = np.empty((m, n), dtype=np.result_type(M1, M2, M3, M4, M5, M6, M7))
+    np.add(M1, M2, out=C[:hm, :hn])
+    U2 = M1 + M6
+    U3 = U2 + M7
+    np.add(U2, M5, out=C[:hm, hn:])
+    C[:hm, hn:] += M3
+    np.subtract(U3, M4, out=C[hm:, :hn])
+    np.add(U3, M5, out=C[hm:, hn:])
     return C
 
 def matrix_multiply_opt(A, B):
@@ -66,11 +105,283 @@ def matrix_multiply_opt(A, B):
 
     return C
 
+def _count_bools(A: np.ndarray) -> np.ndarray:
+    # bool products are summed like python bools (True + True == 2), numpy would use a logical or and can not subtract
+    return A.astype(np.int_) if A.dtype.kind == "b" else A
+
+BLAS_KINDS: str = "iufc"
+NUMERIC_KINDS: str = "biufcO"
+
+def to_dtype(dtype: Optional[DType]) -> Optional[np.dtype]:
+    """
+    Validates a dtype argument (e.g. float, np.float32, "int32", complex).
+
+    Valide un argument dtype (p. ex. float, np.float32, "int32", complex).
+
+    Args:
+        dtype (Optional[DType]): Anything np.dtype accepts, or None.
+
+    Returns:
+        The dtype (Optional[np.dtype]): None if dtype is None.
+
+    Raises:
+        ArgumentError: If dtype is not a numeric dtype (bool, int, float, complex or object).
+    """
+    if dtype is None:
+        return None
+    try:
+        result: np.dtype = np.dtype(dtype)
+    except TypeError:
+        raise ArgumentError(ArgumentCodes.NOT_NUMERIC_DTYPE, wrong_argument=dtype)
+    assertion.assert_true(result.kind in NUMERIC_KINDS, ArgumentError, code=ArgumentCodes.NOT_NUMERIC_DTYPE,
+                          wrong_argument=dtype)
+    return result
+
+def cast(data: np.ndarray, dtype: Optional[np.dtype]) -> np.ndarray:
+    """
+    Converts data to dtype if it is safe or of the same kind (e.g. int64 -> int32, float64 -> float32,
+    complex128 -> complex64, int -> float -> complex). Casts which lose the kind, like float -> int or complex ->
+    float, are refused. Returns data itself if it already has the dtype.
+
+    Convertit data en dtype si la conversion est sûre ou du même genre. Les conversions qui changent de genre,
+    comme float -> int ou complex -> float, sont refusées.
+
+    Raises:
+        ArgumentError: If data can not be cast to dtype.
+    """
+    if dtype is None or data.dtype == dtype:
+        return data
+    if not np.can_cast(data.dtype, dtype, "same_kind"):
+        raise ArgumentError(ArgumentCodes.NOT_NUMERIC_DTYPE, f"Values of dtype {data.dtype} can not be stored as "
+                                                             f"{dtype}.")
+    return data.astype(dtype)
+
+def _inexact_dtype(dtype: DType) -> np.dtype:
+    result: np.dtype = to_dtype(dtype)
+    assertion.assert_true(result.kind in "fc", ArgumentError, code=ArgumentCodes.NOT_NUMERIC_DTYPE,
+                          wrong_argument=dtype)
+    return result
+
+def to_scalar(value: any) -> Union[float, complex, any]:
+    """
+    Converts a numpy scalar into a python float (complex for complex values). Exact values (ints and Fractions in
+    object arrays) are converted to float as well.
+
+    Convertit un scalaire numpy en float python (complex pour les valeurs complexes).
+    """
+    return complex(value) if np.iscomplexobj(value) else float(value)
+
+def multiply(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Multiplies two 2D arrays and picks the fastest kernel for their dtypes. Integer, float and complex arrays are
+    handed to numpy's BLAS-backed matmul, bool arrays are counted as ints first. Every other dtype (e.g. object
+    arrays holding big ints) falls back to the Strassen-Winograd kernel (strassen_multiply), which works on any shape.
+
+    Multiplie deux tableaux 2D et choisit le noyau le plus rapide pour leurs dtypes. Les tableaux d'entiers, de
+    flottants et de complexes passent par le produit matriciel BLAS de numpy, les booléens sont d'abord comptés comme
+    des entiers. Tous les autres dtypes utilisent le noyau de Strassen-Winograd.
+
+    Args:
+        A (np.ndarray): The left 2D array.
+        B (np.ndarray): The right 2D array.
+
+    Returns:
+        The product (np.ndarray): A @ B
+    """
+    A, B = _count_bools(A), _count_bools(B)
+    if A.dtype.kind in BLAS_KINDS and B.dtype.kind in BLAS_KINDS:
+        return A @ B
+    return strassen_multiply(A, B)
+
+def round_product(C: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Rounds the result of a multiplication in one vectorized pass according to the precision policy (see
+    pylix.algebra.statics.set_precision). Only inexact dtypes are rounded. With out=C the rounding happens in place.
+
+    Arrondit le résultat d'une multiplication en une seule passe vectorisée selon la politique de précision. Seuls
+    les dtypes inexacts sont arrondis. Avec out=C l'arrondi se fait sur place.
+    """
+    return round_output(C, out=out)
+
+@assertion.validation_helper
+def to_components(data: Iterable[Iterable[Scalar]], dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Converts data with one numpy conversion into a 2D array and validates it in bulk. A 1D input becomes a single
+    column. Only object arrays (e.g. big ints) are checked element by element.
+
+    Convertit les données en un tableau 2D avec une seule conversion numpy et les valide en bloc. Une entrée 1D
+    devient une seule colonne.
+
+    Args:
+        data (Iterable[Iterable[Scalar]]): A 2D (or 1D) iterable of numbers.
+        dtype (Optional[np.dtype]): The dtype of the result (see cast). default = None (inferred by numpy)
+
+    Returns:
+        The components (np.ndarray): A new 2D array.
+
+    Raises:
+        ArgumentError: If data is not an iterable.
+        ArgumentError: If data is not 1D or 2D or if the rows do not have the same length.
+        ArgumentError: If data does not only hold numbers.
+        ArgumentError: If the numbers can not be cast to dtype.
+    """
+    assertion.assert_type(data, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+    try:
+        components: np.ndarray = np.array(data)
+    except ValueError:
+        raise ArgumentError(ArgumentCodes.MISMATCH_DIMENSION, msg="The rows do not have the same length.")
+    if components.ndim == 0:
+        raise ArgumentError(ArgumentCodes.ITERABLE_LAYER_NOT_NUMBER_LISTS, wrong_argument=data)
+    if components.ndim == 1 and components.size == 0:
+        return np.empty((0, 0), dtype=float if dtype is None else dtype)
+    code: ArgumentCodes = ArgumentCodes.NOT_NUMBER if components.ndim == 1 else ArgumentCodes.LIST_LAYER_NOT_NUMBER
+    assertion.assert_range(components.ndim, 1, 2, ArgumentError, code=code)
+    assertion.assert_true(components.dtype.kind in NUMERIC_KINDS, ArgumentError, code=code,
+                          wrong_argument=components.dtype)
+    if components.dtype.kind == "O":
+        assertion.assert_type_list(components.ravel(), numbers.Number, ArgumentError, code=code)
+    if components.ndim == 1:
+        components = components.reshape(-1, 1)
+    return cast(components, dtype)
+
+def to_mask(m: Union[AllLists, np.ndarray], shape: tuple) -> np.ndarray:
+    """
+    Converts m with one numpy conversion into a boolean mask of the given shape. Values of an ndarray count as
+    allowed if they are > 0, values of a list / tuple if they are truthy.
+
+    Convertit m avec une seule conversion numpy en un masque booléen de la forme donnée.
+
+    Args:
+        m (Union[AllLists, np.ndarray]): The values which allow a position.
+        shape (tuple): The expected shape.
+
+    Returns:
+        The mask (np.ndarray): A bool array with the given shape.
+
+    Raises:
+        ArgumentError: If m does not have the given shape.
+        ArgumentError: If m has non number or boolean values.
+    """
+    from_array: bool = isinstance(m, np.ndarray)
+    try:
+        mask: np.ndarray = np.array(m)
+    except ValueError:
+        raise ArgumentError(ArgumentCodes.NOT_EQUAL, msg="The rows do not have the same length.")
+    assertion.assert_equals(mask.shape, shape, ArgumentError, code=ArgumentCodes.NOT_EQUAL)
+    assertion.assert_true(mask.dtype.kind in "biuf", ArgumentError, code=ArgumentCodes.NOT_INT_BOOl,
+                          wrong_argument=mask.dtype)
+    return mask > 0 if from_array else mask != 0
+
 class Axis(Enum):
     X: int = 0
     Y: int = 1
     Z: int = 2
 
+def _angles(thetas: Iterable[Number]) -> np.ndarray:
+    assertion.assert_type(thetas, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+    angles: np.ndarray = np.asarray(thetas)
+    assertion.assert_equals(angles.ndim, 1, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+    assertion.assert_true(angles.dtype.kind in "biuf", ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                          wrong_argument=angles.dtype)
+    assertion.assert_true(bool(np.all((angles >= 0) & (angles <= 360))), ArgumentError,
+                          code=ArgumentCodes.OUT_OF_RANGE, wrong_argument=angles)
+    return np.radians(angles)
+
+def rotations_2D(thetas: Iterable[Number], dtype: DType = float) -> np.ndarray:
+    """
+    Creates N rotation matrices (counterclockwise) for 2D vectors in one vectorized pass.
+
+    Crée N matrices de rotation (anti-horaire) pour des vecteurs 2D en une seule passe vectorisée.
+
+    Args:
+        thetas (Iterable[Number]): N angles of rotation in degree.
+        dtype (DType): A float or complex dtype for the components. default = float
+
+    Returns:
+        The rotation matrices (np.ndarray): An array with the shape (N, 2, 2).
+
+    Raises:
+        ArgumentError: If thetas is not a 1D iterable of numbers.
+        ArgumentError: If an angle is smaller 0 or bigger 360.
+        ArgumentError: If dtype is not a float or complex dtype.
+    """
+    dtype = _inexact_dtype(dtype)
+    radians: np.ndarray = _angles(thetas)
+    c: np.ndarray = np.cos(radians)
+    s: np.ndarray = np.sin(radians)
+    rotations: np.ndarray = np.stack((c, -s, s, c), axis=-1).reshape(-1, 2, 2).astype(dtype)
+    return round_output(rotations, out=rotations)
+
+def rotations_3D(thetas: Iterable[Number], axes: Union[Axis, Iterable[Axis]], dtype: DType = float) -> np.ndarray:
+    """
+    Creates N rotation matrices (counterclockwise) for 3D vectors in one vectorized pass. Every angle can have its
+    own axis.
+
+    Crée N matrices de rotation (anti-horaire) pour des vecteurs 3D en une seule passe vectorisée. Chaque angle peut
+    avoir son propre axe.
+
+    Args:
+        thetas (Iterable[Number]): N angles of rotation in degree.
+        axes (Union[Axis, Iterable[Axis]]): One axis for all angles or N axes.
+        dtype (DType): A float or complex dtype for the components. default = float
+
+    Returns:
+        The rotation matrices (np.ndarray): An array with the shape (N, 3, 3).
+
+    Raises:
+        ArgumentError: If thetas is not a 1D iterable of numbers.
+        ArgumentError: If an angle is smaller 0 or bigger 360.
+        ArgumentError: If axes is neither an Axis nor N axes.
+        ArgumentError: If dtype is not a float or complex dtype.
+    """
+    dtype = _inexact_dtype(dtype)
+    radians: np.ndarray = _angles(thetas)
+    n: int = len(radians)
+    if isinstance(axes, Axis):
+        k: np.ndarray = np.full(n, axes.value)
+    else:
+        assertion.assert_type(axes, Iterable, ArgumentError, code=ArgumentCodes.NOT_AXIS)
+        axes = list(axes)
+        assertion.assert_type_list(axes, Axis, ArgumentError, code=ArgumentCodes.NOT_AXIS)
+        assertion.assert_equals(len(axes), n, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        k: np.ndarray = np.array([axis.value for axis in axes], dtype=int)
+    # the rotation acts on the plane (i, j) which follows the axis k cyclically: X -> (Y, Z), Y -> (Z, X), Z -> (X, Y)
+    i: np.ndarray = (k + 1) % 3
+    j: np.ndarray = (k + 2) % 3
+    index: np.ndarray = np.arange(n)
+    c: np.ndarray = np.cos(radians)
+    s: np.ndarray = np.sin(radians)
+    rotations: np.ndarray = np.zeros((n, 3, 3), dtype=dtype)
+    rotations[index, k, k] = 1
+    rotations[index, i, i] = c
+    rotations[index, j, j] = c
+    rotations[index, i, j] = -s
+    rotations[index, j, i] = s
+    return round_output(rotations, out=rotations)
+
+def rotate(rotations: np.ndarray, points: Union[Lists, np.ndarray]) -> np.ndarray:
+    """
+    Applies rotation matrices to points in one einsum call: one matrix (d, d) to points (..., d), or N matrices
+    (N, d, d) to N points (N, d) or to N point clouds (N, M, d).
+
+    Applique des matrices de rotation à des points en un seul appel einsum.
+
+    Raises:
+        ArgumentError: If points do not hold numbers.
+        MathError: If the shape of points does not fit the matrices.
+    """
+    data: np.ndarray = np.asarray(points)
+    assertion.assert_true(data.dtype.kind in "biufc", ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                          wrong_argument=data.dtype)
+    if data.ndim == 0 or data.shape[-1] != rotations.shape[-1]:
+        raise MathError(MathCodes.UNFIT_DIMENSIONS, "The points do not have the dimension of the rotation.",
+                        data.shape)
+    if rotations.ndim == 2:
+        return round_output(np.einsum("ij,...j->...i", rotations, data))
+    if data.ndim == 1 or data.shape[0] != rotations.shape[0]:
+        raise MathError(MathCodes.UNFIT_DIMENSIONS, "Every rotation needs its own points.", data.shape)
+    return round_output(np.einsum("nij,n...j->n...i", rotations, data))
+
 class Matrix:
     """
     A class representing a mathematical matrix with various operations like addition, subtraction, multiplication,
@@ -83,73 +394,251 @@ class Matrix:
     tant que matrice zéro. Elle prend en charge les opérations avec d'autres matrices et valeurs scalaires, et fournit
     des méthodes pour accéder aux composants de la matrice et les modifier. Cette matrice est itérable.
 
+    The dtype of the components is inferred by numpy or chosen with dtype= (e.g. np.float32 to halve memory and
+    bandwidth, complex for complex matrices). Operations follow numpy's promotion rules: python numbers do not change
+    the dtype of a matrix (a float32 matrix times 2.5 stays float32), two matrices give the larger of their dtypes
+    (float32 and float64 give float64) and true division of integers gives float64.
+
+    Le dtype des composants est déduit par numpy ou choisi avec dtype=. Les opérations suivent les règles de
+    promotion de numpy.
+
     Attributes:
         _data (np.ndarray): A NumPy array holding the matrix data.
         _rows (int): The number of rows in the matrix.
         _columns (int): The number of columns in the matrix.
 
     """
-    def __init__(self, data: Iterable[Iterable[Number]] = None,
+    def __init__(self, data: Iterable[Iterable[Scalar]] = None,
                  rows: Int = 2, columns: Int = 2,
-                 default_value: Number = 0):
+                 default_value: Scalar = 0, dtype: Optional[DType] = None):
         """
         Creates a 2D Matrix.
 
         Crée une matrice 2D.
 
         Args:
-            data (Iterable[Iterable[Number]]): A 2D array which holds the components
+            data (Iterable[Iterable[Scalar]]): A 2D array which holds the components
             columns (int): the number of columns (default 2; If none are given, columns = len(data[0]))
             rows (int): the number of rows (default 2; If none are given, rows = len(data))
-            default_value (Number): If no data is given, this value will be used as placeholder. default = 0
+            default_value (Scalar): If no data is given, this value will be used as placeholder. default = 0
+            dtype (Optional[DType]): The dtype of the components, e.g. np.float32, np.int32 or complex. The data has
+                to be castable without changing its kind (no float -> int). default = None (inferred by numpy)
+
+        Raises:
+            ArgumentError: If dtype is not numeric or the data can not be cast to it.
         """
-        default_data: bool = False
-        if data is None:
-            data: np.ndarray = np.full((2, 2), default_value)
-            default_data = True
+        default_data: bool = data is None
         assertion.assert_types(rows, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         assertion.assert_types(columns, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_type(data, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
         assertion.assert_is_positiv(rows, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
         assertion.assert_is_positiv(columns, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
         assertion.assert_not_zero(columns, ArgumentError, code=ArgumentCodes.ZERO)
         assertion.assert_not_zero(rows, ArgumentError, code=ArgumentCodes.ZERO)
-        if len(data) > 0:
-            assertion.assert_layer_list(data, assertion.assert_types,
-                                        {"types": (*TypesTuple.NUMBER.value, Iterable)}, ArgumentError,
-                                        code=ArgumentCodes.ITERABLE_LAYER_NOT_NUMBER_LISTS)
-        if len(data) > 0 and isinstance(data[0], TypesTuple.LISTS.value):
-            for d in data:
-                assertion.assert_type(d, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-                assertion.assert_layer_list(d, assertion.assert_types,
-                                            {"types": TypesTuple.NUMBER.value}, ArgumentError,
-                                            code=ArgumentCodes.LIST_LAYER_NOT_NUMBER)
-        if len(data) > 0 and isinstance(data[0], TypesTuple.NUMBER.value):
-            for d in data:
-                assertion.assert_types(d, TypesTuple.NUMBER.value, ArgumentError,
-                                       code=ArgumentCodes.NOT_NUMBER)
-            copy_ = list()
-            for d in data:
-                copy_.append([d])
-            data = copy_
-
-        self._rows: int = int(rows)
-        self._columns: int = int(columns)
-
-        if not default_data and columns == 2:
-            self._columns: int = len(data[0])
-        elif not default_data and len(data) > 0 and rows != len(data[0]):
-            self._columns: int = len(data[0])
-        elif not default_data and len(data) == 0:
-            self._columns: int = 0
-        if not default_data and rows == 2:
-            self._rows: int = len(data)
-        elif not default_data and rows != len(data):
-            self._rows: int = len(data)
-
-        self._data = np.array(data)
-        if default_data and (rows != 2 or columns != 2):
-            self._data = np.full((self._rows, self._columns), default_value)
+        dtype = to_dtype(dtype)
+        if default_data:
+            self._set_array(np.full((int(rows), int(columns)), cast(np.asarray(default_value), dtype)))
+            return
+        self._set_array(to_components(data, dtype))
+
+    @classmethod
+    def _wrap(cls, data: np.ndarray) -> Self:
+        """
+        Wraps a 2D ndarray without copying or validating it. Changes to the matrix are visible in the array.
+
+        Enveloppe un ndarray 2D sans le copier ni le valider.
+        """
+        matrix: Matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._rows, matrix._columns = data.shape
+        return matrix
+
+    @classmethod
+    def from_numpy(cls, data: np.ndarray, copy: bool = False, dtype: Optional[DType] = None) -> Self:
+        """
+        Creates a matrix which wraps an existing 2D ndarray. Only the type, the number of dimensions and the dtype are
+        checked, the components themselves are not validated. Without copy the matrix and the array share their memory
+        (unless dtype requires a conversion).
+
+        Crée une matrice qui enveloppe un ndarray 2D existant. Seuls le type, le nombre de dimensions et le dtype sont
+        vérifiés. Sans copie, la matrice et le tableau partagent leur mémoire.
+
+        Args:
+            data (np.ndarray): A 2D array with a numeric dtype (bool, int, float, complex or object).
+            copy (bool): Should the array be copied? default = False
+            dtype (Optional[DType]): Converts data to this dtype (see cast). default = None (keeps the dtype)
+
+        Returns:
+            The matrix (Matrix): A matrix backed by data (or by a copy of it).
+
+        Raises:
+            ArgumentError: If data is not an ndarray.
+            ArgumentError: If data is not 2D.
+            ArgumentError: If the dtype of data is not numeric or data can not be cast to dtype.
+            ArgumentError: If copy is not a bool.
+        """
+        assertion.assert_type(data, np.ndarray, ArgumentError, code=ArgumentCodes.NOT_ND_ARRAY)
+        assertion.assert_equals(data.ndim, 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        assertion.assert_true(data.dtype.kind in NUMERIC_KINDS, ArgumentError, code=ArgumentCodes.NOT_NUMERIC_DTYPE,
+                              wrong_argument=data.dtype)
+        assertion.assert_type(copy, bool, ArgumentError, code=ArgumentCodes.NOT_BOOl)
+        converted: np.ndarray = cast(data, to_dtype(dtype))
+        return cls._wrap(np.array(data) if copy and converted is data else converted)
+
+    @classmethod
+    def open(cls, path: Union[str, os.PathLike], mode: str = "r") -> Self:
+        """
+        Opens a 2D .npy file as a memory-mapped matrix. Nothing is loaded up front: slicing, indexing, reductions and
+        element-wise operations only page in the parts of the file they touch. Use flush() to write changes back
+        and close() (or a with block) to release the mapping.
+
+        Ouvre un fichier .npy 2D comme matrice mappée en mémoire. Rien n'est chargé à l'avance : les découpages,
+        l'indexation, les réductions et les opérations élément par élément ne chargent que les parties du fichier
+        qu'ils touchent. flush() écrit les modifications, close() (ou un bloc with) libère le mappage.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the .npy file.
+            mode (str): "r" (read-only), "r+" (read and write) or "c" (copy-on-write, changes stay in memory).
+                default = "r"
+
+        Returns:
+            The matrix (Matrix): A matrix backed by an np.memmap.
+
+        Raises:
+            ArgumentError: If mode is not "r", "r+" or "c".
+            ArgumentError: If the file does not hold a 2D array with a numeric dtype.
+        """
+        assertion.assert_true(mode in ("r", "r+", "c"), ArgumentError, code=ArgumentCodes.UNEXPECTED_TYPE,
+                              wrong_argument=mode)
+        return cls.from_numpy(np.load(path, mmap_mode=mode))
+
+    @classmethod
+    def create_mapped(cls, path: Union[str, os.PathLike], rows: Int, columns: Int, dtype: type = float) -> Self:
+        """
+        Creates a new zero-filled .npy file and returns it as a memory-mapped matrix (see open).
+
+        Crée un nouveau fichier .npy rempli de zéros et le renvoie comme matrice mappée en mémoire (voir open).
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the new .npy file. An existing file is overwritten.
+            rows (Int): The number of rows.
+            columns (Int): The number of columns.
+            dtype (type): A numeric dtype (bool, int, float or complex). default = float
+
+        Returns:
+            The matrix (Matrix): A writeable matrix backed by an np.memmap.
+
+        Raises:
+            ArgumentError: If rows or columns are not positive ints.
+            ArgumentError: If dtype is not a numeric dtype which can be mapped.
+        """
+        assertion.assert_types(rows, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_types(columns, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_above(rows, 0, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+        assertion.assert_above(columns, 0, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+        assertion.assert_true(np.dtype(dtype).kind in "biufc", ArgumentError, code=ArgumentCodes.NOT_NUMERIC_DTYPE,
+                              wrong_argument=dtype)
+        return cls._wrap(np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(int(rows), int(columns))))
+
+    @classmethod
+    def matmul_blocked(cls, a_path: Union[str, os.PathLike], b_path: Union[str, os.PathLike],
+                       out_path: Union[str, os.PathLike], memory_budget: Int = 256 * 2 ** 20) -> Self:
+        """
+        Multiplies two matrices stored as 2D .npy files without loading them (out-of-core). A and B are memory-mapped
+        and streamed in square tiles; every tile of C is accumulated in memory and written to the mapped output file.
+        At most four tiles (A, B, their product and the C accumulator) are held at once, so the tile size is
+        isqrt(memory_budget / (4 * itemsize)).
+
+        Multiplie deux matrices stockées dans des fichiers .npy 2D sans les charger. A et B sont mappées en mémoire et
+        lues par tuiles carrées ; chaque tuile de C est accumulée en mémoire puis écrite dans le fichier de sortie.
+        Au plus quatre tuiles sont gardées en même temps, la taille des tuiles est donc
+        isqrt(memory_budget / (4 * itemsize)).
+
+        Args:
+            a_path (Union[str, os.PathLike]): The .npy file of the left matrix.
+            b_path (Union[str, os.PathLike]): The .npy file of the right matrix.
+            out_path (Union[str, os.PathLike]): The .npy file for the product. An existing file is overwritten.
+            memory_budget (Int): The peak memory in bytes for the tiles. default = 256 MiB
+
+        Returns:
+            The product (Matrix): A memory-mapped matrix backed by out_path.
+
+        Raises:
+            ArgumentError: If memory_budget is not an int or too small for a single component.
+            ArgumentError: If a file does not hold a 2D array with a numeric dtype.
+            MathError: If the columns of A do not equal the rows of B.
+        """
+        assertion.assert_types(memory_budget, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        operands: list = list()
+        try:
+            operands.append(cls.open(a_path))
+            operands.append(cls.open(b_path))
+            a, b = operands[0]._data, operands[1]._data
+            assertion.assert_equals(a.shape[1], b.shape[0], MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                    msg="Columns of a do not equal rows of b.")
+            # bools are counted like in multiply, so the tiles are summed as ints
+            dtype: np.dtype = _count_bools(np.empty(0, np.result_type(a, b))).dtype
+            tile: int = math.isqrt(int(memory_budget) // (4 * dtype.itemsize))
+            assertion.assert_above(tile, 0, ArgumentError, code=ArgumentCodes.TOO_SMALL,
+                                   wrong_argument=memory_budget)
+            out: Matrix = cls.create_mapped(out_path, a.shape[0], b.shape[1], dtype)
+            for i in range(0, a.shape[0], tile):
+                for j in range(0, b.shape[1], tile):
+                    accumulator: np.ndarray = np.zeros((min(tile, a.shape[0] - i), min(tile, b.shape[1] - j)), dtype)
+                    for k in range(0, a.shape[1], tile):
+                        accumulator += (np.array(a[i:i + tile, k:k + tile], dtype=dtype)
+                                        @ np.array(b[k:k + tile, j:j + tile], dtype=dtype))
+                    out._data[i:i + tile, j:j + tile] = round_product(accumulator, out=accumulator)
+            out.flush()
+            return out
+        finally:
+            # release the read-only mappings of a and b
+            a = b = None
+            for operand in operands:
+                operand.close()
+
+    def is_mapped(self) -> bool:
+        """
+        Returns whether the matrix is backed by a file (see open, create_mapped).
+
+        Renvoie si la matrice est adossée à un fichier.
+        """
+        return isinstance(self._data, np.memmap) and self._data.filename is not None
+
+    def flush(self) -> None:
+        """
+        Writes the changes of a memory-mapped matrix to its file.
+
+        Écrit les modifications d'une matrice mappée en mémoire dans son fichier.
+
+        Raises:
+            StateError: If the matrix is not memory-mapped.
+        """
+        if not self.is_mapped():
+            raise StateError("Only a memory-mapped matrix can be flushed.")
+        self._data.flush()
+
+    def close(self) -> None:
+        """
+        Flushes a memory-mapped matrix and releases its mapping. The matrix is empty (0 x 0) afterwards; the file is
+        unmapped as soon as no other view of it is alive.
+
+        Écrit une matrice mappée en mémoire et libère son mappage. La matrice est vide (0 x 0) ensuite.
+
+        Raises:
+            StateError: If the matrix is not memory-mapped.
+        """
+        if not self.is_mapped():
+            raise StateError("Only a memory-mapped matrix can be closed.")
+        if self._data.flags.writeable:
+            self._data.flush()
+        self._set_array(np.empty((0, 0), dtype=self._data.dtype))
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.is_mapped():
+            self.close()
 
     def get_rows(self) -> int:
         return self._rows
@@ -160,6 +649,23 @@ class Matrix:
     def get_dimension(self) -> tuple:
         return self._rows, self._columns
 
+    def get_dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    def astype(self, dtype: DType) -> Self:
+        """
+        Returns a copy with the given dtype. Like the constructors it only casts within the same kind or to a larger
+        kind (e.g. float64 -> float32 or int -> complex, but not float -> int).
+
+        Renvoie une copie avec le dtype donné. Comme les constructeurs, elle ne convertit que vers le même genre ou
+        un genre plus grand.
+
+        Raises:
+            ArgumentError: If dtype is not numeric or the components can not be cast to it.
+        """
+        converted: np.ndarray = cast(self._data, to_dtype(dtype))
+        return type(self)._wrap(np.array(converted) if converted is self._data else converted)
+
     @deprecated("Use matrix[i][j] instead.")
     def get_component(self, row: Int, column: Int) -> float:
         assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
@@ -169,51 +675,47 @@ class Matrix:
         assertion.assert_range(column, 0, len(self._data[row]) - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
         column = int(column)
         row = int(row)
-        return float(self._data[row][column])
+        return to_scalar(self._data[row][column])
 
     @deprecated("Use matrix[i][j] = value instead.")
-    def set_component(self, row: Int, column: Int, value: Number) -> None:
+    def set_component(self, row: Int, column: Int, value: Scalar) -> None:
         assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_types(value, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        assertion.assert_types(value, TypesTuple.SCALAR.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
 
         assertion.assert_range(row, 0, len(self._data) - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
         assertion.assert_range(column, 0, len(self._data[row]) - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
         self._data[row][column] = value
 
-    def get_components(self) -> np.ndarray:
-        return self._data.copy()
+    def get_components(self, copy: bool = True) -> np.ndarray:
+        """
+        Returns the components of the matrix.
+
+        Renvoie les composants de la matrice.
+
+        Args:
+            copy (bool): If True a copy is returned, else a read-only view which shares the memory with the matrix
+                and therefore reflects later changes. default = True
+
+        Returns:
+            The components (np.ndarray): A 2D array.
+        """
+        assertion.assert_type(copy, bool, ArgumentError, code=ArgumentCodes.NOT_BOOl)
+        if copy:
+            return np.array(self._data)
+        view: np.ndarray = self._data.view()
+        view.flags.writeable = False
+        return view
 
     def set_components(self, data: Iterable[Iterable[Number]]) -> None:
-        assertion.assert_type(data, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-        if len(data) > 0:
-            assertion.assert_layer_list(data, assertion.assert_types,
-                                        {"types": (*TypesTuple.NUMBER.value, Iterable)}, ArgumentError,
-                                        code=ArgumentCodes.ITERABLE_LAYER_NOT_NUMBER_LISTS)
-        if len(data) > 0 and isinstance(data[0], TypesTuple.LISTS.value):
-            for d in data:
-                assertion.assert_type(d, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-                assertion.assert_layer_list(d, assertion.assert_types,
-                                            {"types": TypesTuple.NUMBER.value}, ArgumentError,
-                                            code=ArgumentCodes.LIST_LAYER_NOT_NUMBER)
-        if len(data) > 0 and isinstance(data[0], TypesTuple.NUMBER.value):
-            for d in data:
-                assertion.assert_types(d, TypesTuple.NUMBER.value, ArgumentError,
-                                       code=ArgumentCodes.NOT_NUMBER)
-            copy_ = list()
-            for d in data:
-                copy_.append([d])
-            data = copy_
-        if len(data) != self._rows:
-            self._rows = len(data)
-        if len(data) > 0 and len(data[0]) != self._columns:
-            self._columns = len(data[0])
-        elif len(data[0]) == 0:
-            self._columns = 0
-        self._data = np.array(data)
+        self._set_array(to_components(data))
+
+    def _set_array(self, data: np.ndarray) -> None:
+        self._data = data
+        self._rows, self._columns = data.shape
 
     def copy(self) -> Self:
-        return Matrix(data=list(self.get_components()))
+        return Matrix.from_numpy(self._data, copy=True)
 
     def where(self, m: Union[AllLists, Self], for_false: any = -1) -> Self:
         """
@@ -236,117 +738,140 @@ class Matrix:
         assertion.assert_types(m, (*TypesTuple.LISTS.value, *TypesTuple.TUPLE.value, Matrix), ArgumentError,
                                code=ArgumentCodes.NOT_LISTS_TUPLE)
         if isinstance(m, Matrix):
-            m = m.get_components()
-        tester: list = list()
-        for i, row in enumerate(m):
-            assertion.assert_equals(len(row), self.get_columns(), ArgumentError, code=ArgumentCodes.NOT_EQUAL)
-            assertion.assert_types(row, (*TypesTuple.LISTS.value, *TypesTuple.TUPLE.value, Matrix), ArgumentError,
-                                   code=ArgumentCodes.NOT_LISTS_TUPLE)
-            tester.append(list())
-            for value in row:
-                assertion.assert_types(value, (*TypesTuple.NUMBER.value, bool), ArgumentError,
-                                       code=ArgumentCodes.NOT_INT_BOOl)
-                if isinstance(value, (np.integer, np.floating)):
-                    tester[i].append(value > 0)
-                    continue
-                tester[i].append(bool(value))
-
-        result: Matrix = Matrix(rows=self.get_rows(), columns=self.get_columns())
-        for i, rows in enumerate(self):
-            for j, value in enumerate(self[i]):
-                result[i][j] = value if tester[i][j] else for_false
-
-        return result
-
-    def max_in_column(self, column: Int) -> float:
-        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(column, 0, self.get_columns()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
-
-        max_: float = float(self[0][column])
-        for i in range(self.get_rows()):
-            max_: float = max(max_, float(self[i][column]))
+            m = m._data
+        mask: np.ndarray = to_mask(m, self._data.shape)
+        return Matrix.from_numpy(np.where(mask, self._data, for_false))
+
+    def _reduce(self, operation, axis: Optional[Int] = None, rounded: bool = False,
+                data: Optional[np.ndarray] = None) -> Union[float, "Vector"]:
+        if axis is not None:
+            assertion.assert_types(axis, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+            assertion.assert_range(axis, 0, 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        data = self._data if data is None else data
+        result = operation(data, axis=axis)
+        if axis is None:
+            return round_output(to_scalar(result)) if rounded else to_scalar(result)
+        from pylix.algebra.vector import Vector
+        return Vector.from_numpy(round_product(result) if rounded else result)
+
+    def max(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the biggest component. With an axis the maxima are computed per column (axis=0) or per row (axis=1).
 
-        return float(max_)
+        Renvoie le plus grand composant. Avec un axe, les maxima sont calculés par colonne (axis=0) ou par ligne
+        (axis=1).
 
-    def min_in_column(self, column: Int) -> float:
-        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(column, 0, self.get_columns()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        Args:
+            axis (Optional[Int]): None, 0 (per column) or 1 (per row). default = None
 
-        min_: float = float(self[0][column])
-        for i in range(self.get_rows()):
-            min_: float = min(min_, float(self[i][column]))
+        Returns:
+            The maximum (Union[float, Vector]): A float without axis, else a Vector with one value per column / row.
 
-        return float(min_)
+        Raises:
+            ArgumentError: If axis is not None, 0 or 1.
+        """
+        return self._reduce(np.max, axis)
 
-    def sum_in_column(self, column: Int) -> float:
-        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(column, 0, self.get_columns() - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+    def min(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the smallest component, per column (axis=0) or per row (axis=1) if an axis is given.
 
-        sum_: float = 0
-        for i in range(self.get_rows()):
-            sum_ += float(self[i][column])
+        Renvoie le plus petit composant, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        return self._reduce(np.min, axis)
 
-        return rnd(sum_)
+    def sum(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) sum of the components, per column (axis=0) or per row (axis=1) if an axis is given.
 
-    def max_in_row(self, row: Int) -> float:
-        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        Renvoie la somme (arrondie) des composants, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        return self._reduce(np.sum, axis, rounded=True)
 
-        max_: float = float(self[row][0])
-        for i in range(self.get_columns()):
-            max_: float = max(max_, float(self[row][i]))
+    def mean(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) mean of the components, per column (axis=0) or per row (axis=1) if an axis is given.
 
-        return float(max_)
+        Renvoie la moyenne (arrondie) des composants, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        return self._reduce(np.mean, axis, rounded=True)
 
-    def min_in_row(self, row: Int) -> float:
-        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+    def prod(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) product of the components, per column (axis=0) or per row (axis=1) if an axis is given.
 
-        min_: float = float(self[row][0])
-        for i in range(self.get_columns()):
-            min_: float = min(min_, float(self[row][i]))
+        Renvoie le produit (arrondi) des composants, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        return self._reduce(np.prod, axis, rounded=True)
 
-        return float(min_)
+    def norm(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) euclidean norm. Without an axis this is the Frobenius norm of the matrix, with an axis
+        the norm of every column (axis=0) or row (axis=1).
 
-    def sum_in_row(self, row: Int) -> float:
-        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        Renvoie la norme euclidienne (arrondie). Sans axe, c'est la norme de Frobenius de la matrice, avec un axe la
+        norme de chaque colonne (axis=0) ou ligne (axis=1).
+        """
+        return self._reduce(np.linalg.norm, axis, rounded=True)
 
-        sum_: float = 0
-        for i in range(self.get_columns()):
-            sum_ += float(self[row][i])
+    def argmax(self, axis: Optional[Int] = None) -> Union[tuple[int, int], "Vector"]:
+        """
+        Returns the position (row, column) of the biggest component. With an axis the row index of the maximum of
+        every column (axis=0) or the column index of the maximum of every row (axis=1) is returned.
 
-        return rnd(sum_)
+        Renvoie la position (ligne, colonne) du plus grand composant. Avec un axe, l'indice du maximum de chaque
+        colonne (axis=0) ou de chaque ligne (axis=1) est renvoyé.
+        """
+        return self._arg(np.argmax, axis)
 
-    def max(self) -> float:
-        max_: float = float(self[0][0])
+    def argmin(self, axis: Optional[Int] = None) -> Union[tuple[int, int], "Vector"]:
+        """
+        Returns the position (row, column) of the smallest component, or per column (axis=0) / row (axis=1) the index
+        of the minimum.
 
-        for i in range(self.get_rows()):
-            for j in range(self.get_columns()):
-                max_: float = max(max_, float(self[i][j]))
+        Renvoie la position (ligne, colonne) du plus petit composant, ou par colonne (axis=0) / ligne (axis=1)
+        l'indice du minimum.
+        """
+        return self._arg(np.argmin, axis)
 
-        return float(max_)
+    def _arg(self, operation, axis: Optional[Int]) -> Union[tuple[int, int], "Vector"]:
+        if axis is not None:
+            return self._reduce(operation, axis)
+        row, column = np.unravel_index(operation(self._data), self._data.shape)
+        return int(row), int(column)
 
-    def min(self) -> float:
-        min_: float = float(self[0][0])
+    def max_in_column(self, column: Int) -> float:
+        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(column, 0, self.get_columns()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.max, data=self._data[:, column])
 
-        for i in range(self.get_rows()):
-            for j in range(self.get_columns()):
-                min_: float = min(min_, float(self[i][j]))
+    def min_in_column(self, column: Int) -> float:
+        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(column, 0, self.get_columns()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.min, data=self._data[:, column])
 
-        return float(min_)
+    def sum_in_column(self, column: Int) -> float:
+        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(column, 0, self.get_columns() - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.sum, rounded=True, data=self._data[:, column])
 
-    def sum(self) -> float:
-        sum_: float = 0
+    def max_in_row(self, row: Int) -> float:
+        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.max, data=self._data[row])
 
-        for i in range(self.get_rows()):
-            for j in range(self.get_columns()):
-                sum_ += float(self[i][j])
+    def min_in_row(self, row: Int) -> float:
+        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.min, data=self._data[row])
 
-        return rnd(sum_)
+    def sum_in_row(self, row: Int) -> float:
+        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(row, 0, self.get_rows()-1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return self._reduce(np.sum, rounded=True, data=self._data[row])
 
     @classmethod
-    def create_identity_matrix(cls, n: int = 2) -> Self:
+    def create_identity_matrix(cls, n: int = 2, dtype: DType = float) -> Self:
         """
         Creates an identity matrix of size n x n.
 
@@ -354,6 +879,7 @@ class Matrix:
 
         Args:
             n (int): The size of the identity matrix. Default is 2.
+            dtype (DType): The dtype of the components. default = float
 
         Returns:
             Identity matrix (Matrix): A new identity matrix of the specified size.
@@ -361,17 +887,15 @@ class Matrix:
         Raises:
             ArgumentError: If n is not an integer.
             ArgumentError: If n is not positiv.
+            ArgumentError: If dtype is not numeric.
         """
         assertion.assert_types(n, TypesTuple.INT.value, ArgumentError,
                                code=ArgumentCodes.NOT_INT)
         assertion.assert_is_positiv(n, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
-        identity_matrix: np.ndarray = np.zeros(shape=(n, n))
-        for i in range(len(identity_matrix)):
-            identity_matrix[i][i] = 1
-        return Matrix(data=list(identity_matrix))
+        return Matrix.from_numpy(np.eye(n, dtype=to_dtype(dtype)))
 
     @classmethod
-    def create_rotation_matrix_2D(cls, theta: Number) -> Self:
+    def create_rotation_matrix_2D(cls, theta: Number, dtype: DType = float) -> Self:
         """
         Creates a rotation matrix (counterclockwise) for a 2D vector.
 
@@ -379,6 +903,7 @@ class Matrix:
 
         Args:
             theta (float): the angle of rotation in degree.
+            dtype (DType): A float or complex dtype for the components. default = float
 
         Returns:
             A rotation matrix (Matrix): for the angle theta.
@@ -386,16 +911,14 @@ class Matrix:
         Raises:
             ArgumentError: If theta is not a number (int, float).
             ArgumentError: If theta is smaller 0 or bigger 360.
+            ArgumentError: If dtype is not a float or complex dtype.
         """
         assertion.assert_types(theta, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
         assertion.assert_range(theta, 0, 360, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
-        return Matrix([
-            [rnd(math.cos(math.radians(theta))), rnd((-1) * math.sin(math.radians(theta)))],
-            [rnd(math.sin(math.radians(theta))), rnd(math.cos(math.radians(theta)))]
-        ])
+        return Matrix.from_numpy(rotations_2D([theta], dtype)[0])
 
     @classmethod
-    def create_rotation_matrix_3D(cls, theta: Number, axis: Axis) -> Self:
+    def create_rotation_matrix_3D(cls, theta: Number, axis: Axis, dtype: DType = float) -> Self:
         """
         Creates a rotation matrix (counterclockwise) for a 3D vector.
 
@@ -404,6 +927,7 @@ class Matrix:
         Args:
             theta (float): the angle of rotation in degree.
             axis (Axis): the axis for which the rotation matrix should be.
+            dtype (DType): A float or complex dtype for the components. default = float
 
         Returns:
             A rotation matrix (Matrix): for the angle theta.
@@ -412,66 +936,167 @@ class Matrix:
             ArgumentError: If theta is not a number (int, float).
             ArgumentError: If theta is smaller 0 or bigger 360.
             ArgumentError: If axis not of type Axis.
+            ArgumentError: If dtype is not a float or complex dtype.
         """
         assertion.assert_types(theta, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
         assertion.assert_range(theta, 0, 360, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
         assertion.assert_type(axis, Axis, ArgumentError, code=ArgumentCodes.NOT_AXIS)
-        matrix: list = list()
-        if axis.value == Axis.X.value:
-            matrix: list = [
-                [1, 0, 0],
-                [0, rnd(math.cos(math.radians(theta))), rnd((-1) * math.sin(math.radians(theta)))],
-                [0, rnd(math.sin(math.radians(theta))), rnd(math.cos(math.radians(theta)))]
-            ]
-        elif axis.value == Axis.Y.value:
-            matrix: list = [
-                [rnd(math.cos(math.radians(theta))), 0, rnd(math.sin(math.radians(theta)))],
-                [0, 1, 0],
-                [rnd((-1) * math.sin(math.radians(theta))), 0, rnd(math.cos(math.radians(theta)))]
-            ]
-        else:
-            matrix: list = [
-                [rnd(math.cos(math.radians(theta))), rnd((-1) * math.sin(math.radians(theta))), 0],
-                [rnd(math.sin(math.radians(theta))), rnd(math.cos(math.radians(theta))), 0],
-                [0, 0, 1]
-            ]
-        return Matrix(matrix)
+        return Matrix.from_numpy(rotations_3D([theta], axis, dtype)[0])
+
+    def apply_rotation(self, points: Union[Lists, np.ndarray]) -> np.ndarray:
+        """
+        Applies the matrix to a whole point cloud in one call (points @ self^T), instead of one Vector at a time.
+
+        Applique la matrice à tout un nuage de points en un seul appel, au lieu d'un Vector à la fois.
+
+        Args:
+            points (Union[Lists, np.ndarray]): Points as rows, e.g. an array with the shape (N, 3) for a 3 x 3 matrix.
+
+        Returns:
+            The transformed points (np.ndarray): An array with the shape of points.
+
+        Raises:
+            ArgumentError: If points do not hold numbers.
+            MathError: If the points do not have as many coordinates as the matrix has columns.
+        """
+        return rotate(self._data, points)
+
+    def lazy(self) -> "Expression":
+        """
+        Starts a lazy expression with this matrix (see pylix.algebra.expression). Operators on the expression only
+        build a graph; evaluate() computes it at once with folded scalars, fused in-place accumulation and a single
+        rounding, e.g. (A.lazy() * B + C * 2 - D).evaluate().
+
+        Commence une expression paresseuse avec cette matrice. Les opérateurs ne construisent qu'un graphe ;
+        evaluate() le calcule en une fois.
+
+        Returns:
+            The expression (Expression)
+        """
+        from pylix.algebra.expression import Expression
+        return Expression(self)
+
+    def factorize(self, kind: str = "lu") -> "Factorization":
+        """
+        Factorizes the matrix once so that A * x = b can be solved for many right-hand sides in O(n^2) each (see
+        pylix.algebra.factorization). The factorization offers solve(Vector | Matrix), det() and logdet().
+
+        Factorise la matrice une seule fois afin de résoudre A * x = b pour de nombreux seconds membres en O(n^2)
+        chacun. La factorisation offre solve(Vector | Matrix), det() et logdet().
+
+        Args:
+            kind (str): "lu" (any quadratic matrix), "qr" (rows >= columns, least squares) or "cholesky"
+                (symmetric positive definite). default = "lu"
+
+        Returns:
+            The factorization (Factorization): An LU, QR or Cholesky object.
+
+        Raises:
+            ArgumentError: If kind is not "lu", "qr" or "cholesky".
+            MathError: If the matrix does not fit the kind of factorization.
+        """
+        from pylix.algebra.factorization import FACTORIZATIONS
+        assertion.assert_true(kind in FACTORIZATIONS, ArgumentError, code=ArgumentCodes.UNEXPECTED_TYPE,
+                              wrong_argument=kind)
+        return FACTORIZATIONS[kind](self)
+
+    def _is_exact(self, exact: Optional[bool]) -> bool:
+        if exact is None:
+            return self._data.dtype.kind == "O"
+        assertion.assert_type(exact, bool, ArgumentError, code=ArgumentCodes.NOT_BOOl)
+        return exact
+
+    def to_exact(self) -> Self:
+        """
+        Returns a copy with python ints and Fractions (object dtype), so that get_determinant, get_rank and get_invers
+        compute exactly by default. Floats are converted to the Fraction of their exact binary value.
+
+        Renvoie une copie avec des entiers python et des Fractions (dtype object), de sorte que get_determinant,
+        get_rank et get_invers calculent exactement par défaut.
+
+        Raises:
+            MathError: If a component is not rational (e.g. nan or inf).
+        """
+        integers, scale = exact_algebra.to_integers(self._data)
+        return Matrix.from_numpy(exact_algebra.to_rational(integers, scale))
 
-    def get_invers(self) -> Optional[Self]:
+    def get_determinant(self, exact: Optional[bool] = None) -> Number:
         """
-        Creates the inverse matrix for the matrix.
+        Computes the determinant. The exact path uses Bareiss' fraction-free elimination (pylix.algebra.exact) and
+        returns an int or a Fraction, the float path uses LAPACK and returns a rounded float.
 
-        Crée une matrice inverse pour la matrice.
+        Calcule le déterminant. La voie exacte utilise l'élimination sans fractions de Bareiss et renvoie un int ou une
+        Fraction, la voie flottante utilise LAPACK et renvoie un float arrondi.
+
+        Args:
+            exact (Optional[bool]): Compute exactly? default = None: exactly for object matrices (ints, Fractions).
 
         Returns:
-            An invers matrix (Matrix)
+            The determinant (Number)
+
+        Raises:
+            MathError: If the matrix is not quadratic.
+            MathError: If exact and a component is not rational.
+        """
+        assertion.assert_equals(self._columns, self._rows, MathError, code=MathCodes.UNFIT_DIMENSIONS)
+        if self._is_exact(exact):
+            return exact_algebra.determinant(self._data)
+        return round_output(to_scalar(np.linalg.det(self._data)))
+
+    def get_rank(self, exact: Optional[bool] = None) -> int:
+        """
+        Computes the rank, exactly with fraction-free row reduction or with an SVD in float.
+
+        Calcule le rang, exactement par réduction sans fractions ou avec une SVD en flottant.
+
+        Args:
+            exact (Optional[bool]): Compute exactly? default = None: exactly for object matrices (ints, Fractions).
+
+        Returns:
+            The rank (int)
+
+        Raises:
+            MathError: If exact and a component is not rational.
+        """
+        if self._is_exact(exact):
+            return exact_algebra.rank(self._data)
+        return int(np.linalg.matrix_rank(self._data))
+
+    def get_invers(self, exact: Optional[bool] = None) -> Optional[Self]:
+        """
+        Creates the inverse matrix for the matrix. The exact path uses fraction-free Gauss-Jordan elimination and
+        returns a matrix of ints and Fractions.
+
+        Crée une matrice inverse pour la matrice. La voie exacte utilise l'élimination de Gauss-Jordan sans fractions
+        et renvoie une matrice d'entiers et de Fractions.
+
+        Args:
+            exact (Optional[bool]): Compute exactly? default = None: exactly for object matrices (ints, Fractions).
+
+        Returns:
+            An invers matrix (Matrix), None if the matrix is singular.
 
         Raises:
             MathError: if the matrix is not quadratic
+            MathError: If exact and a component is not rational.
         """
         assertion.assert_equals(self._columns, self._rows, MathError, code=MathCodes.UNFIT_DIMENSIONS)
-        if np.linalg.det(self.get_components()) != 0:
-            invers: np.ndarray = np.linalg.inv(self.get_components())
-            return Matrix(data=list(invers))
+        if self._is_exact(exact):
+            inverse: Optional[np.ndarray] = exact_algebra.inverse(self._data)
+            return None if inverse is None else Matrix.from_numpy(inverse)
+        if np.linalg.det(self._data) != 0:
+            return Matrix.from_numpy(np.linalg.inv(self._data))
         return None
 
     def __eq__(self, other: Union[AllLists, Self]) -> bool:
         if isinstance(other, Matrix):
             if self.get_rows() != other.get_rows() and self.get_columns() != other.get_columns():
                 return False
-            bools = self.get_components() == other.get_components()
-            fin = list()
-            for column in bools:
-                fin.append(all(column))
-            return all(fin)
+            return bool(np.all(self._data == other._data))
         elif isinstance(other, np.ndarray):
-            if self.get_components().shape != other.shape:
+            if self._data.shape != other.shape:
                 return False
-            bools = self.get_components() == other
-            fin = list()
-            for column in bools:
-                fin.append(all(column))
-            return all(fin)
+            return bool(np.all(self._data == other))
         elif isinstance(other, (*TypesTuple.LISTS.value, *TypesTuple.TUPLE.value)):
             other = list(other)
             for i in other:
@@ -490,157 +1115,310 @@ class Matrix:
             return True
         return False
 
-    def __add__(self, other: Self) -> Self:
+    def _in_place(self, ufunc: np.ufunc, other: Union[np.ndarray, Number]) -> None:
+        """
+        Applies a binary ufunc to the matrix in place. If the result does not fit into the current dtype (e.g. int
+        matrix divided by a number) or the buffer is read-only, the matrix gets a new array instead.
+
+        Applique un ufunc binaire à la matrice sur place. Si le résultat ne rentre pas dans le dtype actuel ou si le
+        tampon est en lecture seule, la matrice reçoit un nouveau tableau.
+        """
+        if self._data.flags.writeable and np.result_type(self._data, other) == self._data.dtype:
+            ufunc(self._data, other, out=self._data)
+        else:
+            self._set_array(ufunc(self._data, other))
+
+    def _assign(self, data: np.ndarray) -> None:
+        """
+        Writes data into the existing buffer if shape and dtype match, otherwise the matrix gets data as new array.
+
+        Écrit data dans le tampon existant si la forme et le dtype correspondent, sinon la matrice reçoit data.
+        """
+        if self._data.flags.writeable and self._data.shape == data.shape and self._data.dtype == data.dtype:
+            np.copyto(self._data, data)
+        else:
+            self._set_array(data)
+
+    def _check_out(self, out: Self, shape: tuple, dtype: np.dtype) -> None:
+        assertion.assert_type(out, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+        if out._data.shape != shape:
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimension of out does not fit the result!", out)
+        if not np.can_cast(dtype, out._data.dtype, "same_kind"):
+            raise ArgumentError(ArgumentCodes.NOT_NUMERIC_DTYPE, f"The result of dtype {dtype} can not be "
+                                                                 f"stored in out of dtype {out._data.dtype}.")
+        assertion.assert_true(out._data.flags.writeable, ArgumentError, code=ArgumentCodes.UNEXPECTED_TYPE,
+                              msg="out must be writeable.")
+
+    def add(self, other: Self, out: Optional[Self] = None) -> Self:
+        """
+        Adds other to the matrix. If out is given, the sum is written into out and no new matrix is allocated. out
+        may be self or other.
+
+        Additionne other à la matrice. Si out est donné, la somme est écrite dans out et aucune nouvelle matrice
+        n'est allouée. out peut être self ou other.
+
+        Args:
+            other (Matrix): The matrix to add.
+            out (Optional[Matrix]): A preallocated matrix with the dimension of the result.
+
+        Returns:
+            The sum (Matrix): out if given, otherwise a new matrix.
+
+        Raises:
+            MathError: If other is not a matrix.
+            MathError: If the dimensions do not fit.
+            ArgumentError: If out is not a writeable matrix or can not hold the dtype of the result.
+        """
+        if out is None:
+            return self + other
+        self._check_operand(other, "Only a matrix can be added to a matrix.")
+        self._check_out(out, self._data.shape, np.result_type(self._data, other._data))
+        np.add(self._data, other._data, out=out._data)
+        return out
+
+    def sub(self, other: Self, out: Optional[Self] = None) -> Self:
+        """
+        Subtracts other from the matrix. If out is given, the difference is written into out and no new matrix is
+        allocated. out may be self or other.
+
+        Soustrait other de la matrice. Si out est donné, la différence est écrite dans out et aucune nouvelle
+        matrice n'est allouée. out peut être self ou other.
+
+        Args:
+            other (Matrix): The matrix to subtract.
+            out (Optional[Matrix]): A preallocated matrix with the dimension of the result.
+
+        Returns:
+            The difference (Matrix): out if given, otherwise a new matrix.
+
+        Raises:
+            MathError: If other is not a matrix.
+            MathError: If the dimensions do not fit.
+            ArgumentError: If out is not a writeable matrix or can not hold the dtype of the result.
+        """
+        if out is None:
+            return self - other
+        self._check_operand(other, "Only a matrix can be subtracted to a matrix.")
+        self._check_out(out, self._data.shape, np.result_type(self._data, other._data))
+        np.subtract(self._data, other._data, out=out._data)
+        return out
+
+    def matmul(self, other: Self, out: Optional[Self] = None) -> Self:
+        """
+        Multiplies the matrix with other (self * other). If out is given, the product is written into out. For int,
+        float and complex matrices this happens without any temporary array. out may be self or other.
+
+        Multiplie la matrice par other (self * other). Si out est donné, le produit est écrit dans out. Pour les
+        matrices d'entiers, de flottants et de complexes cela se fait sans tableau temporaire.
+
+        Args:
+            other (Matrix): The right matrix.
+            out (Optional[Matrix]): A preallocated matrix with the shape (self rows, other columns).
+
+        Returns:
+            The product (Matrix): out if given, otherwise a new matrix.
+
+        Raises:
+            MathError: If other is not a matrix.
+            MathError: If the columns of self do not equal the rows of other.
+            ArgumentError: If out is not a writeable matrix or can not hold the dtype of the result.
+        """
         assertion.assert_type(other, Matrix, MathError, code=MathCodes.NOT_MATRIX,
-                              msg="Only a matrix can be added to a matrix.")
+                              msg="Only a matrix can be multiplied with a matrix.")
+        assertion.assert_equals(self.get_columns(), other.get_rows(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="Columns of self do not equal rows of other.")
+        if out is None:
+            return Matrix.from_numpy(round_product(multiply(self._data, other._data)))
+        dtypes: tuple = tuple(np.int_ if data.dtype.kind == "b" else data.dtype for data in (self._data, other._data))
+        self._check_out(out, (self._rows, other._columns), np.result_type(*dtypes))
+        if self._data.dtype.kind in BLAS_KINDS and other._data.dtype.kind in BLAS_KINDS:
+            np.matmul(self._data, other._data, out=out._data)
+            round_product(out._data, out=out._data)
+        else:
+            round_product(multiply(self._data, other._data), out=out._data)
+        return out
+
+    def _check_operand(self, other: Self, msg: str) -> None:
+        assertion.assert_type(other, Matrix, MathError, code=MathCodes.NOT_MATRIX, msg=msg)
         if self.get_dimension() != other.get_dimension():
             raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
-        matrixA = self.get_components()
-        matrixB = other.get_components()
-        return Matrix(data=list(matrixA + matrixB), rows=self._rows, columns=self._columns)
+
+    def __add__(self, other: Self) -> Self:
+        self._check_operand(other, "Only a matrix can be added to a matrix.")
+        return Matrix.from_numpy(self._data + other._data)
 
     def __radd__(self, other: Self) -> Self:
         return self.__add__(other)
 
     def __iadd__(self, other: Self) -> Self:
-        assertion.assert_type(other, Matrix, MathError, code=MathCodes.NOT_MATRIX,
-                              msg="Only a matrix can be added to a matrix.")
-        if self.get_dimension() != other.get_dimension():
-            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
-        temp: Matrix = self + other
-        self.set_components(temp.get_components())
+        self._check_operand(other, "Only a matrix can be added to a matrix.")
+        self._in_place(np.add, other._data)
         return self
 
     def __sub__(self, other: Self) -> Self:
-        assertion.assert_type(other, Matrix, MathError, code=MathCodes.NOT_MATRIX,
-                              msg="Only a matrix can be subtracted to a matrix.")
-        if self.get_dimension() != other.get_dimension():
-            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
-        matrixA = self.get_components()
-        matrixB = other.get_components()
-        return Matrix(list(matrixA - matrixB), columns=self._columns, rows=self._rows)
+        self._check_operand(other, "Only a matrix can be subtracted to a matrix.")
+        return Matrix.from_numpy(self._data - other._data)
 
     def __rsub__(self, other: Self) -> Self:
         assertion.assert_type(other, Matrix, MathError, code=MathCodes.NOT_MATRIX)
         return other - self
 
     def __isub__(self, other: Self) -> Self:
-        temp: Matrix = self - other
-        self.set_components(temp.get_components())
+        self._check_operand(other, "Only a matrix can be subtracted to a matrix.")
+        self._in_place(np.subtract, other._data)
         return self
 
-    def __mul__(self, other: Union[Self, *TypesTuple.NUMBER.value]) -> Self:
-        assertion.assert_types(other, (Matrix, *TypesTuple.NUMBER.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
-                               msg="Only matrices, int, float can be multiplied to a matrix.")
-        multiplied: Matrix = Matrix()
-
+    def __mul__(self, other: Union[Self, *TypesTuple.SCALAR.value]) -> Self:
+        assertion.assert_types(other, (Matrix, *TypesTuple.SCALAR.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
+                               msg="Only matrices, int, float, complex can be multiplied to a matrix.")
         if isinstance(other, Matrix):
             assertion.assert_equals(self.get_columns(), other.get_rows(), MathError,
                                     code=MathCodes.UNFIT_DIMENSIONS,
                                     msg="Columns of self do not equal rows of other.")
+            return Matrix.from_numpy(round_product(multiply(self._data, other._data)))
+        return Matrix.from_numpy(self._data * other)
 
-            a: list = list(self.get_components())
-            b: list = list(other.get_components())
-            c: list = list()
-            if other.get_rows() == 1:
-                a: np.ndarray = np.array(a)
-                b: np.ndarray = np.array(b)
-                c: list = list(np.dot(a, b))
-            elif self._rows == self._columns:
-                c: list = strassen_multiply(a, b)
-            else:
-                c: list = matrix_multiply_opt(a, b)
-            c_: list = list()
-            for ind, column in enumerate(c):
-                c_.append(list())
-                for row in column:
-                    c_[ind].append(rnd(row))
-            c = c_
-            multiplied.set_components(c)
-
-        if isinstance(other, TypesTuple.NUMBER.value):
-            temp: list = list()
-            if self._rows > 1:
-                for column_index, column in enumerate(self._data):
-                    temp.append(list())
-                    for component in self._data[column_index]:
-                        temp[column_index].append(component * other)
-            else:
-                for component in self._data:
-                    temp.append([component * other])
-            multiplied.set_components(temp)
-        return multiplied
-
-    def __rmul__(self, other: Union[Self, *TypesTuple.NUMBER.value]) -> Self:
-        assertion.assert_types(other, (Matrix, *TypesTuple.NUMBER.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
-                               msg="Only matrices, int, float can be multiplied to a matrix.")
-        multiplied: Matrix = Matrix()
-
+    def __rmul__(self, other: Union[Self, *TypesTuple.SCALAR.value]) -> Self:
+        assertion.assert_types(other, (Matrix, *TypesTuple.SCALAR.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
+                               msg="Only matrices, int, float, complex can be multiplied to a matrix.")
         if isinstance(other, Matrix):
             assertion.assert_equals(other.get_columns(), self.get_rows(), MathError,
                                     code=MathCodes.UNFIT_DIMENSIONS,
                                     msg="Rows of self do not equal columns of other.")
+            return Matrix.from_numpy(round_product(multiply(other._data, self._data)))
+        return Matrix.from_numpy(self._data * other)
 
-            b: list = list(self.get_components())
-            a: list = list(other.get_components())
-            c: list = list()
-            if self._rows == self._columns:
-                c: list = strassen_multiply(a, b)
-            else:
-                c: list = matrix_multiply_opt(a, b)
-            multiplied.set_components(c)
-
-        if isinstance(other, TypesTuple.NUMBER.value):
-            temp: list = list()
-            if self._rows > 1:
-                for column_index, column in enumerate(self._data):
-                    temp.append(list())
-                    for component in self._data[column_index]:
-                        temp[column_index].append(component * other)
-            else:
-                for component in self._data:
-                    temp.append([component * other])
-            multiplied.set_components(temp)
-        return multiplied
-
-    def __imul__(self, other: Union[Self, *TypesTuple.NUMBER.value]) -> Self:
-        assertion.assert_types(other, (Matrix, *TypesTuple.NUMBER.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
-                               msg="Only matrices, int, float can be multiplied to a matrix.")
+    def __imul__(self, other: Union[Self, *TypesTuple.SCALAR.value]) -> Self:
+        assertion.assert_types(other, (Matrix, *TypesTuple.SCALAR.value), MathError, code=MathCodes.NOT_MATRIX_NUMBER,
+                               msg="Only matrices, int, float, complex can be multiplied to a matrix.")
 
         if isinstance(other, Matrix):
-            multiplied: Matrix = self * other
-            self.set_components(multiplied.get_components())
-
-        if isinstance(other, TypesTuple.NUMBER.value):
-            multiplied: Matrix = self * other
-            self.set_components(multiplied.get_components())
+            assertion.assert_equals(self.get_columns(), other.get_rows(), MathError,
+                                    code=MathCodes.UNFIT_DIMENSIONS,
+                                    msg="Columns of self do not equal rows of other.")
+            self._assign(round_product(multiply(self._data, other._data)))
+        else:
+            self._in_place(np.multiply, other)
         return self
 
-    def __truediv__(self, other: Number) -> Self:
-        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError,
+    def __truediv__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError,
                                code=MathCodes.NOT_NUMBER)
         assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
         return self * (1/other)
 
-    def __itruediv__(self, other: Number) -> Self:
-        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError,
+    def __itruediv__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError,
                                code=MathCodes.NOT_NUMBER)
-        dived: Matrix = self / other
-        self.set_components(dived.get_components())
+        assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
+        self._in_place(np.multiply, 1/other)
         return self
 
-    def __pow__(self, power: Int, modulo=None) -> Self:
-        assertion.assert_false(modulo, MathCodes, code=MathCodes.NOT_FALSE, msg="Modulo not defined.")
-        assertion.assert_types(power, TypesTuple.INT.value, MathError, code=MathCodes.NOT_INT)
-        assertion.assert_is_positiv(power, MathError, code=MathCodes.NOT_POSITIV)
-        multiplied: Matrix = self.copy()
-        for _ in range(power-1):
-            multiplied *= self
-        return multiplied
+    def power(self, n: Int, modulo: Optional[Int] = None, method: str = "squaring") -> Self:
+        """
+        Raises the matrix to the power of n.
+
+        "squaring" uses binary exponentiation and needs about 2 * log2(n) multiplications. With modulo every
+        intermediate product is reduced, so integer powers stay bounded (entries that could overflow int64 are
+        computed with python ints).
+        "eigen" diagonalizes the matrix once (A = V * D * V^-1) and only raises the eigenvalues to the power of n.
+        This is the fastest path for very large exponents, but it works in floating point and only for
+        diagonalizable matrices.
+
+        Élève la matrice à la puissance n.
+
+        "squaring" utilise l'exponentiation rapide et nécessite environ 2 * log2(n) multiplications. Avec modulo
+        chaque produit intermédiaire est réduit, de sorte que les puissances entières restent bornées.
+        "eigen" diagonalise la matrice une seule fois (A = V * D * V^-1) et n'élève que les valeurs propres à la
+        puissance n. C'est la voie la plus rapide pour de très grands exposants, mais elle travaille en virgule
+        flottante et seulement pour des matrices diagonalisables.
+
+        Args:
+            n (Int): The exponent. 0 returns the identity matrix.
+            modulo (Optional[Int]): A positive modulus. Only defined for integer matrices and "squaring".
+            method (str): Either "squaring" or "eigen".
+
+        Returns:
+            The power (Matrix)
+
+        Raises:
+            MathError: If n is not a positive int.
+            MathError: If the matrix is not quadratic.
+            MathError: If modulo is not a positive int or the matrix does not hold integers.
+            MathError: If method is "eigen" and the matrix is not diagonalizable.
+            ArgumentError: If method is neither "squaring" nor "eigen".
+        """
+        assertion.assert_types(n, TypesTuple.INT.value, MathError, code=MathCodes.NOT_INT)
+        assertion.assert_is_positiv(n, MathError, code=MathCodes.NOT_POSITIV)
+        assertion.assert_equals(self._rows, self._columns, MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="Only a quadratic matrix can be raised to a power.")
+        assertion.assert_true(method in ("squaring", "eigen"), ArgumentError, code=ArgumentCodes.UNEXPECTED_TYPE,
+                              wrong_argument=method)
+        n = int(n)
+        if modulo is not None:
+            assertion.assert_types(modulo, TypesTuple.INT.value, MathError, code=MathCodes.NOT_INT)
+            assertion.assert_above(modulo, 0, MathError, code=MathCodes.NOT_POSITIV)
+            assertion.assert_equals(method, "squaring", MathError, code=MathCodes.NOT_DEFINED,
+                                    msg="Modulo is only defined for the squaring method.")
+            return Matrix.from_numpy(self._power_modulo(n, int(modulo)))
+        if n == 0:
+            return Matrix.from_numpy(np.eye(self._rows, dtype=self._data.dtype))
+        if method == "eigen":
+            return Matrix.from_numpy(round_product(self._power_eigen(n)))
+        result: Optional[np.ndarray] = None
+        base: np.ndarray = self._data
+        while True:
+            if n & 1:
+                result = base if result is None else multiply(result, base)
+            n >>= 1
+            if n == 0:
+                break
+            base = multiply(base, base)
+        return Matrix.from_numpy(round_product(result), copy=result is self._data)
+
+    def _power_modulo(self, n: int, modulo: int) -> np.ndarray:
+        kind: str = self._data.dtype.kind
+        if kind == "O":
+            assertion.assert_type_list(self._data.ravel(), numbers.Integral, MathError, code=MathCodes.NOT_INT,
+                                       msg="Modulo is only defined for integer matrices.")
+        else:
+            assertion.assert_true(kind in "iub", MathError, code=MathCodes.NOT_INT, wrong_argument=self._data.dtype,
+                                  msg="Modulo is only defined for integer matrices.")
+        # every entry is below modulo after reducing, so a product sums at most rows * (modulo - 1)^2
+        fits: bool = self._rows * (modulo - 1) ** 2 <= np.iinfo(np.int64).max
+        dtype: type = np.int64 if fits else object
+        # reduce before casting: big ints (object) and uint64 entries do not fit into int64 before the modulo
+        data: np.ndarray = self._data
+        if kind in "biu" and data.dtype != np.uint64:
+            data = data.astype(np.int64)
+        if kind != "O" and modulo > np.iinfo(data.dtype).max:
+            data = data.astype(object)
+        base: np.ndarray = np.mod(data, modulo).astype(dtype)
+        result: np.ndarray = np.mod(np.eye(self._rows, dtype=dtype), modulo)
+        while n:
+            if n & 1:
+                result = np.mod(multiply(result, base), modulo)
+            n >>= 1
+            if n:
+                base = np.mod(multiply(base, base), modulo)
+        return result
+
+    def _power_eigen(self, n: int) -> np.ndarray:
+        data: np.ndarray = self._data if self._data.dtype.kind in "fc" else self._data.astype(float)
+        eigenvalues, eigenvectors = np.linalg.eig(data)
+        if np.linalg.cond(eigenvectors) > 1 / np.finfo(float).eps:
+            raise MathError(MathCodes.NOT_DEFINED, "The matrix is not diagonalizable.", self)
+        result: np.ndarray = (eigenvectors * eigenvalues ** n) @ np.linalg.inv(eigenvectors)
+        if data.dtype.kind != "c":
+            result = np.real_if_close(result, tol=1e6)
+        return result
+
+    def __pow__(self, power: Int, modulo: Optional[Int] = None) -> Self:
+        return self.power(power, modulo)
 
     def __ipow__(self, other: Int) -> Self:
         multiplied: Matrix = self ** other
-        self.set_components(multiplied.get_components())
+        self._assign(multiplied._data)
         return self
 
     def __str__(self) -> str:
@@ -650,7 +1428,7 @@ class Matrix:
         return f"Matrix at {hex(id(self))} with:\n {self._data}"
 
     def __iter__(self) -> iter:
-        return iter(list(self.get_components()))
+        return iter(self.get_components(copy=False))
 
     def __getitem__(self, item: Int) -> np.ndarray:
         assertion.assert_types(item, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
@@ -0,0 +1,264 @@
+from typing import Self, Union, Iterable, Iterator
+
+import numpy as np
+
+from pylix.algebra.matrix import Matrix, Axis, round_product, rotations_2D, rotations_3D, rotate
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion, TypesTuple
+from pylix.types import Int, Number, DType, Lists
+
+
+class MatrixBatch:
+    """
+    A stack of N matrices of the same dimension, held in one contiguous (N, rows, columns) ndarray. Every operation
+    works on the whole stack in one vectorized call instead of N python calls. Indexing returns Matrix views into the
+    stack, so changing such a matrix changes the batch.
+
+    Une pile de N matrices de même dimension, stockée dans un seul ndarray contigu (N, lignes, colonnes). Chaque
+    opération agit sur toute la pile en un seul appel vectorisé. L'indexation renvoie des vues Matrix de la pile.
+
+    Attributes:
+        _data (np.ndarray): A NumPy array with the shape (N, rows, columns) holding the matrices.
+    """
+    def __init__(self, data: Union[Iterable[Matrix], np.ndarray]):
+        """
+        Creates a batch of matrices.
+
+        Crée une pile de matrices.
+
+        Args:
+            data (Union[Iterable[Matrix], np.ndarray]): Either an array with the shape (N, rows, columns) or an
+                iterable of matrices which all have the same dimension.
+
+        Raises:
+            ArgumentError: If data is neither an ndarray nor an iterable.
+            ArgumentError: If data is an ndarray which is not 3D.
+            ArgumentError: If an element of data is not a Matrix.
+            ArgumentError: If the matrices do not have the same dimension.
+            ArgumentError: If data is empty.
+        """
+        assertion.assert_type(data, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+        if isinstance(data, np.ndarray):
+            assertion.assert_equals(data.ndim, 3, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+            self._data: np.ndarray = np.ascontiguousarray(data)
+        else:
+            matrices: list = list(data)
+            assertion.assert_above(len(matrices), 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+            assertion.assert_type_list(matrices, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+            dimension: tuple = matrices[0].get_dimension()
+            for matrix in matrices:
+                assertion.assert_equals(matrix.get_dimension(), dimension, ArgumentError,
+                                        code=ArgumentCodes.MISMATCH_DIMENSION)
+            self._data: np.ndarray = np.stack([matrix._data for matrix in matrices])
+        assertion.assert_above(len(self._data), 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+
+    @classmethod
+    def _wrap(cls, data: np.ndarray) -> Self:
+        batch: MatrixBatch = cls.__new__(cls)
+        batch._data = data
+        return batch
+
+    @classmethod
+    def create_rotation_matrices_2D(cls, thetas: Iterable[Number], dtype: DType = float) -> Self:
+        """
+        Creates one rotation matrix (counterclockwise) for 2D vectors per angle, all in one vectorized pass.
+
+        Crée une matrice de rotation (anti-horaire) pour des vecteurs 2D par angle, en une seule passe vectorisée.
+
+        Args:
+            thetas (Iterable[Number]): N angles of rotation in degree.
+            dtype (DType): A float or complex dtype for the components. default = float
+
+        Returns:
+            The rotation matrices (MatrixBatch): A batch of N 2 x 2 matrices.
+
+        Raises:
+            ArgumentError: If thetas is not a 1D iterable of numbers or is empty.
+            ArgumentError: If an angle is smaller 0 or bigger 360.
+            ArgumentError: If dtype is not a float or complex dtype.
+        """
+        return cls(rotations_2D(thetas, dtype))
+
+    @classmethod
+    def create_rotation_matrices_3D(cls, thetas: Iterable[Number], axes: Union[Axis, Iterable[Axis]],
+                                    dtype: DType = float) -> Self:
+        """
+        Creates one rotation matrix (counterclockwise) for 3D vectors per angle, all in one vectorized pass.
+
+        Crée une matrice de rotation (anti-horaire) pour des vecteurs 3D par angle, en une seule passe vectorisée.
+
+        Args:
+            thetas (Iterable[Number]): N angles of rotation in degree.
+            axes (Union[Axis, Iterable[Axis]]): One axis for all angles or one axis per angle.
+            dtype (DType): A float or complex dtype for the components. default = float
+
+        Returns:
+            The rotation matrices (MatrixBatch): A batch of N 3 x 3 matrices.
+
+        Raises:
+            ArgumentError: If thetas is not a 1D iterable of numbers or is empty.
+            ArgumentError: If an angle is smaller 0 or bigger 360.
+            ArgumentError: If axes is neither an Axis nor one Axis per angle.
+            ArgumentError: If dtype is not a float or complex dtype.
+        """
+        return cls(rotations_3D(thetas, axes, dtype))
+
+    def get_size(self) -> int:
+        return self._data.shape[0]
+
+    def get_rows(self) -> int:
+        return self._data.shape[1]
+
+    def get_columns(self) -> int:
+        return self._data.shape[2]
+
+    def get_dimension(self) -> tuple:
+        """
+        Returns the dimension of every matrix in the batch (rows, columns).
+
+        Renvoie la dimension de chaque matrice de la pile (lignes, colonnes).
+        """
+        return self._data.shape[1], self._data.shape[2]
+
+    def get_components(self) -> np.ndarray:
+        return self._data.copy()
+
+    def to_matrices(self) -> list[Matrix]:
+        """
+        Returns the batch as a list of independent matrices (copies).
+
+        Renvoie la pile sous forme de liste de matrices indépendantes (copies).
+        """
+        return [Matrix._wrap(matrix.copy()) for matrix in self._data]
+
+    def copy(self) -> Self:
+        return MatrixBatch._wrap(self._data.copy())
+
+    def get_determinants(self) -> np.ndarray:
+        """
+        Computes the determinant of every matrix in the batch in one call.
+
+        Calcule le déterminant de chaque matrice de la pile en un seul appel.
+
+        Returns:
+            The determinants (np.ndarray): An array with the shape (N,).
+
+        Raises:
+            MathError: If the matrices are not quadratic.
+        """
+        assertion.assert_equals(self.get_rows(), self.get_columns(), MathError, code=MathCodes.UNFIT_DIMENSIONS)
+        return np.linalg.det(self._data)
+
+    def get_invers(self) -> Self:
+        """
+        Creates the inverse of every matrix in the batch in one call.
+
+        Crée la matrice inverse de chaque matrice de la pile en un seul appel.
+
+        Returns:
+            The inverse matrices (MatrixBatch)
+
+        Raises:
+            MathError: If the matrices are not quadratic.
+            MathError: If at least one matrix is singular.
+        """
+        determinants: np.ndarray = self.get_determinants()
+        singular: np.ndarray = np.flatnonzero(determinants == 0)
+        if len(singular) > 0:
+            raise MathError(MathCodes.NOT_DEFINED, "The matrices at these indices are singular.",
+                            singular.tolist())
+        return MatrixBatch._wrap(np.linalg.inv(self._data))
+
+    def apply_rotation(self, points: Union[Lists, np.ndarray]) -> np.ndarray:
+        """
+        Applies the i-th matrix to the i-th point (points (N, d)) or to the i-th point cloud (points (N, M, d)), all
+        in one einsum call.
+
+        Applique la i-ème matrice au i-ème point ou au i-ème nuage de points, en un seul appel einsum.
+
+        Args:
+            points (Union[Lists, np.ndarray]): An array with the shape (N, d) or (N, M, d), d = columns.
+
+        Returns:
+            The transformed points (np.ndarray): An array with the shape of points.
+
+        Raises:
+            ArgumentError: If points do not hold numbers.
+            MathError: If points do not have N rows or d coordinates.
+        """
+        return rotate(self._data, points)
+
+    def _operand(self, other: Union[Self, Matrix], msg: str) -> np.ndarray:
+        assertion.assert_types(other, (MatrixBatch, Matrix), MathError, code=MathCodes.NOT_MATRIX, msg=msg)
+        if isinstance(other, MatrixBatch):
+            assertion.assert_equals(other.get_size(), self.get_size(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                    msg="The batches do not have the same size.")
+        if other.get_dimension() != self.get_dimension():
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
+        return other._data
+
+    def __add__(self, other: Union[Self, Matrix]) -> Self:
+        b: np.ndarray = self._operand(other, "Only a batch or a matrix can be added to a batch.")
+        return MatrixBatch._wrap(self._data + b)
+
+    def __sub__(self, other: Union[Self, Matrix]) -> Self:
+        b: np.ndarray = self._operand(other, "Only a batch or a matrix can be subtracted from a batch.")
+        return MatrixBatch._wrap(self._data - b)
+
+    def __mul__(self, other: Union[Self, Matrix, *TypesTuple.NUMBER.value]) -> Self:
+        assertion.assert_types(other, (MatrixBatch, Matrix, *TypesTuple.NUMBER.value), MathError,
+                               code=MathCodes.NOT_MATRIX_NUMBER,
+                               msg="Only batches, matrices, int, float can be multiplied to a batch.")
+        if isinstance(other, TypesTuple.NUMBER.value):
+            return MatrixBatch._wrap(self._data * other)
+        assertion.assert_equals(self.get_columns(), other.get_rows(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="Columns of self do not equal rows of other.")
+        if isinstance(other, MatrixBatch):
+            assertion.assert_equals(other.get_size(), self.get_size(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                    msg="The batches do not have the same size.")
+        return MatrixBatch._wrap(round_product(self._data @ other._data))
+
+    def __rmul__(self, other: Number) -> Self:
+        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError, code=MathCodes.NOT_NUMBER,
+                               msg="Only int, float can be multiplied to a batch from the left.")
+        return MatrixBatch._wrap(self._data * other)
+
+    def __truediv__(self, other: Number) -> Self:
+        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError, code=MathCodes.NOT_NUMBER)
+        assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
+        return MatrixBatch._wrap(self._data / other)
+
+    def __eq__(self, other: Union[Self, np.ndarray]) -> bool:
+        if isinstance(other, MatrixBatch):
+            other = other._data
+        if not isinstance(other, np.ndarray):
+            return False
+        return self._data.shape == other.shape and bool(np.all(self._data == other))
+
+    def __getitem__(self, item: Union[Int, slice]) -> Union[Matrix, Self]:
+        assertion.assert_types(item, (*TypesTuple.INT.value, slice), ArgumentError, code=ArgumentCodes.NOT_INT)
+        if isinstance(item, slice):
+            return MatrixBatch._wrap(self._data[item])
+        assertion.assert_range(item, -len(self._data), len(self._data) - 1, ArgumentError,
+                               code=ArgumentCodes.OUT_OF_RANGE)
+        return Matrix._wrap(self._data[item])
+
+    def __setitem__(self, index: Int, value: Matrix) -> None:
+        assertion.assert_types(index, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(index, -len(self._data), len(self._data) - 1, ArgumentError,
+                               code=ArgumentCodes.OUT_OF_RANGE)
+        assertion.assert_type(value, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+        assertion.assert_equals(value.get_dimension(), self.get_dimension(), ArgumentError,
+                                code=ArgumentCodes.MISMATCH_DIMENSION)
+        self._data[index] = value._data
+
+    def __iter__(self) -> Iterator[Matrix]:
+        return (Matrix._wrap(matrix) for matrix in self._data)
+
+    def __len__(self) -> int:
+        return self.get_size()
+
+    def __str__(self) -> str:
+        return f"{self._data}"
+
+    def __repr__(self) -> str:
+        return f"MatrixBatch at {hex(id(self))} with:\n {self._data}"
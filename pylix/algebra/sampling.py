@@ -0,0 +1,325 @@
+"""
+Sampling of indices from a discrete distribution. AliasSampler implements Walker's alias method (with Vose's
+construction): the table is built once in O(n), afterwards every draw costs O(1) - one uniform index and one uniform
+number - and k draws are done in one vectorized call.
+
+Échantillonnage d'indices d'une distribution discrète. AliasSampler implémente la méthode des alias de Walker
+(construction de Vose) : la table est construite une fois en O(n), ensuite chaque tirage coûte O(1) et k tirages sont
+faits en un seul appel vectorisé.
+
+Every random function of pylix takes an rng argument: a numpy Generator, a seed (int or SeedSequence) for a
+reproducible stream, or None for the default generator of the current thread. spawn_rngs creates independent,
+non-overlapping streams for parallel workers.
+
+Chaque fonction aléatoire de pylix accepte un argument rng : un Generator numpy, une graine (int ou SeedSequence)
+ou None pour le générateur par défaut du thread courant. spawn_rngs crée des flux indépendants pour des workers
+parallèles.
+"""
+import threading
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from pylix.algebra.statics import round_step
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion, TypesTuple
+from pylix.types import Number, Int, Seed
+
+_local: threading.local = threading.local()
+
+
+def to_rng(rng: Seed = None) -> np.random.Generator:
+    """
+    Returns the generator for an rng argument. A Generator is used as it is (and advanced by the caller), a seed
+    creates a new reproducible Generator and None returns the default generator of the current thread.
+
+    Renvoie le générateur pour un argument rng. Un Generator est utilisé tel quel, une graine crée un nouveau
+    Generator reproductible et None renvoie le générateur par défaut du thread courant.
+
+    Args:
+        rng (Seed): A numpy Generator, an int or SeedSequence seed, or None. default = None
+
+    Returns:
+        The generator (np.random.Generator)
+
+    Raises:
+        ArgumentError: If rng is neither None, a seed nor a Generator.
+    """
+    if rng is None:
+        if not hasattr(_local, "rng"):
+            _local.rng = np.random.default_rng()
+        return _local.rng
+    if isinstance(rng, np.random.Generator):
+        return rng
+    if isinstance(rng, TypesTuple.INT.value):
+        assertion.assert_is_positiv(rng, ArgumentError, code=ArgumentCodes.NOT_RNG)
+        return np.random.default_rng(int(rng))
+    assertion.assert_type(rng, np.random.SeedSequence, ArgumentError, code=ArgumentCodes.NOT_RNG)
+    return np.random.default_rng(rng)
+
+def spawn_rngs(rng: Seed, n: Int) -> list[np.random.Generator]:
+    """
+    Creates n independent generators, e.g. one per parallel worker. The streams do not overlap and the same seed
+    always gives the same n streams.
+
+    Crée n générateurs indépendants, p. ex. un par worker parallèle. Les flux ne se chevauchent pas et la même graine
+    donne toujours les mêmes n flux.
+
+    Args:
+        rng (Seed): A seed (int or SeedSequence), a Generator which is spawned from, or None for fresh entropy.
+        n (Int): The number of generators.
+
+    Returns:
+        The generators (list[np.random.Generator])
+
+    Raises:
+        ArgumentError: If rng is neither None, a seed nor a Generator.
+        ArgumentError: If n is not an int or negative.
+    """
+    assertion.assert_types(n, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+    assertion.assert_is_positiv(n, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+    if isinstance(rng, np.random.Generator):
+        return rng.spawn(int(n))
+    if rng is not None and not isinstance(rng, np.random.SeedSequence):
+        assertion.assert_types(rng, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_RNG)
+        assertion.assert_is_positiv(rng, ArgumentError, code=ArgumentCodes.NOT_RNG)
+        rng = np.random.SeedSequence(int(rng))
+    sequence: np.random.SeedSequence = np.random.SeedSequence() if rng is None else rng
+    return [np.random.default_rng(child) for child in sequence.spawn(int(n))]
+
+
+def heat_probabilities(weights: Union[Iterable[Number], np.ndarray], heat: Number = 0) -> np.ndarray:
+    """
+    Normalizes weights to probabilities and applies the heat (see Vector.rand_choice).
+
+    Normalise des poids en probabilités et applique la chaleur (voir Vector.rand_choice).
+
+    - if heat = -1: Only the max can be chosen.
+    - if heat =  0: Uses the probability.
+    - if heat =  1: Flattens the distribution (temperature 5).
+
+    Args:
+        weights (Union[Iterable[Number], np.ndarray]): Non negative weights, at least one above 0.
+        heat (Number): Changes the distribution. default = 0
+
+    Returns:
+        The probabilities (np.ndarray): A 1D float array which sums up to 1.
+
+    Raises:
+        ArgumentError: If heat is not a number or not in [-1; 1].
+        ArgumentError: If the weights are not a non empty 1D iterable of numbers.
+        MathError: If a weight is negative or all weights are 0.
+    """
+    assertion.assert_types(heat, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+    assertion.assert_range(heat, -1, 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+    assertion.assert_type(weights, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+    probs: np.ndarray = np.asarray(weights)
+    assertion.assert_equals(probs.ndim, 1, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+    assertion.assert_above(len(probs), 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+    assertion.assert_true(probs.dtype.kind in "biuf", ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                          wrong_argument=probs.dtype)
+    probs = probs.astype(float)
+    assertion.assert_true(bool(np.all(probs >= 0)), MathError, code=MathCodes.NOT_POSITIV, wrong_argument=probs)
+    total: float = float(probs.sum())
+    assertion.assert_not_zero(total, MathError, code=MathCodes.ZERO, msg="At least one weight has to be above 0.")
+
+    if np.any(probs >= 1) or total != 1:
+        probs = round_step(probs / total)
+
+    heat = float(heat)
+    if heat == -1:
+        one_hot: np.ndarray = np.zeros(len(probs))
+        one_hot[np.argmax(probs)] = 1
+        return one_hot
+    if heat == 0:
+        return probs
+
+    temp: float = 1 / (1 - heat) if heat < 0 else 1 + 4 * heat
+    scaled: np.ndarray = np.exp(np.log(probs + 1e-9) / temp)
+    return scaled / np.sum(scaled)
+
+
+def _heats(heat: Union[Number, Iterable[Number]], n: int) -> np.ndarray:
+    if isinstance(heat, TypesTuple.NUMBER.value):
+        heats: np.ndarray = np.full(n, float(heat))
+    else:
+        assertion.assert_type(heat, Iterable, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        heats: np.ndarray = np.asarray(heat)
+        assertion.assert_true(heats.dtype.kind in "biuf", ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                              wrong_argument=heats.dtype)
+        assertion.assert_equals(heats.shape, (n,), ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        heats = heats.astype(float)
+    assertion.assert_true(bool(np.all((heats >= -1) & (heats <= 1))), ArgumentError, code=ArgumentCodes.OUT_OF_RANGE,
+                          wrong_argument=heat)
+    return heats
+
+def _scores(values: np.ndarray, logits: bool) -> np.ndarray:
+    if logits:
+        assertion.assert_true(not np.any(np.isnan(values) | np.isposinf(values)), MathError,
+                              code=MathCodes.NOT_NUMBER, msg="The logits have to be finite or -inf.")
+        scores: np.ndarray = values.astype(float)
+    else:
+        assertion.assert_true(bool(np.all(values >= 0)), MathError, code=MathCodes.NOT_POSITIV, wrong_argument=values)
+        with np.errstate(divide="ignore"):
+            scores: np.ndarray = np.log(values.astype(float))
+    empty: np.ndarray = np.flatnonzero(np.all(np.isneginf(scores), axis=1))
+    if len(empty) > 0:
+        raise MathError(MathCodes.ZERO, "The rows at these indices do not have a weight above 0.", empty.tolist())
+    return scores
+
+def sample_batch(values: Union[Iterable[Iterable[Number]], np.ndarray], heat: Union[Number, Iterable[Number]] = 0,
+                 logits: bool = False, top_k: Optional[Int] = None, top_p: Optional[Number] = None,
+                 rng: Seed = None) -> np.ndarray:
+    """
+    Draws one index per row of an (N, k) matrix of probabilities (or logits) in one vectorized pass with the
+    Gumbel-max trick: argmax(log(p) / temperature + Gumbel noise) is distributed like the tempered distribution,
+    so no row has to be normalized or sampled on its own. The heat works like in Vector.rand_choice: -1 takes the
+    max, 0 uses the probabilities and 1 flattens them (temperature 5). Entries with the probability 0 (logit -inf)
+    are never drawn.
+
+    Tire un indice par ligne d'une matrice (N, k) de probabilités (ou de logits) en une seule passe vectorisée avec
+    l'astuce Gumbel-max : argmax(log(p) / température + bruit de Gumbel) suit la distribution tempérée, aucune ligne
+    n'est donc normalisée ou tirée séparément. La chaleur fonctionne comme dans Vector.rand_choice.
+
+    Args:
+        values (Union[Iterable[Iterable[Number]], np.ndarray]): N rows of k non negative weights (they do not have
+            to sum up to 1) or, with logits, of k log-weights.
+        heat (Union[Number, Iterable[Number]]): One heat in [-1; 1] for all rows or one per row. default = 0
+        logits (bool): Are the values logits? default = False
+        top_k (Optional[Int]): Only the k most likely indices of a row can be drawn. default = None
+        top_p (Optional[Number]): Only the most likely indices whose tempered probabilities sum up to top_p (in
+            (0; 1]) can be drawn (nucleus sampling). default = None
+        rng (Seed): The random generator or a seed (see to_rng). default = None
+
+    Returns:
+        The indices (np.ndarray): An int array with the shape (N,).
+
+    Raises:
+        ArgumentError: If values is not a non empty 2D array of numbers.
+        ArgumentError: If heat is not a number / N numbers in [-1; 1].
+        ArgumentError: If top_k is not an int in [1; k] or top_p not a number in (0; 1].
+        ArgumentError: If rng is neither None, a seed nor a Generator.
+        MathError: If a probability is negative, a logit is nan or +inf, or a row has no weight above 0.
+    """
+    assertion.assert_type(values, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+    assertion.assert_type(logits, bool, ArgumentError, code=ArgumentCodes.NOT_BOOl)
+    data: np.ndarray = np.asarray(values)
+    assertion.assert_equals(data.ndim, 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+    assertion.assert_true(data.size > 0, ArgumentError, code=ArgumentCodes.TOO_SMALL, wrong_argument=data.shape)
+    assertion.assert_true(data.dtype.kind in "biuf", ArgumentError, code=ArgumentCodes.NOT_NUMBER,
+                          wrong_argument=data.dtype)
+    n, k = data.shape
+    heats: np.ndarray = _heats(heat, n)
+    scores: np.ndarray = _scores(data, logits)
+
+    # heat -> temperature like heat_probabilities; heat -1 is the plain argmax (temperature 0, no noise)
+    greedy: np.ndarray = heats == -1
+    temperature: np.ndarray = np.where(heats < 0, 1 / (1 - np.minimum(heats, 0)), 1 + 4 * heats)
+    scores /= temperature[:, np.newaxis]
+
+    if top_k is not None:
+        assertion.assert_types(top_k, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(top_k, 1, k, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        # exactly top_k indices per row survive, ties with the k-th score are cut as well
+        kept: np.ndarray = np.argpartition(-scores, int(top_k) - 1, axis=1)[:, :int(top_k)]
+        top: np.ndarray = np.full_like(scores, -np.inf)
+        np.put_along_axis(top, kept, np.take_along_axis(scores, kept, axis=1), axis=1)
+        scores = top
+    if top_p is not None:
+        assertion.assert_types(top_p, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        assertion.assert_true(0 < top_p <= 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE, wrong_argument=top_p)
+        order: np.ndarray = np.argsort(-scores, axis=1)
+        ordered: np.ndarray = np.take_along_axis(scores, order, axis=1)
+        probabilities: np.ndarray = np.exp(ordered - ordered[:, :1])
+        probabilities /= probabilities.sum(axis=1, keepdims=True)
+        # keep an index if the indices before it do not reach top_p yet, the most likely one is always kept
+        drop: np.ndarray = np.cumsum(probabilities, axis=1) - probabilities >= top_p
+        np.put_along_axis(scores, order, np.where(drop, -np.inf, ordered), axis=1)
+
+    noise: np.ndarray = to_rng(rng).gumbel(size=(n, k))
+    noise[greedy] = 0
+    return np.argmax(scores + noise, axis=1)
+
+
+class AliasSampler:
+    """
+    Draws indices from a fixed discrete distribution in O(1) per draw (Walker's alias method). Index i is returned
+    with the probability get_probabilities()[i]. Build it once (e.g. with Vector.sampler()) and draw many times.
+
+    Tire des indices d'une distribution discrète fixe en O(1) par tirage (méthode des alias de Walker).
+
+    Attributes:
+        _probabilities (np.ndarray): The distribution which is sampled.
+        _probability (np.ndarray): For column i, the probability to keep i instead of taking its alias.
+        _alias (np.ndarray): For column i, the index which is taken otherwise.
+    """
+    def __init__(self, weights: Union[Iterable[Number], np.ndarray], heat: Number = 0):
+        """
+        Builds the alias table in O(n).
+
+        Construit la table des alias en O(n).
+
+        Args:
+            weights (Union[Iterable[Number], np.ndarray]): Non negative weights, at least one above 0.
+            heat (Number): Changes the distribution (see heat_probabilities). default = 0
+
+        Raises:
+            ArgumentError: If heat is not a number or not in [-1; 1].
+            ArgumentError: If the weights are not a non empty 1D iterable of numbers.
+            MathError: If a weight is negative or all weights are 0.
+        """
+        probabilities: np.ndarray = heat_probabilities(weights, heat)
+        n: int = len(probabilities)
+        scaled: np.ndarray = probabilities * (n / probabilities.sum())
+        probability: np.ndarray = np.ones(n)
+        alias: np.ndarray = np.arange(n)
+        small: list = np.flatnonzero(scaled < 1).tolist()
+        large: list = np.flatnonzero(scaled >= 1).tolist()
+        # Vose: pair every column below 1 with a column above 1, which donates the missing mass
+        while small and large:
+            less: int = small.pop()
+            more: int = large[-1]
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(large.pop())
+        # the rest is 1 up to rounding errors
+        self._probabilities: np.ndarray = probabilities
+        self._probability: np.ndarray = probability
+        self._alias: np.ndarray = alias
+
+    def get_probabilities(self) -> np.ndarray:
+        return self._probabilities.copy()
+
+    def draw(self, k: Optional[Int] = None, rng: Seed = None) -> Union[int, np.ndarray]:
+        """
+        Draws indices in O(1) each.
+
+        Tire des indices en O(1) chacun.
+
+        Args:
+            k (Optional[Int]): The number of draws. default = None (one draw)
+            rng (Seed): The random generator or a seed (see to_rng). default = None
+
+        Returns:
+            The index (int) if k is None, else the indices (np.ndarray) with the shape (k,).
+
+        Raises:
+            ArgumentError: If k is not an int or negative.
+            ArgumentError: If rng is neither None, a seed nor a Generator.
+        """
+        generator: np.random.Generator = to_rng(rng)
+        if k is None:
+            column: int = int(generator.integers(len(self._alias)))
+            return column if generator.random() < self._probability[column] else int(self._alias[column])
+        assertion.assert_types(k, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_is_positiv(k, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+        columns: np.ndarray = generator.integers(len(self._alias), size=int(k))
+        keep: np.ndarray = generator.random(int(k)) < self._probability[columns]
+        return np.where(keep, columns, self._alias[columns])
+
+    def __len__(self) -> int:
+        return len(self._alias)
+
+    def __repr__(self) -> str:
+        return f"AliasSampler at {hex(id(self))} over {len(self)} indices"
@@ -0,0 +1,468 @@
+from typing import Self, Union, Optional, Iterable, TYPE_CHECKING
+
+import numpy as np
+
+from pylix.algebra.matrix import Matrix, NUMERIC_KINDS, round_product, to_mask
+from pylix.algebra.statics import round_output
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion, TypesTuple
+from pylix.types import Int, Number, AllLists
+
+if TYPE_CHECKING:
+    from pylix.algebra.vector import Vector
+
+
+def _index_array(indices: Iterable[Int], length: int, code: ArgumentCodes) -> np.ndarray:
+    indices: np.ndarray = np.asarray(indices)
+    if indices.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    assertion.assert_equals(indices.ndim, 1, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+    assertion.assert_true(indices.dtype.kind in "iu", ArgumentError, code=ArgumentCodes.NOT_INT,
+                          wrong_argument=indices.dtype)
+    assertion.assert_range(int(indices.min()), 0, length - 1, ArgumentError, code=code)
+    assertion.assert_range(int(indices.max()), 0, length - 1, ArgumentError, code=code)
+    return indices.astype(np.int64, copy=False)
+
+
+class SparseMatrix:
+    """
+    A matrix which only stores its non-zero components in the compressed sparse row (CSR) format. Memory and the
+    time of every operation scale with the number of stored components (nnz) instead of rows * columns. It offers
+    the interface of Matrix: +, -, scalar, matrix and vector multiplication, indexing, reductions and where.
+    Entries can be given in the coordinate (COO) format, duplicates are summed up.
+
+    Une matrice qui ne stocke que ses composants non nuls au format CSR (lignes compressées). La mémoire et le temps
+    de chaque opération dépendent du nombre de composants stockés (nnz) et non de lignes * colonnes. Elle offre
+    l'interface de Matrix. Les entrées peuvent être données au format de coordonnées (COO), les doublons sont
+    additionnés.
+
+    Attributes:
+        _indptr (np.ndarray): Row i holds the stored components _indptr[i]:_indptr[i + 1]. Shape (rows + 1,).
+        _indices (np.ndarray): The column of every stored component, sorted within a row. Shape (nnz,).
+        _values (np.ndarray): The value of every stored component. Shape (nnz,).
+        _rows (int): The number of rows in the matrix.
+        _columns (int): The number of columns in the matrix.
+    """
+    def __init__(self, data: Union[Iterable[Iterable[Number]], Matrix] = None, rows: Int = 2, columns: Int = 2):
+        """
+        Creates a sparse matrix from dense data or an empty (zero) matrix.
+
+        Crée une matrice creuse à partir de données denses ou une matrice nulle.
+
+        Args:
+            data (Union[Iterable[Iterable[Number]], Matrix]): A 2D array or a Matrix. The zeros are not stored.
+            rows (Int): The number of rows if no data is given. default = 2
+            columns (Int): The number of columns if no data is given. default = 2
+
+        Raises:
+            ArgumentError: If rows or columns are not positive ints.
+            ArgumentError: If data is not a valid 2D array of numbers.
+        """
+        if data is None:
+            assertion.assert_types(rows, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+            assertion.assert_types(columns, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+            assertion.assert_above(rows, 0, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+            assertion.assert_above(columns, 0, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+            self._set_csr(np.zeros(int(rows) + 1, dtype=np.int64), np.zeros(0, dtype=np.int64),
+                          np.zeros(0, dtype=int), (int(rows), int(columns)))
+            return
+        if not isinstance(data, Matrix):
+            data = Matrix(data)
+        dense: np.ndarray = data._data
+        row_indices, column_indices = np.nonzero(dense)
+        self._set_coo(row_indices, column_indices, dense[row_indices, column_indices], dense.shape)
+
+    def _set_csr(self, indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, shape: tuple) -> None:
+        self._indptr: np.ndarray = indptr
+        self._indices: np.ndarray = indices
+        self._values: np.ndarray = values
+        self._rows: int = shape[0]
+        self._columns: int = shape[1]
+
+    def _set_coo(self, row_indices: np.ndarray, column_indices: np.ndarray, values: np.ndarray,
+                 shape: tuple) -> None:
+        # sorts row-major, sums duplicates and drops zeros
+        if len(values) > 0:
+            order: np.ndarray = np.lexsort((column_indices, row_indices))
+            row_indices, column_indices, values = row_indices[order], column_indices[order], values[order]
+            first: np.ndarray = np.ones(len(values), dtype=bool)
+            first[1:] = (row_indices[1:] != row_indices[:-1]) | (column_indices[1:] != column_indices[:-1])
+            if not first.all():
+                starts: np.ndarray = np.flatnonzero(first)
+                values = np.add.reduceat(values, starts)
+                row_indices, column_indices = row_indices[starts], column_indices[starts]
+            keep: np.ndarray = values != 0
+            row_indices, column_indices, values = row_indices[keep], column_indices[keep], values[keep]
+        indptr: np.ndarray = np.zeros(shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(row_indices, minlength=shape[0]), out=indptr[1:])
+        self._set_csr(indptr, column_indices.astype(np.int64, copy=False), values, shape)
+
+    @classmethod
+    def _wrap_coo(cls, row_indices: np.ndarray, column_indices: np.ndarray, values: np.ndarray,
+                  shape: tuple) -> Self:
+        matrix: SparseMatrix = cls.__new__(cls)
+        matrix._set_coo(row_indices, column_indices, values, shape)
+        return matrix
+
+    @classmethod
+    def _wrap_csr(cls, indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, shape: tuple) -> Self:
+        matrix: SparseMatrix = cls.__new__(cls)
+        matrix._set_csr(indptr, indices, values, shape)
+        return matrix
+
+    @classmethod
+    def from_coo(cls, row_indices: Iterable[Int], column_indices: Iterable[Int], values: Iterable[Number],
+                 shape: tuple) -> Self:
+        """
+        Creates a sparse matrix from coordinates: the component at (row_indices[i], column_indices[i]) is values[i].
+        Components with the same coordinates are summed up.
+
+        Crée une matrice creuse à partir de coordonnées : le composant à (row_indices[i], column_indices[i]) vaut
+        values[i]. Les composants avec les mêmes coordonnées sont additionnés.
+
+        Args:
+            row_indices (Iterable[Int]): The row of every component.
+            column_indices (Iterable[Int]): The column of every component.
+            values (Iterable[Number]): The components.
+            shape (tuple): (rows, columns)
+
+        Returns:
+            The sparse matrix (SparseMatrix)
+
+        Raises:
+            ArgumentError: If shape is not a tuple of two positive ints.
+            ArgumentError: If the three arrays do not have the same length.
+            ArgumentError: If an index is out of range.
+            ArgumentError: If values are not numeric.
+        """
+        assertion.assert_type(shape, tuple, ArgumentError, code=ArgumentCodes.NOT_LISTS_TUPLE)
+        assertion.assert_equals(len(shape), 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        assertion.assert_types_list(shape, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_above(min(shape), 0, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
+        shape = (int(shape[0]), int(shape[1]))
+        row_indices = _index_array(row_indices, shape[0], ArgumentCodes.OUT_OF_RANGE)
+        column_indices = _index_array(column_indices, shape[1], ArgumentCodes.OUT_OF_RANGE)
+        values: np.ndarray = np.asarray(values)
+        if values.size == 0:
+            values = np.zeros(0, dtype=int)
+        assertion.assert_equals(values.ndim, 1, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        assertion.assert_true(values.dtype.kind in NUMERIC_KINDS, ArgumentError,
+                              code=ArgumentCodes.NOT_NUMERIC_DTYPE, wrong_argument=values.dtype)
+        assertion.assert_true(len(row_indices) == len(column_indices) == len(values), ArgumentError,
+                              code=ArgumentCodes.MISMATCH_DIMENSION)
+        return cls._wrap_coo(row_indices, column_indices, values, shape)
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> Self:
+        """
+        Creates a sparse matrix from a dense matrix.
+
+        Crée une matrice creuse à partir d'une matrice dense.
+        """
+        assertion.assert_type(matrix, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
+        return cls(matrix)
+
+    def to_matrix(self) -> Matrix:
+        """
+        Returns the matrix as a dense Matrix.
+
+        Renvoie la matrice sous forme de Matrix dense.
+        """
+        dense: np.ndarray = np.zeros((self._rows, self._columns), dtype=self._values.dtype)
+        dense[self._row_indices(), self._indices] = self._values
+        return Matrix.from_numpy(dense)
+
+    def to_coo(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the stored components as coordinates (row_indices, column_indices, values), sorted row-major.
+
+        Renvoie les composants stockés sous forme de coordonnées (row_indices, column_indices, values).
+        """
+        return self._row_indices(), self._indices.copy(), self._values.copy()
+
+    def _row_indices(self) -> np.ndarray:
+        return np.repeat(np.arange(self._rows, dtype=np.int64), np.diff(self._indptr))
+
+    def get_rows(self) -> int:
+        return self._rows
+
+    def get_columns(self) -> int:
+        return self._columns
+
+    def get_dimension(self) -> tuple:
+        return self._rows, self._columns
+
+    def get_nnz(self) -> int:
+        """
+        Returns the number of stored (non-zero) components.
+
+        Renvoie le nombre de composants stockés (non nuls).
+        """
+        return len(self._values)
+
+    def _position(self, row: Int, column: Int) -> tuple[int, int, int, bool]:
+        # negative indices count from the end, like for Matrix
+        assertion.assert_types(row, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_types(column, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(row, -self._rows, self._rows - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        assertion.assert_range(column, -self._columns, self._columns - 1, ArgumentError,
+                               code=ArgumentCodes.OUT_OF_RANGE)
+        row, column = int(row) % self._rows, int(column) % self._columns
+        start, end = self._indptr[row], self._indptr[row + 1]
+        position: int = start + int(np.searchsorted(self._indices[start:end], column))
+        return row, column, position, position < end and self._indices[position] == column
+
+    def get_component(self, row: Int, column: Int) -> Number:
+        _, _, position, stored = self._position(row, column)
+        return self._values[position] if stored else self._values.dtype.type(0)
+
+    def set_component(self, row: Int, column: Int, value: Number) -> None:
+        """
+        Sets one component. Inserting or removing a stored component costs O(nnz).
+
+        Définit un composant. Ajouter ou supprimer un composant stocké coûte O(nnz).
+        """
+        assertion.assert_types(value, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        row, column, position, stored = self._position(row, column)
+        if stored and value != 0:
+            if np.result_type(self._values, value) != self._values.dtype:
+                self._values = self._values.astype(np.result_type(self._values, value))
+            self._values[position] = value
+        elif stored:
+            self._indices = np.delete(self._indices, position)
+            self._values = np.delete(self._values, position)
+            self._indptr[row + 1:] -= 1
+        elif value != 0:
+            self._indices = np.insert(self._indices, position, column)
+            self._values = np.insert(self._values.astype(np.result_type(self._values, value)), position, value)
+            self._indptr[row + 1:] += 1
+
+    def copy(self) -> Self:
+        return SparseMatrix._wrap_csr(self._indptr.copy(), self._indices.copy(), self._values.copy(),
+                                      self.get_dimension())
+
+    def transpose(self) -> Self:
+        """
+        Returns the transposed matrix.
+
+        Renvoie la matrice transposée.
+        """
+        return SparseMatrix._wrap_coo(self._indices, self._row_indices(), self._values,
+                                      (self._columns, self._rows))
+
+    def where(self, m: Union[AllLists, Matrix, Self]) -> Self:
+        """
+        Keeps the components where the mask m is true (non-zero) and sets all others to zero. Only the stored
+        components are looked up, so the result stays sparse.
+
+        Garde les composants où le masque m est vrai (non nul) et met tous les autres à zéro. Seuls les composants
+        stockés sont consultés, le résultat reste donc creux.
+
+        Args:
+            m (Union[AllLists, Matrix, SparseMatrix]): A mask with the dimension of the matrix.
+
+        Returns:
+            The masked matrix (SparseMatrix)
+
+        Raises:
+            ArgumentError: If the dimension of the mask does not equal the dimension of the matrix.
+            ArgumentError: If the dense mask does not hold ints or bools.
+        """
+        row_indices: np.ndarray = self._row_indices()
+        if isinstance(m, SparseMatrix):
+            assertion.assert_equals(m.get_dimension(), self.get_dimension(), ArgumentError,
+                                    code=ArgumentCodes.NOT_EQUAL)
+            keys: np.ndarray = row_indices * self._columns + self._indices
+            mask_keys: np.ndarray = m._row_indices() * self._columns + m._indices
+            keep: np.ndarray = np.isin(keys, mask_keys[m._values > 0], assume_unique=True)
+        else:
+            if isinstance(m, Matrix):
+                m = m._data
+            keep: np.ndarray = to_mask(m, self.get_dimension())[row_indices, self._indices]
+        return SparseMatrix._wrap_coo(row_indices[keep], self._indices[keep], self._values[keep],
+                                      self.get_dimension())
+
+    def _reduce(self, operation: np.ufunc, axis: Optional[Int], with_zero: bool) -> Union[np.ndarray, Number]:
+        # reduces the stored components per row / column; with_zero adds the implicit zeros to the reduction
+        if axis is not None:
+            assertion.assert_types(axis, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+            assertion.assert_range(axis, 0, 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        if axis is None:
+            if len(self._values) == 0:
+                return 0
+            result = operation.reduce(self._values)
+            if with_zero and len(self._values) < self._rows * self._columns:
+                result = operation(result, 0)
+            return result
+        if axis == 1:
+            counts: np.ndarray = np.diff(self._indptr)
+            stored: np.ndarray = counts > 0
+            result: np.ndarray = np.zeros(self._rows, dtype=self._values.dtype)
+            if stored.any():
+                result[stored] = operation.reduceat(self._values, self._indptr[:-1][stored])
+            full: int = self._columns
+        else:
+            counts: np.ndarray = np.bincount(self._indices, minlength=self._columns)
+            stored: np.ndarray = counts > 0
+            result: np.ndarray = np.zeros(self._columns, dtype=self._values.dtype)
+            if stored.any():
+                order: np.ndarray = np.argsort(self._indices, kind="stable")
+                starts: np.ndarray = np.concatenate(([0], np.cumsum(counts)[:-1]))
+                result[stored] = operation.reduceat(self._values[order], starts[stored])
+            full: int = self._rows
+        if with_zero:
+            partial: np.ndarray = stored & (counts < full)
+            result[partial] = operation(result[partial], 0)
+        return result
+
+    def _result(self, result: Union[np.ndarray, Number], rounded: bool = False) -> Union[float, "Vector"]:
+        from pylix.algebra.vector import Vector
+        if isinstance(result, np.ndarray):
+            return Vector.from_numpy(round_product(result) if rounded else result)
+        return round_output(float(result)) if rounded else float(result)
+
+    def max(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the biggest component (implicit zeros included), per column (axis=0) or per row (axis=1) if an axis
+        is given.
+
+        Renvoie le plus grand composant (zéros implicites compris), par colonne (axis=0) ou par ligne (axis=1) si un
+        axe est donné.
+        """
+        return self._result(self._reduce(np.maximum, axis, with_zero=True))
+
+    def min(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the smallest component (implicit zeros included), per column (axis=0) or per row (axis=1) if an axis
+        is given.
+
+        Renvoie le plus petit composant (zéros implicites compris), par colonne (axis=0) ou par ligne (axis=1) si un
+        axe est donné.
+        """
+        return self._result(self._reduce(np.minimum, axis, with_zero=True))
+
+    def sum(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) sum of the components, per column (axis=0) or per row (axis=1) if an axis is given.
+
+        Renvoie la somme (arrondie) des composants, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        return self._result(self._reduce(np.add, axis, with_zero=False), rounded=True)
+
+    def mean(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) mean of the components, per column (axis=0) or per row (axis=1) if an axis is given.
+
+        Renvoie la moyenne (arrondie) des composants, par colonne (axis=0) ou par ligne (axis=1) si un axe est donné.
+        """
+        total: Union[np.ndarray, Number] = self._reduce(np.add, axis, with_zero=False)
+        count: int = {None: self._rows * self._columns, 0: self._rows, 1: self._columns}[axis]
+        return self._result(total / count, rounded=True)
+
+    def norm(self, axis: Optional[Int] = None) -> Union[float, "Vector"]:
+        """
+        Returns the (rounded) euclidean norm: the Frobenius norm without an axis, else the norm of every column
+        (axis=0) or row (axis=1).
+
+        Renvoie la norme euclidienne (arrondie) : la norme de Frobenius sans axe, sinon la norme de chaque colonne
+        (axis=0) ou ligne (axis=1).
+        """
+        squared: SparseMatrix = SparseMatrix._wrap_csr(self._indptr, self._indices, np.abs(self._values) ** 2,
+                                                       self.get_dimension())
+        return self._result(np.sqrt(squared._reduce(np.add, axis, with_zero=False)), rounded=True)
+
+    def _multiply_dense(self, other: np.ndarray) -> np.ndarray:
+        products: np.ndarray = self._values[:, None] * other[self._indices]
+        result: np.ndarray = np.zeros((self._rows, other.shape[1]), dtype=np.result_type(products, other))
+        stored: np.ndarray = np.diff(self._indptr) > 0
+        if stored.any():
+            result[stored] = np.add.reduceat(products, self._indptr[:-1][stored], axis=0)
+        return result
+
+    def _multiply_sparse(self, other: Self) -> Self:
+        # every stored a_ik meets the stored row k of other; duplicates (i, j) are summed by _set_coo
+        lengths: np.ndarray = np.diff(other._indptr)[self._indices]
+        total: int = int(lengths.sum())
+        offsets: np.ndarray = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        positions: np.ndarray = np.repeat(other._indptr[self._indices], lengths) + offsets
+        return SparseMatrix._wrap_coo(np.repeat(self._row_indices(), lengths), other._indices[positions],
+                                      np.repeat(self._values, lengths) * other._values[positions],
+                                      (self._rows, other._columns))
+
+    def _check_operand(self, other: Union[Self, Matrix], msg: str) -> None:
+        assertion.assert_types(other, (SparseMatrix, Matrix), MathError, code=MathCodes.NOT_MATRIX, msg=msg)
+        if self.get_dimension() != other.get_dimension():
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the matrices do not fit!", other)
+
+    def __add__(self, other: Union[Self, Matrix]) -> Union[Self, Matrix]:
+        self._check_operand(other, "Only a matrix can be added to a matrix.")
+        if isinstance(other, SparseMatrix):
+            return SparseMatrix._wrap_coo(np.concatenate((self._row_indices(), other._row_indices())),
+                                          np.concatenate((self._indices, other._indices)),
+                                          np.concatenate((self._values, other._values)), self.get_dimension())
+        dense: np.ndarray = other._data.astype(np.result_type(self._values, other._data))
+        dense[self._row_indices(), self._indices] += self._values
+        return Matrix.from_numpy(dense)
+
+    def __sub__(self, other: Union[Self, Matrix]) -> Union[Self, Matrix]:
+        self._check_operand(other, "Only a matrix can be subtracted to a matrix.")
+        return self + other * -1
+
+    def __mul__(self, other: Union[Self, Matrix, *TypesTuple.NUMBER.value]) -> Union[Self, Matrix, "Vector"]:
+        assertion.assert_types(other, (SparseMatrix, Matrix, *TypesTuple.NUMBER.value), MathError,
+                               code=MathCodes.NOT_MATRIX_NUMBER,
+                               msg="Only matrices, int, float can be multiplied to a matrix.")
+        if isinstance(other, TypesTuple.NUMBER.value):
+            if other == 0:
+                return SparseMatrix(rows=self._rows, columns=self._columns)
+            return SparseMatrix._wrap_csr(self._indptr.copy(), self._indices.copy(), self._values * other,
+                                          self.get_dimension())
+        assertion.assert_equals(self.get_columns(), other.get_rows(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                msg="Columns of self do not equal rows of other.")
+        if isinstance(other, SparseMatrix):
+            return self._multiply_sparse(other)
+        from pylix.algebra.vector import Vector
+        result: np.ndarray = round_product(self._multiply_dense(other._data))
+        return Vector.from_numpy(result) if isinstance(other, Vector) else Matrix.from_numpy(result)
+
+    def __rmul__(self, other: Number) -> Self:
+        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError, code=MathCodes.NOT_NUMBER,
+                               msg="Only int, float can be multiplied to a sparse matrix from the left.")
+        return self * other
+
+    def __truediv__(self, other: Number) -> Self:
+        assertion.assert_types(other, TypesTuple.NUMBER.value, MathError, code=MathCodes.NOT_NUMBER)
+        assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
+        return SparseMatrix._wrap_csr(self._indptr.copy(), self._indices.copy(), self._values / other,
+                                      self.get_dimension())
+
+    def __eq__(self, other: Union[Self, Matrix, np.ndarray]) -> bool:
+        if isinstance(other, SparseMatrix):
+            return (self.get_dimension() == other.get_dimension() and np.array_equal(self._indptr, other._indptr)
+                    and np.array_equal(self._indices, other._indices)
+                    and bool(np.all(self._values == other._values)))
+        if isinstance(other, (Matrix, np.ndarray)):
+            return self.to_matrix() == other
+        return False
+
+    def __getitem__(self, item: Union[Int, tuple[Int, Int]]) -> Union[np.ndarray, Number]:
+        if isinstance(item, tuple):
+            assertion.assert_equals(len(item), 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+            return self.get_component(*item)
+        assertion.assert_types(item, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(item, -self._rows, self._rows - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        item = item % self._rows
+        row: np.ndarray = np.zeros(self._columns, dtype=self._values.dtype)
+        start, end = self._indptr[item], self._indptr[item + 1]
+        row[self._indices[start:end]] = self._values[start:end]
+        return row
+
+    def __len__(self) -> int:
+        return self.get_rows()
+
+    def __str__(self) -> str:
+        rows, columns, values = self.to_coo()
+        return "\n".join(f"({row}, {column})\t{value}" for row, column, value in zip(rows, columns, values))
+
+    def __repr__(self) -> str:
+        return (f"SparseMatrix at {hex(id(self))} with {self._rows}x{self._columns} and {self.get_nnz()} stored "
+                f"components:\n{self}")
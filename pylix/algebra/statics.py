@@ -1,23 +1,154 @@
-from typing import Iterable
+import contextlib
+from enum import Enum
+from typing import Iterable, Iterator, Optional, Union
 
 import numpy as np
 
 from pylix.errors import TypesTuple, assertion, ArgumentError, ArgumentCodes
 from pylix.types import Number, Int
 
-def rnd(x: Number, decimals: Int = 9) -> float:
+class Rounding(Enum):
     """
-    Returns the rounded value.
+    When pylix rounds its results.
 
-    Renvoie la valeur arrondie.
+    - ALWAYS: Results and intermediate values (e.g. every term of a polynomial) are rounded. This is the default.
+    - OUTPUT: Only the values which are handed back to the user are rounded, once.
+    - NONE: Nothing is rounded.
 
-    :param x: any Number
-    :param decimals: an Int which represents the willed decimals (standard is 8)
+    Quand pylix arrondit ses résultats.
+    """
+    ALWAYS = "always"
+    OUTPUT = "output"
+    NONE = "none"
+
+_rounding: Rounding = Rounding.ALWAYS
+_decimals: int = 9
+
+def get_precision() -> tuple[Rounding, int]:
+    """
+    Returns the global precision policy (rounding, decimals).
+
+    Renvoie la politique de précision globale (rounding, decimals).
+    """
+    return _rounding, _decimals
+
+def set_precision(rounding: Union[str, Rounding, None] = None, decimals: Optional[Int] = None) -> None:
+    """
+    Sets the global precision policy. The policy is global for the whole process (not per thread).
+
+    Définit la politique de précision globale.
+
+    :param rounding: 'always', 'output', 'none' or a Rounding. None keeps the current mode.
+    :param decimals: The number of decimals results are rounded to. None keeps the current number.
     :return:
     """
+    global _rounding, _decimals
+    if isinstance(rounding, str):
+        try:
+            rounding = Rounding(rounding.lower())
+        except ValueError:
+            raise ArgumentError(ArgumentCodes.NOT_ROUNDING, wrong_argument=rounding)
+    if rounding is not None and not isinstance(rounding, Rounding):
+        raise ArgumentError(ArgumentCodes.NOT_ROUNDING, wrong_argument=rounding)
+    if decimals is not None:
+        assertion.assert_types(decimals, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        _decimals = int(decimals)
+    if rounding is not None:
+        _rounding = rounding
+
+@contextlib.contextmanager
+def precision(rounding: Union[str, Rounding, None] = None, decimals: Optional[Int] = None) -> Iterator[tuple]:
+    """
+    Sets the precision policy for the duration of the with block and restores the previous one afterwards.
+
+    Définit la politique de précision pour la durée du bloc with et restaure la précédente ensuite.
+
+    :param rounding: 'always', 'output', 'none' or a Rounding. None keeps the current mode.
+    :param decimals: The number of decimals results are rounded to. None keeps the current number.
+    :return:
+    """
+    previous: tuple = (_rounding, _decimals)
+    set_precision(rounding, decimals)
+    try:
+        yield _rounding, _decimals
+    finally:
+        set_precision(*previous)
+
+def _round_array(x: np.ndarray, decimals: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    # np.round scales by 10**decimals, which loses digits of big values: values without digits below 10**-decimals
+    # (|x| * 10**decimals beyond 2**53) are kept as they are, like python's round does
+    if x.ndim == 0 and out is None:
+        return _round_array(x.reshape(1), decimals).reshape(())
+    big: np.ndarray = np.abs(x) >= 2.0 ** 53 / 10.0 ** decimals
+    kept: np.ndarray = x[big]
+    rounded: np.ndarray = np.round(x, decimals, out=out)
+    rounded[big] = kept
+    return rounded
+
+def rnd(x: Union[Number, np.ndarray], decimals: Optional[Int] = None) -> Union[float, np.ndarray]:
+    """
+    Returns the rounded value. Arrays are rounded element-wise in one vectorized call. An explicit call always rounds,
+    whatever the precision policy is.
+
+    Renvoie la valeur arrondie. Les tableaux sont arrondis élément par élément en un seul appel vectorisé.
+
+    :param x: any Number or an ndarray
+    :param decimals: an Int which represents the willed decimals (default: the decimals of the precision policy, 9)
+    :return: a float for a number, else an ndarray
+    """
+    if decimals is None:
+        decimals = _decimals
+    else:
+        assertion.assert_types(decimals, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+    if isinstance(x, np.ndarray):
+        return _round_array(x, decimals) if x.dtype.kind in "fc" else np.round(x, decimals)
     assertion.assert_types(x, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-    assertion.assert_types(decimals, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-    return float(np.round(x, decimals))
+    return float(_round_array(np.array([x], dtype=float), decimals)[0])
+
+def _round(x: Union[Number, np.ndarray], out: Optional[np.ndarray]) -> Union[float, np.ndarray]:
+    if isinstance(x, np.ndarray):
+        if x.dtype.kind in "fc":
+            return _round_array(x, _decimals, out=out)
+        if out is not None and out is not x:
+            np.copyto(out, x)
+            return out
+        return x
+    value = _round_array(np.array([x], dtype=complex if np.iscomplexobj(x) else float), _decimals)[0]
+    return complex(value) if np.iscomplexobj(value) else float(value)
+
+def round_output(x: Union[Number, np.ndarray], out: Optional[np.ndarray] = None) -> Union[Number, np.ndarray]:
+    """
+    Rounds a value which is handed back to the user, unless the rounding mode is 'none'. Only inexact arrays are
+    rounded; with out=x the array is rounded in place.
+
+    Arrondit une valeur rendue à l'utilisateur, sauf si le mode d'arrondi est 'none'.
+    """
+    if _rounding is Rounding.NONE:
+        if out is not None and out is not x:
+            np.copyto(out, x)
+            return out
+        return x
+    return _round(x, out)
+
+def round_step(x: Union[Number, np.ndarray], out: Optional[np.ndarray] = None) -> Union[Number, np.ndarray]:
+    """
+    Rounds an intermediate value, only if the rounding mode is 'always'.
+
+    Arrondit une valeur intermédiaire, seulement si le mode d'arrondi est 'always'.
+    """
+    if _rounding is not Rounding.ALWAYS:
+        if out is not None and out is not x:
+            np.copyto(out, x)
+            return out
+        return x
+    return _round(x, out)
+
+def _values(iterable: Iterable[Number]) -> np.ndarray:
+    assertion.assert_type(iterable, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+    values: list = list(iterable)
+    assertion.assert_types_list(values, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+    assertion.assert_above(len(values), 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+    return np.asarray(values)
 
 def average(iterable: Iterable[Number]):
     """
@@ -28,14 +159,7 @@ def average(iterable: Iterable[Number]):
     :param iterable: any iterable which is filled with numbers.
     :return:
     """
-    assertion.assert_type(iterable, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-    total: Number = 0
-    len_: int = 0
-    for value in iterable:
-        assertion.assert_types(value, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        total += value
-        len_ += 1
-    return rnd(total / len_)
+    return round_output(float(np.mean(_values(iterable))))
 
 def variance(iterable: Iterable[Number]):
     """
@@ -46,14 +170,9 @@ def variance(iterable: Iterable[Number]):
     :param iterable: any iterable which is filled with numbers
     :return:
     """
-    assertion.assert_type(iterable, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-    av = average(iterable)
-    total: Number = 0
-    len_ = 0
-    for value in iterable:
-        total += (value - av) ** 2
-        len_ += 1
-    return rnd(total / len_)
+    values: np.ndarray = _values(iterable)
+    av: float = round_step(float(np.mean(values)))
+    return round_output(float(np.mean((values - av) ** 2)))
 
 def std(iterable: Iterable[Number]):
     """
@@ -64,5 +183,6 @@ def std(iterable: Iterable[Number]):
     :param iterable: any iterable which is filled with numbers
     :return:
     """
-    assertion.assert_type(iterable, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
-    return rnd(variance(iterable) ** (1/2))
+    values: np.ndarray = _values(iterable)
+    av: float = round_step(float(np.mean(values)))
+    return round_output(round_step(float(np.mean((values - av) ** 2))) ** (1/2))
@@ -1,4 +1,4 @@
-import random
+import numbers
 import numpy as np
 
 from typing import override, Self, Union, Optional, Iterable
@@ -6,9 +6,44 @@ from typing import override, Self, Union, Optional, Iterable
 from pylix.errors import ArgumentError, MathError, assertion
 from pylix.errors import ArgumentCodes,  MathCodes, TODO, TypesTuple
 from pylix.errors import deprecated
-from pylix.algebra.matrix import Matrix
-from pylix.algebra.statics import rnd
-from pylix.types import Number, Int, Lists, AllLists
+from pylix.algebra.matrix import Matrix, NUMERIC_KINDS, to_mask, to_dtype, cast, to_scalar
+from pylix.algebra.statics import round_output
+from pylix.algebra.sampling import AliasSampler, heat_probabilities, to_rng
+from pylix.types import Number, Int, Scalar, DType, Seed, Lists, AllLists
+
+
+@assertion.validation_helper
+def to_coordinates(coordinates: Lists, code: ArgumentCodes, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Converts coordinates with one numpy conversion into a column (n, 1) and validates them in bulk. If the
+    coordinates are lists themselves, their first element is used.
+
+    Convertit les coordonnées avec une seule conversion numpy en une colonne (n, 1) et les valide en bloc.
+
+    Args:
+        coordinates (Lists): The coordinates.
+        code (ArgumentCodes): The code of the ArgumentError for non numeric coordinates.
+        dtype (Optional[np.dtype]): The dtype of the result (see matrix.cast). default = None (inferred by numpy)
+
+    Returns:
+        The column (np.ndarray): A new array with the shape (n, 1).
+
+    Raises:
+        ArgumentError: If the coordinates are nested deeper than 2 layers or ragged.
+        ArgumentError: If the coordinates are not numbers.
+        ArgumentError: If the coordinates can not be cast to dtype.
+    """
+    try:
+        column: np.ndarray = np.array(coordinates)
+    except ValueError:
+        raise ArgumentError(ArgumentCodes.MISMATCH_DIMENSION, msg="The coordinates do not have the same length.")
+    if column.ndim == 2:
+        column = column[:, :1]
+    assertion.assert_range(column.ndim, 1, 2, ArgumentError, code=code)
+    assertion.assert_true(column.dtype.kind in NUMERIC_KINDS, ArgumentError, code=code, wrong_argument=column.dtype)
+    if column.dtype.kind == "O":
+        assertion.assert_type_list(column.ravel(), numbers.Number, ArgumentError, code=code)
+    return cast(column.reshape(-1, 1), dtype)
 
 
 class Vector(Matrix):
@@ -18,7 +53,8 @@ class Vector(Matrix):
         La classe Vecteur hérite de la classe Matrice. Il s'agit d'un simple vecteur à n dimensions.
 
     """
-    def __init__(self, coordinates: Optional[Iterable] = None, dimension: Int = 2, default_value: Number = 0):
+    def __init__(self, coordinates: Optional[Iterable] = None, dimension: Int = 2, default_value: Scalar = 0,
+                 dtype: Optional[DType] = None):
         """
         Creates a vector.
 
@@ -27,25 +63,24 @@ class Vector(Matrix):
         Args:
             coordinates (Optional[Iterable]): A list of the coordinates for the vector.
             dimension (int): The dimension of the vector. (default 2; or len(coordinates))
-            default_value (Number): The value which will be used, if coordinates is None.
+            default_value (Scalar): The value which will be used, if coordinates is None.
+            dtype (Optional[DType]): The dtype of the coordinates, e.g. np.float32 or complex (see Matrix).
+                default = None (inferred by numpy)
+
+        Raises:
+            ArgumentError: If dtype is not numeric or the coordinates can not be cast to it.
         """
         assertion.assert_types(dimension, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         assertion.assert_is_positiv(dimension, ArgumentError, code=ArgumentCodes.NOT_POSITIV)
         assertion.assert_not_zero(dimension, ArgumentError, code=ArgumentCodes.ZERO)
-        d: list = list()
+        dtype = to_dtype(dtype)
         if coordinates is None:
-            coordinates: list = [default_value for _ in range(dimension)]
+            self._set_array(np.full((int(dimension), 1), cast(np.asarray(default_value), dtype)))
+            return
         if isinstance(coordinates, tuple):
             coordinates = list(coordinates)
         assertion.assert_types(coordinates, TypesTuple.LISTS.value, ArgumentError, code=ArgumentCodes.NOT_LISTS)
-        for coord in coordinates:
-            if isinstance(coord, TypesTuple.NUMBER.value):
-                d.append([coord])
-            elif isinstance(coord, TypesTuple.LISTS.value):
-                d.append([coord[0]])
-            else:
-                raise ArgumentError(ArgumentCodes.UNEXPECTED_TYPE, wrong_argument=type(coord))
-        super().__init__(data=d, rows=dimension, columns=1)
+        self._set_array(to_coordinates(coordinates, ArgumentCodes.UNEXPECTED_TYPE, dtype))
 
     def cross(self, vec: Self) -> Self:
         """
@@ -66,13 +101,7 @@ class Vector(Matrix):
         assertion.assert_type(vec, Vector, ArgumentError, code=ArgumentCodes.NOT_VECTOR)
         assertion.assert_equals(vec.get_dimension(), 3, MathError, code=MathCodes.UNFIT_DIMENSIONS)
         assertion.assert_equals(self.get_dimension(), 3, MathError, code=MathCodes.UNFIT_DIMENSIONS)
-        a, b, c = vec.get_data()
-        d, e, f = self.get_data()
-        return Vector([
-            e * c - f * b,
-            f * a - d * c,
-            d * b - e * a
-        ])
+        return Vector.from_numpy(np.cross(self._data[:, 0], vec._data[:, 0]))
 
     @classmethod
     def from_matrix(cls, matrix: Matrix) -> Self:
@@ -94,34 +123,64 @@ class Vector(Matrix):
         assertion.assert_type(matrix, Matrix, ArgumentError, code=ArgumentCodes.NOT_MATRIX)
         assertion.assert_equals(matrix.get_columns(), 1, ArgumentError,
                                 code=ArgumentCodes.MISMATCH_DIMENSION)
-        coordinates: list = list()
-        for component in matrix.get_components():
-            coordinates.append(component[0])
-        return Vector(coordinates, len(coordinates))
+        return Vector.from_numpy(matrix._data, copy=True)
 
     @classmethod
-    def sample(cls, vec: Self, len_output: int) -> Self:
+    @override
+    def from_numpy(cls, data: np.ndarray, copy: bool = False, dtype: Optional[DType] = None) -> Self:
         """
-        Creates a vector of the size n with random data from the input vector.
+        Creates a vector which wraps an existing ndarray with the shape (n,) or (n, 1). Only the type, the shape and
+        the dtype are checked. Without copy the vector and the array share their memory.
 
-        Crée un vecteur de taille n avec des données aléatoires provenant du vecteur d'entrée.
+        Crée un vecteur qui enveloppe un ndarray existant de forme (n,) ou (n, 1). Seuls le type, la forme et le dtype
+        sont vérifiés. Sans copie, le vecteur et le tableau partagent leur mémoire.
+
+        Args:
+            data (np.ndarray): A 1D array or a 2D array with one column.
+            copy (bool): Should the array be copied? default = False
+            dtype (Optional[DType]): Converts data to this dtype (see Matrix.from_numpy). default = None
+
+        Returns:
+            The vector (Vector): A vector backed by data (or by a copy of it).
+
+        Raises:
+            ArgumentError: If data is not an ndarray.
+            ArgumentError: If data is neither 1D nor a 2D array with one column.
+            ArgumentError: If the dtype of data is not numeric or data can not be cast to dtype.
+            ArgumentError: If copy is not a bool.
+        """
+        assertion.assert_type(data, np.ndarray, ArgumentError, code=ArgumentCodes.NOT_ND_ARRAY)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        assertion.assert_equals(data.ndim, 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        assertion.assert_equals(data.shape[1], 1, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        return super().from_numpy(data, copy, dtype)
+
+    @classmethod
+    def sample(cls, vec: Self, len_output: int, rng: Seed = None) -> Self:
+        """
+        Creates a vector of the size n with random data from the input vector (without replacement).
+
+        Crée un vecteur de taille n avec des données aléatoires provenant du vecteur d'entrée (sans remise).
 
         Args:
             vec (Vector): The vector from which you want a sample.
             len_output (int): The length of the sample.
+            rng (Seed): The random generator or a seed (see pylix.algebra.sampling.to_rng). default = None
 
         Raises:
             ArgumentError: If `vec` is not of type Vector.
             ArgumentError: If `len_output` is not inz.
-            ArgumentError: If `len_output` is smaller 1.
+            ArgumentError: If `len_output` is smaller 1 or bigger than the dimension of vec.
+            ArgumentError: If rng is neither None, a seed nor a Generator.
 
         Returns:
             Vector: The resulting vector from the sample.
         """
         assertion.assert_type(vec, Vector, ArgumentError, code=ArgumentCodes.NOT_VECTOR)
         assertion.assert_types(len_output, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_above(len_output, 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
-        return Vector(random.sample(list(vec.get_data()), len_output))
+        assertion.assert_range(len_output, 1, vec.get_dimension(), ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
+        return Vector.from_numpy(to_rng(rng).choice(vec._data[:, 0], int(len_output), replace=False))
 
     @override
     def get_dimension(self) -> int:
@@ -132,7 +191,7 @@ class Vector(Matrix):
         assertion.assert_types(index, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         assertion.assert_range(index, 0, self.get_dimension() - 1, ArgumentError,
                                code=ArgumentCodes.OUT_OF_RANGE)
-        return float(self._data[index][0])
+        return to_scalar(self._data[index][0])
 
     @deprecated("Use vector[i] = value instead.")
     def set_component(self, index: Int, value: Number) -> None:
@@ -141,25 +200,27 @@ class Vector(Matrix):
     def set_data(self, new: Lists) -> None:
         assertion.assert_types(new, TypesTuple.LISTS.value, ArgumentError,
                                code=ArgumentCodes.NOT_LISTS)
-        assertion.assert_types_list(new, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        new: list = list(new)
-        to_data: list = list()
-        for a in new:
-            to_data.append([a])
-        self._data = np.array(to_data)
-
-    def get_data(self) -> np.ndarray:
-        n: np.ndarray = self.get_components()
-        n = n.reshape(self.get_dimension())
-        return n
+        self._set_array(to_coordinates(new, ArgumentCodes.NOT_NUMBER))
+
+    def get_data(self, copy: bool = True) -> np.ndarray:
+        """
+        Returns the coordinates of the vector as a 1D array.
+
+        Renvoie les coordonnées du vecteur sous forme de tableau 1D.
+
+        Args:
+            copy (bool): If True a copy is returned, else a read-only view which shares the memory with the vector.
+                default = True
+
+        Returns:
+            The coordinates (np.ndarray): A 1D array.
+        """
+        return self.get_components(copy).reshape(self.get_dimension())
 
     def length(self) -> float:
-        total: float = 0
-        for entry in self._data:
-            total += entry[0] * entry[0]
-        return rnd(total ** (1/2))
+        return self.norm()
 
-    def rand_choice(self, heat: Number = 0) -> int:
+    def rand_choice(self, heat: Number = 0, rng: Seed = None) -> int:
         """
         Returns the index of a randomly chosen element of the list.
 
@@ -171,6 +232,7 @@ class Vector(Matrix):
 
         Args:
             heat (Number): Changes the selection procedure.
+            rng (Seed): The random generator or a seed (see pylix.algebra.sampling.to_rng). default = None
 
         Returns:
             index of choice (int): The chosen Elements index.
@@ -178,57 +240,56 @@ class Vector(Matrix):
         Raises:
             ArgumentError: If heat is not a number.
             ArgumentError: If heat is not in [-1; 1].
+            ArgumentError: If rng is neither None, a seed nor a Generator.
+            MathError: If a coordinate is negative or all coordinates are 0.
         """
-        assertion.assert_types(heat, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
-        assertion.assert_range(heat, -1, 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
-        heat = float(heat)
-        heat = np.clip(heat, -1, 1)
-        probs = self.get_data()
-
-        normalise = False
-
-        for value in probs:
-            if value >= 1:
-                normalise: bool = True
-                break
-
-        if normalise or sum(list(probs)) != 1:
-            sum_ = sum(list(probs))
-            for i in range(len(probs)):
-                probs[i] = rnd(float(probs[i] / sum_))
-
+        probs: np.ndarray = heat_probabilities(self._data[:, 0], heat)
         if heat == -1:
             return int(np.argmax(probs))
-        elif heat == 0:
-            return int(np.random.choice(len(probs), p=probs))
+        return int(to_rng(rng).choice(len(probs), p=probs))
 
-        temp = 1 / (1 - heat) if heat < 0 else 1 + 4 * heat
+    def sampler(self, heat: Number = 0) -> AliasSampler:
+        """
+        Builds a sampler for repeated rand_choice draws. The coordinates are normalized and heated once in O(n),
+        afterwards every draw is O(1) and sampler.draw(k, rng) returns k indices in one vectorized call.
 
-        scaled_probs = np.exp(np.log(probs + 1e-9) / temp)
-        scaled_probs /= np.sum(scaled_probs)
+        Construit un échantillonneur pour des tirages répétés de rand_choice. Les coordonnées sont normalisées une
+        seule fois en O(n), ensuite chaque tirage est en O(1).
 
-        return int(np.random.choice(len(probs), p=scaled_probs))
+        Args:
+            heat (Number): Changes the selection procedure (see rand_choice). default = 0
 
-    @override
-    def max(self) -> float:
-        max_: float = float(self[0])
-        for val in self:
-            max_ = max(max_, float(val))
-        return float(max_)
+        Returns:
+            The sampler (AliasSampler)
+
+        Raises:
+            ArgumentError: If heat is not a number.
+            ArgumentError: If heat is not in [-1; 1].
+            MathError: If a coordinate is negative or all coordinates are 0.
+        """
+        return AliasSampler(self._data[:, 0], heat)
 
     @override
-    def min(self) -> float:
-        min_: float = float(self[0])
-        for val in self:
-            min_ = min(min_, float(val))
-        return float(min_)
+    def argmax(self, axis: Optional[Int] = None) -> Union[int, Self]:
+        """
+        Returns the index of the biggest coordinate.
+
+        Renvoie l'indice de la plus grande coordonnée.
+        """
+        if axis is None:
+            return int(np.argmax(self._data))
+        return super().argmax(axis)
 
     @override
-    def sum(self) -> float:
-        sum_: float = 0
-        for val in self:
-            sum_ += val
-        return rnd(sum_)
+    def argmin(self, axis: Optional[Int] = None) -> Union[int, Self]:
+        """
+        Returns the index of the smallest coordinate.
+
+        Renvoie l'indice de la plus petite coordonnée.
+        """
+        if axis is None:
+            return int(np.argmin(self._data))
+        return super().argmin(axis)
 
     @override
     def where(self, m: Union[AllLists, Self], for_false: any = -1) -> Self:
@@ -252,104 +313,73 @@ class Vector(Matrix):
         assertion.assert_types(m, (*TypesTuple.LISTS.value, *TypesTuple.TUPLE.value, Matrix), ArgumentError,
                                code=ArgumentCodes.NOT_LISTS_TUPLE)
         if isinstance(m, Matrix) and not isinstance(m, Vector):
-            m = m.get_components()[0]
+            m = m._data[0]
         if isinstance(m, Vector):
-            m = m.get_data()
-        assertion.assert_equals(len(m), self.get_dimension(), ArgumentError, code=ArgumentCodes.NOT_EQUAL)
-        tester: list = list()
-        for i, value in enumerate(m):
-            assertion.assert_types(value, (*TypesTuple.NUMBER.value, bool), ArgumentError,
-                                   code=ArgumentCodes.NOT_INT_BOOl)
-            if isinstance(value, (np.integer, np.floating)):
-                tester.append(value > 0)
-                continue
-            tester.append(bool(value))
-
-        result: Vector = Vector(dimension=self.get_dimension())
-        for i, value in enumerate(self):
-            result[i] = value if tester[i] else for_false
-
-        return result
-
-    def randomise(self, amount_of_randomising: int = 1) -> None:
+            m = m._data[:, 0]
+        mask: np.ndarray = to_mask(m, (self.get_dimension(),))
+        return Vector.from_numpy(np.where(mask, self._data[:, 0], for_false))
+
+    def randomise(self, amount_of_randomising: int = 1, rng: Seed = None) -> None:
         """
-        Randomises the data of the vector n=1 amount of times.
+        Shuffles the coordinates of the vector in place, n=1 amount of times. No list or new array is created.
 
-        Randomise les données du vecteur n=1 nombre de fois.
+        Mélange les coordonnées du vecteur sur place, n=1 nombre de fois.
 
         Args:
             amount_of_randomising (int): The amount of times the randomise function should be applied.
+            rng (Seed): The random generator or a seed (see pylix.algebra.sampling.to_rng). default = None
 
         Raises:
             ArgumentError: If `amount_of_randomising` is not inz.
             ArgumentError: If `amount_of_randomising` is smaller 1.
-
-        Returns:
-            Vector: The resulting vector from the sample.
+            ArgumentError: If rng is neither None, a seed nor a Generator.
         """
         assertion.assert_types(amount_of_randomising, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         assertion.assert_above(amount_of_randomising, 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+        generator: np.random.Generator = to_rng(rng)
         for _ in range(amount_of_randomising):
-            self.set_data(random.sample(list(self.get_data()), len(self._data)))
+            generator.shuffle(self._data)
 
     @override
     def __add__(self, other: Matrix) -> Self:
-        added: Matrix = super().__add__(other)
-        return Vector.from_matrix(added)
+        return Vector.from_numpy(super().__add__(other)._data)
 
     @override
     def __radd__(self, other: Matrix) -> Self:
-        added: Matrix = super().__radd__(other)
-        return Vector.from_matrix(added)
+        return Vector.from_numpy(super().__radd__(other)._data)
 
     @override
     def __sub__(self, other: Matrix) -> Self:
-        sub: Matrix = super().__sub__(other)
-        return Vector.from_matrix(sub)
+        return Vector.from_numpy(super().__sub__(other)._data)
 
     @override
     def __rsub__(self, other: Matrix) -> Self:
-        sub: Matrix = super().__rsub__(other)
-        return Vector.from_matrix(sub)
+        return Vector.from_numpy(super().__rsub__(other)._data)
 
     @override
-    def __mul__(self, other: Union[Self, *TypesTuple.NUMBER.value]) -> Union[Self, float]:
-        assertion.assert_types(other, (Vector, *TypesTuple.NUMBER.value), MathError, code=MathCodes.NOT_VECTOR_NUMBER)
+    def __mul__(self, other: Union[Self, *TypesTuple.SCALAR.value]) -> Union[Self, float]:
+        assertion.assert_types(other, (Vector, *TypesTuple.SCALAR.value), MathError, code=MathCodes.NOT_VECTOR_NUMBER)
         if isinstance(other, Vector):
             assertion.assert_equals(self.get_dimension(), other.get_dimension(), MathError,
                                     code=MathCodes.UNFIT_DIMENSIONS)
-            a: np.ndarray = self.get_components()
-            b: np.ndarray = other.get_components()
-            c: np.ndarray = a * b
-            d: float | int = 0
-            if len(c) > 0 and isinstance(c[0], TypesTuple.LISTS.value):
-                for sub in c:
-                    d += sub[0]
-            elif len(c) > 0 and isinstance(c[0], TypesTuple.NUMBER.value):
-                print(c)
-                for n in c:
-                    d += n
-            return rnd(d)
-        vector: np.ndarray = self.get_data()
-        return Vector(list(vector * other), self.get_dimension())
+            return round_output(to_scalar(self._data[:, 0] @ other._data[:, 0]))
+        return Vector.from_numpy(self._data * other)
 
     @override
-    def __rmul__(self, other: Union[Matrix, Self, *TypesTuple.NUMBER.value]) -> Self:
-        if isinstance(other, (Vector, *TypesTuple.NUMBER.value)):
+    def __rmul__(self, other: Union[Matrix, Self, *TypesTuple.SCALAR.value]) -> Self:
+        if isinstance(other, (Vector, *TypesTuple.SCALAR.value)):
             return self * other
-        multiple: Matrix = super().__rmul__(other)
-        return Vector.from_matrix(multiple)
+        return Vector.from_numpy(super().__rmul__(other)._data)
 
     @override
-    def __imul__(self, other: Union[Matrix, *TypesTuple.NUMBER.value]) -> Self:
+    def __imul__(self, other: Union[Matrix, *TypesTuple.SCALAR.value]) -> Self:
         if isinstance(other, Vector):
             raise MathError(MathCodes.VECTOR)
         return super().__imul__(other)
 
     @override
-    def __truediv__(self, other: Number) -> Self:
-        div: Matrix = super().__truediv__(other)
-        return Vector.from_matrix(div)
+    def __truediv__(self, other: Scalar) -> Self:
+        return Vector.from_numpy(super().__truediv__(other)._data)
 
     @override
     def __pow__(self, power, modulo=None):
@@ -357,34 +387,34 @@ class Vector(Matrix):
 
     @override
     def __str__(self) -> str:
-        return f"{self.get_data()}"
+        return f"{self._data[:, 0]}"
 
     @override
     def __repr__(self) -> str:
-        return f"Vector at {hex(id(self))} with:\n {self.get_data()}"
+        return f"Vector at {hex(id(self))} with:\n {self._data[:, 0]}"
 
     @override
     def copy(self) -> Self:
-        return Vector.from_matrix(super().copy())
+        return Vector.from_numpy(self._data, copy=True)
 
     @override
     def __iter__(self) -> iter:
-        return iter(list(self.get_data()))
+        return iter(self.get_data(copy=False))
 
     @override
-    def __getitem__(self, item: Int) -> Number:
+    def __getitem__(self, item: Int) -> Scalar:
         assertion.assert_types(item, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
         if item >= 0:
             assertion.assert_range(item, 0, len(self._data) - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
-            return float(self._data[item][0])
+            return to_scalar(self._data[item][0])
         else:
             assertion.assert_range(len(self._data) + item, 0, len(self._data) - 1, ArgumentError,
                                    code=ArgumentCodes.OUT_OF_RANGE)
-            return float(self._data[len(self._data) + item][0])
+            return to_scalar(self._data[len(self._data) + item][0])
 
-    def __setitem__(self, index: Int, value: Number) -> None:
+    def __setitem__(self, index: Int, value: Scalar) -> None:
         assertion.assert_types(index, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
-        assertion.assert_types(value, TypesTuple.NUMBER.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
+        assertion.assert_types(value, TypesTuple.SCALAR.value, ArgumentError, code=ArgumentCodes.NOT_NUMBER)
         if index >= 0:
             assertion.assert_range(index, 0, len(self._data) - 1, ArgumentError, code=ArgumentCodes.OUT_OF_RANGE)
             self._data[index] = [value]
@@ -0,0 +1,286 @@
+from typing import Self, Union, Iterable, Iterator, Optional
+
+import numpy as np
+
+from pylix.algebra.matrix import NUMERIC_KINDS, to_dtype, cast
+from pylix.algebra.vector import Vector
+from pylix.algebra.statics import round_output
+from pylix.algebra.sampling import sample_batch
+from pylix.errors import ArgumentError, MathError, ArgumentCodes, MathCodes, assertion, TypesTuple
+from pylix.types import Int, Number, Scalar, DType, Seed
+
+
+class VectorArray:
+    """
+    N vectors of the same dimension d, held in one contiguous (N, d) ndarray (one vector per row). Dot and cross
+    products, lengths, normalization and arithmetic work on all rows in one vectorized call instead of N Vector
+    objects. Indexing returns Vector views into the array, so changing such a vector changes the array.
+
+    N vecteurs de même dimension d, stockés dans un seul ndarray contigu (N, d) (un vecteur par ligne). Les produits
+    scalaires et vectoriels, les longueurs, la normalisation et l'arithmétique agissent sur toutes les lignes en un
+    seul appel vectorisé. L'indexation renvoie des vues Vector du tableau.
+
+    Attributes:
+        _data (np.ndarray): A NumPy array with the shape (N, d) holding the vectors as rows.
+    """
+    def __init__(self, data: Union[Iterable[Vector], Iterable[Iterable[Scalar]], np.ndarray],
+                 dtype: Optional[DType] = None):
+        """
+        Creates an array of vectors.
+
+        Crée un tableau de vecteurs.
+
+        Args:
+            data (Union[Iterable[Vector], Iterable[Iterable[Scalar]], np.ndarray]): Either an array with the shape
+                (N, d), an iterable of vectors with the same dimension or an iterable of N rows of d numbers.
+            dtype (Optional[DType]): The dtype of the components (see Matrix). default = None (inferred by numpy)
+
+        Raises:
+            ArgumentError: If data is neither an ndarray nor an iterable.
+            ArgumentError: If data is not 2D or the vectors do not have the same dimension.
+            ArgumentError: If data does not hold numbers or can not be cast to dtype.
+            ArgumentError: If data is empty.
+        """
+        assertion.assert_type(data, Iterable, ArgumentError, code=ArgumentCodes.NOT_ITERABLE)
+        if not isinstance(data, np.ndarray):
+            rows: list = list(data)
+            if len(rows) > 0 and all(isinstance(row, Vector) for row in rows):
+                dimension: int = rows[0].get_dimension()
+                for row in rows:
+                    assertion.assert_equals(row.get_dimension(), dimension, ArgumentError,
+                                            code=ArgumentCodes.MISMATCH_DIMENSION)
+                rows = [row._data[:, 0] for row in rows]
+            try:
+                data = np.array(rows)
+            except ValueError:
+                raise ArgumentError(ArgumentCodes.MISMATCH_DIMENSION, msg="The vectors do not have the same length.")
+        assertion.assert_equals(data.ndim, 2, ArgumentError, code=ArgumentCodes.MISMATCH_DIMENSION)
+        assertion.assert_true(data.dtype.kind in NUMERIC_KINDS, ArgumentError, code=ArgumentCodes.NOT_NUMERIC_DTYPE,
+                              wrong_argument=data.dtype)
+        assertion.assert_above(len(data), 0, ArgumentError, code=ArgumentCodes.TOO_SMALL)
+        self._data: np.ndarray = np.ascontiguousarray(cast(data, to_dtype(dtype)))
+
+    @classmethod
+    def _wrap(cls, data: np.ndarray) -> Self:
+        array: VectorArray = cls.__new__(cls)
+        array._data = data
+        return array
+
+    def get_size(self) -> int:
+        return self._data.shape[0]
+
+    def get_dimension(self) -> int:
+        """
+        Returns the dimension d of every vector in the array.
+
+        Renvoie la dimension d de chaque vecteur du tableau.
+        """
+        return self._data.shape[1]
+
+    def get_dtype(self) -> np.dtype:
+        return self._data.dtype
+
+    def get_components(self) -> np.ndarray:
+        return self._data.copy()
+
+    def to_vectors(self) -> list[Vector]:
+        """
+        Returns the array as a list of independent vectors (copies).
+
+        Renvoie le tableau sous forme de liste de vecteurs indépendants (copies).
+        """
+        return [Vector.from_numpy(row, copy=True) for row in self._data]
+
+    def copy(self) -> Self:
+        return VectorArray._wrap(self._data.copy())
+
+    def _operand(self, other: Union[Self, Vector], msg: str) -> np.ndarray:
+        # a Vector is broadcast against every row, a VectorArray is paired row by row
+        assertion.assert_types(other, (VectorArray, Vector), MathError, code=MathCodes.NOT_VECTOR, msg=msg)
+        if isinstance(other, VectorArray):
+            assertion.assert_equals(other.get_size(), self.get_size(), MathError, code=MathCodes.UNFIT_DIMENSIONS,
+                                    msg="The arrays do not have the same size.")
+            data: np.ndarray = other._data
+        else:
+            data: np.ndarray = other._data[:, 0]
+        if data.shape[-1] != self.get_dimension():
+            raise MathError(MathCodes.UNFIT_DIMENSIONS, "The dimensions of the vectors do not fit!", other)
+        return data
+
+    def dot(self, other: Union[Self, Vector]) -> np.ndarray:
+        """
+        Computes the dot product of every row with the matching row of other (or with the vector other).
+
+        Calcule le produit scalaire de chaque ligne avec la ligne correspondante d'other (ou avec le vecteur other).
+
+        Args:
+            other (Union[VectorArray, Vector]): An array of the same size or one vector, both of dimension d.
+
+        Returns:
+            The dot products (np.ndarray): An array with the shape (N,).
+
+        Raises:
+            MathError: If other is neither a VectorArray nor a Vector.
+            MathError: If the sizes or dimensions do not fit.
+        """
+        b: np.ndarray = self._operand(other, "The dot product needs vectors.")
+        if b.ndim == 1:
+            return round_output(self._data @ b)
+        return round_output(np.einsum("ij,ij->i", self._data, b))
+
+    def cross(self, other: Union[Self, Vector]) -> Self:
+        """
+        Computes the cross product of every row with the matching row of other (or with the vector other).
+
+        Calcule le produit vectoriel de chaque ligne avec la ligne correspondante d'other (ou avec le vecteur other).
+
+        Args:
+            other (Union[VectorArray, Vector]): An array of the same size or one vector, both of dimension 3.
+
+        Returns:
+            The cross products (VectorArray)
+
+        Raises:
+            MathError: If other is neither a VectorArray nor a Vector.
+            MathError: If the vectors are not 3D or the sizes do not fit.
+        """
+        assertion.assert_equals(self.get_dimension(), 3, MathError, code=MathCodes.UNFIT_DIMENSIONS)
+        b: np.ndarray = self._operand(other, "The cross product needs vectors.")
+        return VectorArray._wrap(np.cross(self._data, b))
+
+    def length(self) -> np.ndarray:
+        """
+        Computes the euclidean length of every vector.
+
+        Calcule la longueur euclidienne de chaque vecteur.
+
+        Returns:
+            The lengths (np.ndarray): An array with the shape (N,).
+        """
+        return round_output(np.linalg.norm(self._data, axis=1))
+
+    def normalize(self) -> Self:
+        """
+        Scales every vector to the length 1.
+
+        Met chaque vecteur à l'échelle de longueur 1.
+
+        Returns:
+            The unit vectors (VectorArray)
+
+        Raises:
+            MathError: If at least one vector has the length 0.
+        """
+        lengths: np.ndarray = np.linalg.norm(self._data, axis=1, keepdims=True)
+        zero: np.ndarray = np.flatnonzero(lengths == 0)
+        if len(zero) > 0:
+            raise MathError(MathCodes.ZERO, "The vectors at these indices have the length 0.", zero.tolist())
+        return VectorArray._wrap(round_output(self._data / lengths))
+
+    def scale(self, factors: Union[Scalar, Iterable[Scalar]]) -> Self:
+        """
+        Multiplies every vector with a number, or the i-th vector with factors[i].
+
+        Multiplie chaque vecteur par un nombre, ou le i-ème vecteur par factors[i].
+
+        Args:
+            factors (Union[Scalar, Iterable[Scalar]]): One number or N numbers.
+
+        Returns:
+            The scaled vectors (VectorArray)
+
+        Raises:
+            MathError: If factors is neither a number nor N numbers.
+        """
+        if isinstance(factors, TypesTuple.SCALAR.value):
+            return VectorArray._wrap(self._data * factors)
+        assertion.assert_type(factors, Iterable, MathError, code=MathCodes.NOT_NUMBER)
+        data: np.ndarray = np.asarray(factors)
+        assertion.assert_true(data.dtype.kind in "biufc", MathError, code=MathCodes.NOT_NUMBER,
+                              wrong_argument=data.dtype)
+        assertion.assert_equals(data.shape, (self.get_size(),), MathError, code=MathCodes.UNFIT_DIMENSIONS)
+        return VectorArray._wrap(self._data * data[:, np.newaxis])
+
+    def rand_choice(self, heat: Union[Number, Iterable[Number]] = 0, top_k: Optional[Int] = None,
+                    top_p: Optional[Number] = None, rng: Seed = None) -> np.ndarray:
+        """
+        Draws one index per vector like Vector.rand_choice, for all vectors in one vectorized pass (see
+        pylix.algebra.sampling.sample_batch).
+
+        Tire un indice par vecteur comme Vector.rand_choice, pour tous les vecteurs en une seule passe vectorisée.
+
+        Args:
+            heat (Union[Number, Iterable[Number]]): One heat in [-1; 1] for all vectors or one per vector. default = 0
+            top_k (Optional[Int]): Only the k biggest coordinates of a vector can be drawn. default = None
+            top_p (Optional[Number]): Only the biggest coordinates which sum up to top_p can be drawn. default = None
+            rng (Seed): The random generator or a seed (see pylix.algebra.sampling.to_rng). default = None
+
+        Returns:
+            The indices (np.ndarray): An int array with the shape (N,).
+
+        Raises:
+            ArgumentError: If heat, top_k, top_p or rng are not valid.
+            MathError: If a coordinate is negative or all coordinates of a vector are 0.
+        """
+        return sample_batch(self._data, heat, top_k=top_k, top_p=top_p, rng=rng)
+
+    def __add__(self, other: Union[Self, Vector]) -> Self:
+        b: np.ndarray = self._operand(other, "Only vectors can be added to vectors.")
+        return VectorArray._wrap(self._data + b)
+
+    def __sub__(self, other: Union[Self, Vector]) -> Self:
+        b: np.ndarray = self._operand(other, "Only vectors can be subtracted from vectors.")
+        return VectorArray._wrap(self._data - b)
+
+    def __mul__(self, other: Union[Self, Vector, *TypesTuple.SCALAR.value]) -> Union[Self, np.ndarray]:
+        assertion.assert_types(other, (VectorArray, Vector, *TypesTuple.SCALAR.value), MathError,
+                               code=MathCodes.NOT_VECTOR_NUMBER)
+        if isinstance(other, TypesTuple.SCALAR.value):
+            return self.scale(other)
+        return self.dot(other)
+
+    def __rmul__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError, code=MathCodes.NOT_NUMBER,
+                               msg="Only int, float, complex can be multiplied to vectors from the left.")
+        return self.scale(other)
+
+    def __truediv__(self, other: Scalar) -> Self:
+        assertion.assert_types(other, TypesTuple.SCALAR.value, MathError, code=MathCodes.NOT_NUMBER)
+        assertion.assert_not_zero(other, MathError, code=MathCodes.ZERO, msg="Division by Zero is not defined.")
+        return VectorArray._wrap(self._data / other)
+
+    def __eq__(self, other: Union[Self, np.ndarray]) -> bool:
+        if isinstance(other, VectorArray):
+            other = other._data
+        if not isinstance(other, np.ndarray):
+            return False
+        return self._data.shape == other.shape and bool(np.all(self._data == other))
+
+    def __getitem__(self, item: Union[Int, slice]) -> Union[Vector, Self]:
+        assertion.assert_types(item, (*TypesTuple.INT.value, slice), ArgumentError, code=ArgumentCodes.NOT_INT)
+        if isinstance(item, slice):
+            return VectorArray._wrap(self._data[item])
+        assertion.assert_range(item, -len(self._data), len(self._data) - 1, ArgumentError,
+                               code=ArgumentCodes.OUT_OF_RANGE)
+        return Vector._wrap(self._data[item].reshape(-1, 1))
+
+    def __setitem__(self, index: Int, value: Vector) -> None:
+        assertion.assert_types(index, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assertion.assert_range(index, -len(self._data), len(self._data) - 1, ArgumentError,
+                               code=ArgumentCodes.OUT_OF_RANGE)
+        assertion.assert_type(value, Vector, ArgumentError, code=ArgumentCodes.NOT_VECTOR)
+        assertion.assert_equals(value.get_dimension(), self.get_dimension(), ArgumentError,
+                                code=ArgumentCodes.MISMATCH_DIMENSION)
+        self._data[index] = value._data[:, 0]
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (Vector._wrap(row.reshape(-1, 1)) for row in self._data)
+
+    def __len__(self) -> int:
+        return self.get_size()
+
+    def __str__(self) -> str:
+        return f"{self._data}"
+
+    def __repr__(self) -> str:
+        return f"VectorArray at {hex(id(self))} with:\n {self._data}"
@@ -1,5 +1,6 @@
 from pylix.errors.useful_errors import *
 from pylix.errors import assertion
+from pylix.errors.assertion import validation, set_validation_level, get_validation_level
 from pylix.errors.decorator import deprecated, TODO, to_test
 from pylix.errors.enums import *
 
@@ -13,7 +14,11 @@ __all__ = [
     "StateError",
     "TODO",
     "TypesTuple",
+    "ValidationLevel",
     "assertion",
     "deprecated",
-    "to_test"
+    "to_test",
+    "validation",
+    "set_validation_level",
+    "get_validation_level"
 ]
@@ -1,8 +1,17 @@
+import contextlib
+import functools
+import os
+import sys
+import warnings
+
+from typing import Union, Iterator
+
 from pylix.errors import ArgumentError, MathError, BaseError
+from pylix.errors.enums import ValidationLevel, ArgumentCodes
 
 
 def _edit_kwargs(wrong, kwargs: dict, exception) -> dict:
-    if wrong in kwargs.values() or str(wrong) in kwargs.values():
+    if "wrong_argument" in kwargs or "wrong" in kwargs:
         return kwargs
     if exception == ArgumentError:
         kwargs["wrong_argument"] = wrong
@@ -53,10 +62,7 @@ def assert_not_zero(var, exception, **kwargs) -> None:
         raise exception(**_edit_kwargs(var, kwargs, exception))
 
 def assert_types(var, types: tuple, exception, **kwargs) -> None:
-    check: list = list()
-    for type_ in types:
-        check.append(isinstance(var, type_))
-    if not any(check):
+    if not isinstance(var, types):
         raise exception(**_edit_kwargs(var, kwargs, exception))
 
 def assert_is_none(var, exception, **kwargs) -> None:
@@ -82,3 +88,107 @@ def assert_true(var: bool, exception, **kwargs) -> None:
 def assert_types_list(var, types: tuple, exception, **kwargs) -> None:
     for element in var:
         assert_types(element, types, exception, **kwargs)
+
+_ASSERTS: dict = {name: func for name, func in list(globals().items()) if name.startswith("assert_")}
+_validation_level: ValidationLevel = ValidationLevel.FULL
+
+_HELPERS: set = set()
+
+def _skip(*args, **kwargs) -> None:
+    return None
+
+def validation_helper(func):
+    """
+    Marks a function which only validates on behalf of its caller (e.g. to_components for Matrix.__init__). In
+    boundary mode, its element-wise assertions are checked if its caller was called from outside of pylix.
+
+    Marque une fonction qui valide uniquement pour son appelant. En mode boundary, ses assertions élément par élément
+    sont vérifiées si son appelant a été appelé depuis l'extérieur de pylix.
+
+    :param func: The helper function.
+    :return: func, unchanged.
+    """
+    _HELPERS.add(func.__code__)
+    return func
+
+def _at_boundary(assert_):
+    @functools.wraps(assert_)
+    def wrapper(*args, **kwargs) -> None:
+        frame = sys._getframe(1)
+        while frame is not None and (frame.f_globals is _GLOBALS or frame.f_code in _HELPERS):
+            frame = frame.f_back
+        caller = frame.f_back if frame is not None else None
+        while caller is not None and caller.f_globals.get("__name__") == "pylix.errors.decorator":
+            caller = caller.f_back
+        if caller is not None and caller.f_globals.get("__name__", "").startswith("pylix."):
+            return None
+        assert_(*args, **kwargs)
+    return wrapper
+
+_GLOBALS: dict = globals()
+_ELEMENTWISE: tuple = ("assert_type_list", "assert_types_list", "assert_layer_list")
+_BOUNDARY_ASSERTS: dict = {name: _at_boundary(func) if name in _ELEMENTWISE else func
+                           for name, func in _ASSERTS.items()}
+
+def get_validation_level() -> ValidationLevel:
+    return _validation_level
+
+def set_validation_level(level: Union[str, ValidationLevel]) -> None:
+    """
+    Sets the global validation level of all assertions.
+
+    - full: Every assertion is checked.
+    - boundary: Element-wise assertions (assert_type_list, assert_types_list, assert_layer_list) are only checked
+      in functions which were called from outside of pylix (helpers marked with validation_helper are skipped when
+      looking for that function). Scalar assertions stay active, checking them is cheaper
+      than finding out whether they have to be checked.
+    - off: Every assertion is replaced by a no-op.
+
+    The level is global for the whole process (not per thread). It can also be set with the environment variable
+    PYLIX_VALIDATION before pylix is imported.
+
+    Définit le niveau de validation global de toutes les assertions.
+
+    :param level: 'full', 'boundary', 'off' or a ValidationLevel
+    :return:
+    """
+    global _validation_level
+    if isinstance(level, str):
+        try:
+            level = ValidationLevel(level.lower())
+        except ValueError:
+            raise ArgumentError(ArgumentCodes.NOT_VALIDATION_LEVEL, wrong_argument=level)
+    if not isinstance(level, ValidationLevel):
+        raise ArgumentError(ArgumentCodes.NOT_VALIDATION_LEVEL, wrong_argument=level)
+    for name, assert_ in _ASSERTS.items():
+        if level == ValidationLevel.FULL:
+            globals()[name] = assert_
+        elif level == ValidationLevel.BOUNDARY:
+            globals()[name] = _BOUNDARY_ASSERTS[name]
+        else:
+            globals()[name] = _skip
+    _validation_level = level
+
+@contextlib.contextmanager
+def validation(level: Union[str, ValidationLevel]) -> Iterator[ValidationLevel]:
+    """
+    Sets the validation level for the duration of the with block and restores the previous one afterwards.
+
+    Définit le niveau de validation pour la durée du bloc with et restaure le précédent ensuite.
+
+    :param level: 'full', 'boundary', 'off' or a ValidationLevel
+    :return:
+    """
+    previous: ValidationLevel = _validation_level
+    set_validation_level(level)
+    try:
+        yield _validation_level
+    finally:
+        set_validation_level(previous)
+
+if "PYLIX_VALIDATION" in os.environ:
+    try:
+        set_validation_level(os.environ["PYLIX_VALIDATION"])
+    except ArgumentError:
+        warnings.warn(f"PYLIX_VALIDATION={os.environ['PYLIX_VALIDATION']!r} is not a validation level, "
+                      f"'full' is used.", stacklevel=2)
@@ -6,11 +6,18 @@ class TypesTuple(Enum):
     INT = (int, np.integer)
     FLOAT = (float, np.floating)
     NUMBER = (*INT, *FLOAT)
+    COMPLEX = (complex, np.complexfloating)
+    SCALAR = (*NUMBER, *COMPLEX)
     LIST = (list,)
     TUPLE = (tuple,)
     ND_ARRAY = (np.ndarray,)
     LISTS = (*LIST, *ND_ARRAY)
 
+class ValidationLevel(Enum):
+    FULL = "full"
+    BOUNDARY = "boundary"
+    OFF = "off"
+
 class BaseCodes(Enum):
     NONE = 0
     TODO = 1
@@ -43,6 +50,11 @@ class ArgumentCodes(Enum):
     TOO_SMALL = 24
     NOT_ITERABLE = 25
     ITERABLE_LAYER_NOT_NUMBER_LISTS = 26
+    NOT_ND_ARRAY = 27
+    NOT_NUMERIC_DTYPE = 28
+    NOT_VALIDATION_LEVEL = 29
+    NOT_ROUNDING = 30
+    NOT_RNG = 31
 
 class MathCodes(Enum):
     NONE = 0
@@ -56,6 +56,16 @@ ARGUMENT_ERROR_MESSAGES: dict = {
         f"The given value is not an iterable.",
     ArgumentCodes.ITERABLE_LAYER_NOT_NUMBER_LISTS:
         f"The given value was neither a number nor an iterable as defined for: {(*TypesTuple.NUMBER.value, Iterable)}.",
+    ArgumentCodes.NOT_ND_ARRAY:
+        f"The given argument was not a numpy.ndarray.",
+    ArgumentCodes.NOT_NUMERIC_DTYPE:
+        f"The dtype of the given array is not numeric (bool, int, float, complex or object holding exact numbers).",
+    ArgumentCodes.NOT_VALIDATION_LEVEL:
+        f"The given argument is not a validation level ('full', 'boundary', 'off').",
+    ArgumentCodes.NOT_ROUNDING:
+        f"The given argument is not a rounding mode ('always', 'output', 'none').",
+    ArgumentCodes.NOT_RNG:
+        f"The given argument is neither a seed (int, SeedSequence) nor a numpy Generator.",
 }
 
 MATH_ERROR_MESSAGES: dict = {
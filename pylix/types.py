@@ -6,6 +6,10 @@ T = TypeVar('T')
 Int = Union[int, np.integer]
 Float = Union[float, np.floating]
 Number = Union[Int, Float]
+Complex = Union[complex, np.complexfloating]
+Scalar = Union[Number, Complex]
+DType = Union[type, str, np.dtype]
+Seed = Union[None, Int, np.random.SeedSequence, np.random.Generator]
 List: type = Union[list[T]]
 Tuple: type = Union[tuple[T]]
 Itera: type = Union[Iterable[T]]
@@ -0,0 +1,48 @@
+from fractions import Fraction
+
+import pytest
+import numpy as np
+
+from pylix.algebra import exact
+from pylix.errors import MathError
+
+
+def hilbert(n: int) -> np.ndarray:
+    return np.array([[Fraction(1, i + j + 1) for j in range(n)] for i in range(n)], dtype=object)
+
+def test_to_integers():
+    integers, scale = exact.to_integers(np.array([[Fraction(1, 2), 1], [Fraction(1, 3), 0]], dtype=object))
+    assert scale == 6
+    assert integers.tolist() == [[3, 6], [2, 0]]
+    assert all(type(i) is int for i in integers.flat)
+    integers, scale = exact.to_integers(np.array([[0.5, 2.0]]))
+    assert (integers.tolist(), scale) == ([[1, 4]], 2)
+    assert exact.to_integers(np.array([[True, False]]))[0].tolist() == [[1, 0]]
+
+    with pytest.raises(MathError):
+        exact.to_integers(np.array([[np.nan, 1.0]]))
+
+def test_determinant():
+    assert exact.determinant(np.array([[2, 1, 1], [1, 3, 2], [1, 0, 0]])) == -1
+    assert exact.determinant(np.array([[0, 1], [1, 0]])) == -1
+    assert exact.determinant(np.array([[1, 2], [2, 4]])) == 0
+    assert exact.determinant(hilbert(5)) == Fraction(1, 266716800000)
+    big: np.ndarray = np.array([[2 ** 80, 1], [1, 2 ** 80]], dtype=object)
+    assert exact.determinant(big) == 2 ** 160 - 1
+
+    with pytest.raises(MathError):
+        exact.determinant(np.array([[1, 2, 3]]))
+
+def test_rank():
+    assert exact.rank(np.array([[1, 2, 3], [2, 4, 6], [1, 0, 1]])) == 2
+    assert exact.rank(np.array([[0, 0, 1], [0, 0, 2]])) == 1
+    assert exact.rank(np.zeros((3, 2), dtype=int)) == 0
+    assert exact.rank(hilbert(6)) == 6
+
+def test_inverse():
+    a: np.ndarray = np.array([[2, 1, 1], [1, 3, 2], [1, 0, 0]])
+    assert exact.inverse(a).tolist() == [[0, 0, 1], [-2, 1, 3], [3, -1, -5]]
+    assert exact.inverse(np.array([[0, 2], [4, 0]])).tolist() == [[0, Fraction(1, 4)], [Fraction(1, 2), 0]]
+    h: np.ndarray = hilbert(6)
+    assert (exact.inverse(h).dot(h) == np.eye(6, dtype=int)).all()
+    assert exact.inverse(np.array([[1, 2], [2, 4]])) is None
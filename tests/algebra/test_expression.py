@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+
+from pylix.algebra import Matrix, Vector, Expression
+from pylix.errors import ArgumentError, MathError
+
+
+def make_matrices() -> tuple:
+    return (Matrix([[1, 2], [3, 4]]), Matrix([[0, 1], [1, 0]]), Matrix([[1, 1], [1, 1]]),
+            Matrix([[2, 0], [0, 2]]))
+
+def test_evaluate():
+    a, b, c, d = make_matrices()
+    expression: Expression = a.lazy() * b + c * 2 - d
+    assert isinstance(expression, Expression)
+    assert expression.get_dimension() == (2, 2)
+    assert expression.evaluate() == a * b + c * 2 - d
+    assert (2 * a.lazy() / 4).evaluate() == a / 2
+    assert (-a.lazy() + a).evaluate() == Matrix([[0, 0], [0, 0]])
+    assert (a.lazy() * (b + c)).evaluate() == a * (b + c)
+    assert (a.lazy() * (b.lazy() + c * 0.5)).evaluate() == a * (b + c * 0.5)
+    assert (3 * (a.lazy() * 2) * (b * 0.5)).evaluate() == a * b * 3
+    assert (d.lazy() - a).evaluate() == d - a
+
+def test_lazy():
+    a, b, c, d = make_matrices()
+    expression: Expression = a.lazy() + b
+    a[0][0] = 10
+    assert expression.evaluate()[0][0] == 10
+
+def test_folding():
+    a, b, c, d = make_matrices()
+    expression: Expression = a.lazy() * 2 + 3 * a.lazy() - b + b
+    assert len(expression._terms) == 1
+    assert expression._terms[0][0] == 5
+    assert expression.evaluate() == a * 5
+    product: Expression = (a.lazy() * 2) * (b.lazy() * 3) * c
+    assert len(product._terms) == 1
+    assert product._terms[0][0] == 6
+    assert len(product._terms[0][1].factors) == 3
+    assert product.evaluate() == a * b * c * 6
+
+def test_chain_order():
+    rng = np.random.default_rng(0)
+    x: Matrix = Matrix.from_numpy(rng.random((50, 2)))
+    y: Matrix = Matrix.from_numpy(rng.random((2, 50)))
+    z: Matrix = Matrix.from_numpy(rng.random((50, 1)))
+    assert np.allclose((x.lazy() * y * z).evaluate()._data, x._data @ (y._data @ z._data))
+
+def test_out():
+    a, b, c, d = make_matrices()
+    out: Matrix = Matrix(rows=2, columns=2)
+    buffer: np.ndarray = out._data
+    assert (a.lazy() * b + c).evaluate(out=out) is out
+    assert out._data is buffer
+    assert out == a * b + c
+    # out may be an operand
+    expected: Matrix = a * b + a
+    (a.lazy() * b + a).evaluate(out=a)
+    assert a == expected
+
+    with pytest.raises(MathError):
+        (a.lazy() + b).evaluate(out=Matrix(rows=3, columns=2))
+    with pytest.raises(ArgumentError):
+        (a.lazy() * 0.5).evaluate(out=out)
+    with pytest.raises(ArgumentError):
+        (a.lazy() + b).evaluate(out=np.zeros((2, 2)))
+
+def test_vector():
+    v: Vector = Vector([1, 2])
+    result = (v.lazy() * 2 + v).evaluate()
+    assert isinstance(result, Vector)
+    assert result == Vector([3, 6])
+    m: Matrix = Matrix([[1, 2], [3, 4]])
+    assert (m.lazy() * v).evaluate() == m * v
+
+def test_errors():
+    a, b, c, d = make_matrices()
+    with pytest.raises(MathError):
+        _ = a.lazy() + Matrix([[1, 2, 3]])
+    with pytest.raises(MathError):
+        _ = a.lazy() * Matrix([[1, 2, 3]])
+    with pytest.raises(MathError):
+        _ = a.lazy() + 1
+    with pytest.raises(MathError):
+        _ = a.lazy() / 0
+    with pytest.raises(MathError):
+        _ = a * a.lazy()
+    with pytest.raises(ArgumentError):
+        Expression([[1, 2]])
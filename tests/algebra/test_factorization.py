@@ -0,0 +1,83 @@
+import math
+
+import pytest
+import numpy as np
+
+from pylix.algebra import Matrix, Vector
+from pylix.algebra.factorization import Factorization, LU, QR, Cholesky, forward_substitution, backward_substitution
+from pylix.errors import ArgumentError, MathError
+
+
+A: list = [[4, 2, 0], [2, 5, 3], [0, 3, 6]]
+
+def test_substitution():
+    lower: np.ndarray = np.array([[2.0, 0], [1, 1]])
+    assert forward_substitution(lower, np.array([2.0, 3])).tolist() == [1, 2]
+    assert forward_substitution(lower, np.array([2.0, 3]), unit_diagonal=True).tolist() == [2, 1]
+    assert backward_substitution(lower.T, np.array([[4.0, 2], [2, 1]])).tolist() == [[1, 0.5], [2, 1]]
+
+@pytest.mark.parametrize("kind", ["lu", "qr", "cholesky"])
+def test_solve(kind):
+    a: Matrix = Matrix(A)
+    factorization = a.factorize(kind)
+    x: Vector = Vector([1, -2, 3])
+    solution = factorization.solve(a * x)
+    assert isinstance(solution, Vector)
+    assert np.allclose(solution._data, x._data)
+
+    rhs: Matrix = Matrix.from_numpy(np.random.default_rng(0).random((3, 50)))
+    solutions = factorization.solve(rhs)
+    assert isinstance(solutions, Matrix)
+    assert solutions.get_dimension() == (3, 50)
+    assert np.allclose(a._data @ solutions._data, rhs._data)
+
+    assert math.isclose(factorization.det(), 60)
+    assert math.isclose(factorization.logdet(), math.log(60))
+
+    with pytest.raises(MathError):
+        factorization.solve(Vector([1, 2]))
+    with pytest.raises(MathError):
+        factorization.solve([1, 2, 3])
+
+def test_lu():
+    a: Matrix = Matrix([[0, 1], [2, 3]])
+    lu: LU = a.factorize()
+    assert np.allclose((lu.get_l() * lu.get_u())._data, a._data[lu.get_permutation()])
+    assert math.isclose(lu.det(), -2)
+
+    singular: LU = Matrix([[1, 2], [2, 4]]).factorize("lu")
+    assert singular.det() == 0
+    assert singular.logdet() == -math.inf
+    with pytest.raises(MathError):
+        singular.solve(Vector([1, 1]))
+    with pytest.raises(MathError):
+        Matrix([[1, 2, 3]]).factorize("lu")
+
+def test_qr():
+    # least squares fit of y = 1 + 2x
+    a: Matrix = Matrix([[1, 0], [1, 1], [1, 2], [1, 3]])
+    qr: QR = a.factorize("qr")
+    assert np.allclose(qr.solve(Vector([1, 3, 5, 7]))._data, [[1], [2]])
+    assert np.allclose((qr.get_q() * qr.get_r())._data, a._data)
+    with pytest.raises(MathError):
+        qr.det()
+    with pytest.raises(MathError):
+        Matrix([[1, 2, 3]]).factorize("qr")
+
+    rng = np.random.default_rng(0)
+    for data in (rng.normal(size=(5, 5)), np.array([[0., 1.], [1., 0.]]), rng.normal(size=(4, 4)) + 1j):
+        assert np.isclose(Matrix.from_numpy(data).factorize("qr").det(), np.linalg.det(data))
+
+def test_cholesky():
+    cholesky: Cholesky = Matrix(A).factorize("cholesky")
+    assert np.allclose((cholesky.get_l() * Matrix.from_numpy(cholesky.get_l()._data.T))._data, A)
+    with pytest.raises(MathError):
+        Matrix([[1, 2], [2, 1]]).factorize("cholesky")
+    with pytest.raises(MathError):
+        Matrix([[1, 2], [0, 1]]).factorize("cholesky")
+    with pytest.raises(ArgumentError):
+        Matrix(A).factorize("svd")
+
+def test_factorization_is_abstract():
+    with pytest.raises(TypeError):
+        Factorization(Matrix([[1, 0], [0, 1]]))
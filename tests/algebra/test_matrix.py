@@ -1,9 +1,11 @@
 import math
+from fractions import Fraction
 
 import pytest
 import numpy as np
 
 from pylix.algebra import Matrix, Vector, Axis
+from pylix.algebra.matrix import multiply, strassen_multiply
 from pylix.algebra.statics import rnd
 from pylix.errors import *
 
@@ -108,6 +110,46 @@ def test_pow():
         m1 = Matrix([[3, 2], [1, 2], [5, 4]])
         _ = m1 ** 25
 
+
+def test_power():
+    fibonacci: Matrix = Matrix([[1, 1], [1, 0]])
+    assert fibonacci ** 10 == Matrix([[89, 55], [55, 34]])
+    assert fibonacci ** 1 == fibonacci
+    assert fibonacci ** 0 == Matrix.create_identity_matrix(2)
+    assert (fibonacci ** 90)[0][1] == 2880067194370816120
+
+    # F(1000) mod 1_000_000_007
+    assert fibonacci.power(1000, modulo=1_000_000_007)[0][1] == 517691607
+    assert pow(fibonacci, 10, 7) == Matrix([[89 % 7, 55 % 7], [55 % 7, 34 % 7]])
+    # (modulo - 1)^2 * rows does not fit into int64 anymore
+    big: int = 2 ** 61 - 1
+    assert fibonacci.power(10, modulo=big) == Matrix([[89, 55], [55, 34]])
+    # the entries themselves do not fit into int64
+    huge: Matrix = Matrix([[10 ** 30, 1], [1, 1]])
+    assert pow(huge, 5, 7) == pow(Matrix([[10 ** 30 % 7, 1], [1, 1]]), 5, 7)
+    unsigned: Matrix = Matrix.from_numpy(np.array([[2 ** 64 - 1, 0], [0, 1]], dtype=np.uint64))
+    assert pow(unsigned, 1, 10) == Matrix([[5, 0], [0, 1]])
+    assert pow(unsigned, 2, 2 ** 70) == Matrix([[(2 ** 64 - 1) ** 2 % 2 ** 70, 0], [0, 1]])
+    assert pow(Matrix.from_numpy(np.array([[-3, 1], [0, 100]], dtype=np.int8)), 1, 1000) == \
+        Matrix([[997, 1], [0, 100]])
+
+    markov: Matrix = Matrix([[0.9, 0.1], [0.5, 0.5]])
+    assert np.allclose(markov.power(50, method="eigen")._data, markov.power(50)._data)
+    assert np.allclose(markov.power(50)._data, [[5 / 6, 1 / 6], [5 / 6, 1 / 6]])
+
+    with pytest.raises(MathError):
+        Matrix([[1, 1], [0, 1]]).power(5, method="eigen")
+    with pytest.raises(MathError):
+        markov.power(5, modulo=3)
+    with pytest.raises(MathError):
+        fibonacci.power(5, modulo=3, method="eigen")
+    with pytest.raises(MathError):
+        fibonacci.power(5, modulo=0)
+    with pytest.raises(MathError):
+        Matrix([[1, 2, 3]]).power(2)
+    with pytest.raises(ArgumentError):
+        fibonacci.power(5, method="loop")
+
 def test_create_rotation_matrix_2D():
     m1 = Matrix.create_rotation_matrix_2D(90)
     v1 = Vector(coordinates=[1, 0])
@@ -298,3 +340,319 @@ def test___len__():
     m: Matrix = Matrix([[1, 2, 3], [4, 5, 6]])
     assert len(m) == 2
     assert len(m[0]) == 3
+
+def test_multiply():
+    a = np.arange(12, dtype=float).reshape(3, 4)
+    b = np.arange(8, dtype=float).reshape(4, 2)
+    assert np.array_equal(multiply(a, b), a @ b)
+
+    big = 2 ** 70
+    a = np.array([[big, 1], [0, 1]], dtype=object)
+    b = np.array([[1, 0], [big, 1]], dtype=object)
+    c = multiply(a, b)
+    assert c.dtype == object
+    assert c.tolist() == [[2 * big, 1], [big, 1]]
+
+    a = np.array([[big, 1, 2]], dtype=object)
+    b = np.array([[1], [2], [3]], dtype=object)
+    assert multiply(a, b).tolist() == [[big + 8]]
+
+def test_mul_dispatch():
+    m1 = Matrix([[1.5, 2], [3, 4], [5, 6]])
+    m2 = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert m1 * m2 == np.array([[9.5, 13, 16.5], [19, 26, 33], [29, 40, 51]])
+    m3 = Matrix([[2 ** 70, 0], [0, 1]])
+    assert (m3 * m3)[0][0] == 2 ** 140
+
+def test_mul_bool():
+    m = Matrix(np.ones((80, 80), bool).tolist())
+    assert m * m == np.full((80, 80), 80)
+    assert strassen_multiply(np.ones((80, 80), bool), np.ones((80, 80), bool), 8).tolist() == [[80] * 80] * 80
+    small = Matrix([[True, True], [False, True]])
+    assert small * small == np.array([[1, 2], [0, 1]])
+
+def test_strassen_multiply():
+    rng = np.random.default_rng(0)
+    for m, k, n in [(4, 4, 4), (5, 5, 5), (7, 3, 9), (12, 17, 6)]:
+        a = rng.integers(-9, 9, (m, k)).astype(object)
+        b = rng.integers(-9, 9, (k, n)).astype(object)
+        for leaf_size in (1, 2, 64):
+            c = strassen_multiply(a, b, leaf_size)
+            assert c.shape == (m, n)
+            assert (c == a @ b).all()
+
+    a = np.array([[Fraction(1, 3), 2, 0], [1, Fraction(-1, 2), 3], [0, 1, Fraction(5, 7)]], dtype=object)
+    assert (strassen_multiply(a, a, 1) == a @ a).all()
+
+    with pytest.raises(ArgumentError):
+        strassen_multiply(a, a, 0)
+    with pytest.raises(MathError):
+        strassen_multiply(a, np.ones((2, 2)))
+
+def test_from_numpy():
+    a = np.array([[1.0, 2.0], [3.0, 4.0]])
+    m = Matrix.from_numpy(a)
+    assert m == a
+    assert m.get_dimension() == (2, 2)
+    a[0][0] = 5
+    assert m[0][0] == 5
+    c = Matrix.from_numpy(a, copy=True)
+    a[0][0] = 1
+    assert c[0][0] == 5
+
+    with pytest.raises(ArgumentError):
+        Matrix.from_numpy([[1, 2], [3, 4]])
+    with pytest.raises(ArgumentError):
+        Matrix.from_numpy(np.array([1, 2]))
+    with pytest.raises(ArgumentError):
+        Matrix.from_numpy(np.array([["a", "b"]]))
+
+def test_init_validation():
+    with pytest.raises(ArgumentError) as error:
+        Matrix([[1, 2], [3]])
+    assert error.value.args[0].startswith("Argument Error 11")
+    with pytest.raises(ArgumentError) as error:
+        Matrix([[1, "a"], [3, 4]])
+    assert error.value.args[0].startswith("Argument Error 2")
+    with pytest.raises(ArgumentError) as error:
+        Matrix([1, None])
+    assert error.value.args[0].startswith("Argument Error 4")
+    with pytest.raises(ArgumentError):
+        Matrix(np.array([["a", "b"], ["c", "d"]]))
+    with pytest.raises(ArgumentError):
+        Matrix("a")
+
+    m = Matrix(np.arange(6).reshape(2, 3))
+    assert m.get_dimension() == (2, 3)
+    assert Matrix([2 ** 70, 1]).get_dimension() == (2, 1)
+    with pytest.raises(ArgumentError):
+        m.set_components([[1, 2], ["a", 3]])
+
+def test_get_components():
+    m = Matrix([[1, 2], [3, 4]])
+    c = m.get_components()
+    c[0][0] = 9
+    assert m[0][0] == 1
+
+    view = m.get_components(copy=False)
+    assert not view.flags.writeable
+    with pytest.raises(ValueError):
+        view[0][0] = 9
+    m[0][0] = 5
+    assert view[0][0] == 5
+
+    with pytest.raises(ArgumentError):
+        m.get_components("no")
+
+def test_reductions():
+    m: Matrix = Matrix([[1, 5], [3, 4], [2, 0]])
+    assert m.sum(axis=0) == Vector([6, 9])
+    assert m.sum(axis=1) == Vector([6, 7, 2])
+    assert m.max(axis=0) == Vector([3, 5])
+    assert m.min(axis=1) == Vector([1, 3, 0])
+    assert m.mean() == 2.5
+    assert m.mean(axis=0) == Vector([2, 3])
+    assert m.prod(axis=1) == Vector([5, 12, 0])
+    assert m.argmax() == (0, 1)
+    assert m.argmin() == (2, 1)
+    assert m.argmax(axis=0) == Vector([1, 0])
+    assert Matrix([[3, 4]]).norm() == 5
+    assert Matrix([[3, 0], [4, 0]]).norm(axis=0) == Vector([5, 0])
+
+    with pytest.raises(ArgumentError):
+        m.sum(axis=2)
+    with pytest.raises(ArgumentError):
+        m.max(axis="0")
+
+def test_in_place():
+    m: Matrix = Matrix([[1.0, 2.0], [3.0, 4.0]])
+    buffer: np.ndarray = m._data
+    m += Matrix([[1, 1], [1, 1]])
+    m -= Matrix([[0.5, 0.5], [0.5, 0.5]])
+    m *= 2
+    m /= 2
+    m *= Matrix.create_identity_matrix(2)
+    assert m._data is buffer
+    assert m == Matrix([[1.5, 2.5], [3.5, 4.5]])
+
+    # an int matrix divided by a number can not stay int
+    i: Matrix = Matrix([[2, 4]])
+    i /= 2
+    assert i == Matrix([[1.0, 2.0]])
+
+    with pytest.raises(MathError):
+        m += Matrix([[1, 2, 3]])
+
+
+def test_out():
+    a: Matrix = Matrix([[1.0, 2.0], [3.0, 4.0]])
+    b: Matrix = Matrix([[0.0, 1.0], [1.0, 0.0]])
+    out: Matrix = Matrix(rows=2, columns=2, default_value=0.0)
+    buffer: np.ndarray = out._data
+
+    assert a.add(b, out=out) is out
+    assert out == Matrix([[1, 3], [4, 4]])
+    a.sub(b, out=out)
+    assert out == Matrix([[1, 1], [2, 4]])
+    a.matmul(b, out=out)
+    assert out == Matrix([[2, 1], [4, 3]])
+    assert out._data is buffer
+
+    a.matmul(b, out=a)
+    assert a == Matrix([[2, 1], [4, 3]])
+    assert a.add(b) == Matrix([[2, 2], [5, 3]])
+    assert Matrix([[1, 2]]).matmul(Matrix([[1], [1]])) == Matrix([[3]])
+
+    with pytest.raises(MathError):
+        a.matmul(b, out=Matrix(rows=3, columns=2))
+    with pytest.raises(ArgumentError):
+        a.add(b, out=Matrix([[0, 0], [0, 0]]))
+    with pytest.raises(ArgumentError):
+        a.add(b, out=[[0, 0], [0, 0]])
+
+def test_mapped(tmp_path):
+    path = tmp_path / "matrix.npy"
+    with Matrix.create_mapped(path, 3, 2) as m:
+        assert m.is_mapped()
+        assert m.get_dimension() == (3, 2)
+        m[0][1] = 5
+        m += Matrix([[1, 1], [1, 1], [1, 1]])
+        assert m.is_mapped()
+    assert m.get_dimension() == (0, 0)
+    assert not m.is_mapped()
+
+    m = Matrix.open(path)
+    assert m == Matrix([[1, 6], [1, 1], [1, 1]])
+    assert m.sum(axis=0) == Vector([3, 8])
+    assert not (m * 2).is_mapped()
+    assert not m.copy().is_mapped()
+    with pytest.raises(ValueError):
+        m[0][0] = 2
+    m.close()
+
+    m = Matrix.open(path, mode="r+")
+    m[2][0] = 7
+    m.flush()
+    assert np.load(path)[2][0] == 7
+    m.close()
+
+    m = Matrix.open(path, mode="c")
+    m[2][0] = 0
+    m.close()
+    assert np.load(path)[2][0] == 7
+
+    with pytest.raises(StateError):
+        m.close()
+    with pytest.raises(StateError):
+        Matrix([[1]]).flush()
+    with pytest.raises(ArgumentError):
+        Matrix.open(path, mode="w")
+    with pytest.raises(ArgumentError):
+        Matrix.create_mapped(path, 2, 2, dtype=object)
+
+def test_matmul_blocked(tmp_path):
+    rng = np.random.default_rng(0)
+    a: np.ndarray = rng.random((7, 5))
+    b: np.ndarray = rng.random((5, 4))
+    np.save(tmp_path / "a.npy", a)
+    np.save(tmp_path / "b.npy", b)
+
+    # room for four 3x3 float tiles
+    with Matrix.matmul_blocked(tmp_path / "a.npy", tmp_path / "b.npy", tmp_path / "c.npy", 4 * 8 * 9) as c:
+        assert c.is_mapped()
+        assert c == Matrix.from_numpy(a) * Matrix.from_numpy(b)
+    assert np.allclose(np.load(tmp_path / "c.npy"), a @ b)
+
+    i: np.ndarray = np.arange(6).reshape(2, 3)
+    np.save(tmp_path / "i.npy", i)
+    np.save(tmp_path / "t.npy", i.T)
+    c = Matrix.matmul_blocked(tmp_path / "i.npy", tmp_path / "t.npy", tmp_path / "c.npy", 4 * 8)
+    assert c == Matrix.from_numpy(i @ i.T)
+    c.close()
+
+    # bools are counted as ints like in Matrix * Matrix
+    np.save(tmp_path / "bool.npy", np.ones((2, 2), bool))
+    with Matrix.matmul_blocked(tmp_path / "bool.npy", tmp_path / "bool.npy", tmp_path / "c.npy", 4 * 8) as c:
+        assert c.get_dtype() == np.int_
+        assert c == Matrix([[2, 2], [2, 2]])
+
+    z: np.ndarray = a[:4, :4] + 1j * a[:4, :4].T
+    np.save(tmp_path / "z.npy", z)
+    with Matrix.matmul_blocked(tmp_path / "z.npy", tmp_path / "z.npy", tmp_path / "c.npy", 4 * 16 * 4) as c:
+        assert np.allclose(c._data, z @ z)
+
+    with pytest.raises(MathError):
+        Matrix.matmul_blocked(tmp_path / "a.npy", tmp_path / "a.npy", tmp_path / "c.npy")
+    with pytest.raises(ArgumentError):
+        Matrix.matmul_blocked(tmp_path / "a.npy", tmp_path / "b.npy", tmp_path / "c.npy", 16)
+
+def test_exact():
+    m: Matrix = Matrix([[Fraction(1, 2), 1], [Fraction(1, 3), 1]])
+    assert m.get_determinant() == Fraction(1, 6)
+    assert m.get_rank() == 2
+    assert m.get_invers() == Matrix([[6, -6], [-2, 3]])
+    assert m.get_invers() * m == Matrix.create_identity_matrix(2)
+
+    i: Matrix = Matrix([[4, 7], [2, 6]])
+    assert i.get_determinant() == 10
+    assert isinstance(i.get_determinant(), float)
+    assert i.get_determinant(exact=True) == 10
+    assert i.get_invers(exact=True) == Matrix([[Fraction(3, 5), Fraction(-7, 10)], [Fraction(-1, 5), Fraction(2, 5)]])
+    assert i.to_exact().get_invers() == i.get_invers(exact=True)
+    assert Matrix([[1, 2], [2, 4]]).get_rank() == 1
+    assert Matrix([[1, 2], [2, 4]]).get_invers(exact=True) is None
+    assert Matrix([[0.5, 0.25]]).to_exact() == Matrix([[Fraction(1, 2), Fraction(1, 4)]])
+
+    with pytest.raises(MathError):
+        Matrix([[1, 2, 3]]).get_determinant()
+    with pytest.raises(ArgumentError):
+        i.get_rank(exact="yes")
+
+def test_dtype():
+    a: Matrix = Matrix([[1, 2], [3, 4]], dtype=np.float32)
+    assert a.get_dtype() == np.float32
+    assert Matrix(rows=2, columns=3, default_value=1, dtype="int32").get_dtype() == np.int32
+    assert Matrix.from_numpy(np.ones((2, 2)), dtype=np.float32).get_dtype() == np.float32
+    assert Matrix.create_identity_matrix(3, dtype=np.int32).get_dtype() == np.int32
+    assert Matrix.create_rotation_matrix_2D(90, dtype=np.float32).get_dtype() == np.float32
+    assert Matrix.create_rotation_matrix_3D(90, Axis.Z, dtype=np.float32).get_dtype() == np.float32
+
+    # python numbers keep the dtype, matrices promote to the larger one
+    assert (a * 2.5).get_dtype() == np.float32
+    assert (a * a).get_dtype() == np.float32
+    assert (a + Matrix([[1.0, 2.0], [3.0, 4.0]])).get_dtype() == np.float64
+    assert (Matrix([[1, 2], [3, 4]], dtype=np.int32) / 2).get_dtype() == np.float64
+    a += Matrix([[1, 1], [1, 1]], dtype=np.float32)
+    assert a.get_dtype() == np.float32
+    assert a.astype(np.float64).get_dtype() == np.float64
+
+    c: Matrix = Matrix([[1 + 1j, 0], [0, 2]])
+    assert c.get_dtype() == np.complex128
+    assert (c * c)[0][0] == 2j
+    assert (c * 1j)[1][1] == 2j
+    assert c.get_determinant() == 2 + 2j
+    assert c.sum() == 3 + 1j
+    assert Matrix([[1, 2], [3, 4]], dtype=complex).get_dtype() == np.complex128
+
+    with pytest.raises(ArgumentError):
+        Matrix([[1.5, 2], [3, 4]], dtype=int)
+    with pytest.raises(ArgumentError):
+        Matrix(rows=2, columns=2, default_value=1.5, dtype=int)
+    with pytest.raises(ArgumentError):
+        Matrix([[1, 2], [3, 4]], dtype=str)
+    with pytest.raises(ArgumentError):
+        c.astype(float)
+    with pytest.raises(ArgumentError):
+        Matrix.create_rotation_matrix_2D(90, dtype=int)
+
+def test_apply_rotation():
+    rotation: Matrix = Matrix.create_rotation_matrix_3D(90, Axis.Z)
+    points: np.ndarray = np.array([[1, 0, 0], [0, 1, 0], [1, 2, 3]])
+    assert rotation.apply_rotation(points).tolist() == [[0, 1, 0], [-1, 0, 0], [-2, 1, 3]]
+    assert rotation.apply_rotation([1, 0, 0]).tolist() == [0, 1, 0]
+    assert Matrix.create_rotation_matrix_2D(180).apply_rotation(np.ones((1000, 2))).sum() == -2000
+
+    with pytest.raises(MathError):
+        rotation.apply_rotation(np.ones((4, 2)))
+    with pytest.raises(ArgumentError):
+        rotation.apply_rotation([["a", "b", "c"]])
@@ -0,0 +1,109 @@
+import pytest
+import numpy as np
+
+from pylix.algebra import Matrix, MatrixBatch, Axis
+from pylix.errors import ArgumentError, MathError
+
+
+def make_batch() -> MatrixBatch:
+    return MatrixBatch([Matrix([[1, 2], [3, 4]]), Matrix([[2, 0], [0, 2]]), Matrix([[0, 1], [1, 0]])])
+
+def test_init():
+    b: MatrixBatch = make_batch()
+    assert len(b) == 3
+    assert b.get_dimension() == (2, 2)
+    assert MatrixBatch(np.zeros((4, 3, 2))).get_size() == 4
+
+    with pytest.raises(ArgumentError):
+        MatrixBatch(np.zeros((3, 3)))
+    with pytest.raises(ArgumentError):
+        MatrixBatch([])
+    with pytest.raises(ArgumentError):
+        MatrixBatch([Matrix([[1, 2], [3, 4]]), Matrix([[1, 2, 3], [3, 4, 5]])])
+    with pytest.raises(ArgumentError):
+        MatrixBatch([Matrix([[1, 2], [3, 4]]), [[1, 2], [3, 4]]])
+
+def test___getitem__():
+    b: MatrixBatch = make_batch()
+    m: Matrix = b[0]
+    assert isinstance(m, Matrix)
+    assert m == Matrix([[1, 2], [3, 4]])
+    assert b[-1] == Matrix([[0, 1], [1, 0]])
+    m[0][0] = 7
+    assert b[0][0][0] == 7
+    assert len(b[1:]) == 2
+
+    with pytest.raises(ArgumentError):
+        _ = b[3]
+    with pytest.raises(ArgumentError):
+        _ = b["0"]
+
+def test_add_sub():
+    b: MatrixBatch = make_batch()
+    assert (b + b)[0] == Matrix([[2, 4], [6, 8]])
+    assert (b - b) == np.zeros((3, 2, 2))
+    assert (b + Matrix([[1, 1], [1, 1]]))[1] == Matrix([[3, 1], [1, 3]])
+
+    with pytest.raises(MathError):
+        _ = b + MatrixBatch(np.zeros((2, 2, 2)))
+    with pytest.raises(MathError):
+        _ = b + 1
+
+def test_mul():
+    b: MatrixBatch = make_batch()
+    product: MatrixBatch = b * b
+    for i, m in enumerate(b):
+        assert product[i] == m * m
+    assert (b * Matrix([[1, 0], [0, 1]])) == b
+    assert (2 * b)[1] == Matrix([[4, 0], [0, 4]])
+    assert (b / 2)[1] == Matrix([[1, 0], [0, 1]])
+
+    with pytest.raises(MathError):
+        _ = b * Matrix([[1, 2, 3]])
+
+def test_determinants_invers():
+    b: MatrixBatch = make_batch()
+    assert np.allclose(b.get_determinants(), [-2, 4, -1])
+    invers: MatrixBatch = b.get_invers()
+    for i, m in enumerate(b):
+        assert np.allclose((m * invers[i]).get_components(), np.eye(2))
+
+    with pytest.raises(MathError):
+        MatrixBatch([Matrix([[1, 1], [1, 1]])]).get_invers()
+    with pytest.raises(MathError):
+        MatrixBatch(np.ones((2, 2, 3))).get_determinants()
+
+def test_rotations():
+    thetas: np.ndarray = np.array([0, 30, 90, 180, 270.5])
+    batch: MatrixBatch = MatrixBatch.create_rotation_matrices_2D(thetas)
+    assert batch.get_size() == 5 and batch.get_dimension() == (2, 2)
+    for theta, matrix in zip(thetas, batch):
+        assert matrix == Matrix.create_rotation_matrix_2D(float(theta))
+
+    axes: list = [Axis.X, Axis.Y, Axis.Z, Axis.Y, Axis.X]
+    batch = MatrixBatch.create_rotation_matrices_3D(thetas, axes, dtype=np.float32)
+    assert batch.get_dimension() == (3, 3)
+    assert batch.get_components().dtype == np.float32
+    for theta, axis, matrix in zip(thetas, axes, batch):
+        assert np.allclose(matrix.get_components(), Matrix.create_rotation_matrix_3D(float(theta), axis)
+                           .get_components())
+    assert MatrixBatch.create_rotation_matrices_3D(thetas, Axis.Z)[2] == Matrix.create_rotation_matrix_3D(90, Axis.Z)
+
+    points: np.ndarray = np.arange(15.0).reshape(5, 3)
+    rotated: np.ndarray = batch.apply_rotation(points)
+    assert rotated.shape == (5, 3)
+    for i in range(5):
+        assert np.allclose(rotated[i], batch[i].get_components() @ points[i], atol=1e-5)
+    clouds: np.ndarray = np.ones((5, 4, 3))
+    assert batch.apply_rotation(clouds).shape == (5, 4, 3)
+
+    with pytest.raises(ArgumentError):
+        MatrixBatch.create_rotation_matrices_2D([10, 400])
+    with pytest.raises(ArgumentError):
+        MatrixBatch.create_rotation_matrices_3D(thetas, [Axis.X, Axis.Y])
+    with pytest.raises(ArgumentError):
+        MatrixBatch.create_rotation_matrices_2D([])
+    with pytest.raises(MathError):
+        batch.apply_rotation(np.ones((4, 3)))
+    with pytest.raises(MathError):
+        batch.apply_rotation(np.ones((5, 2)))
@@ -1,7 +1,8 @@
 import pytest
+import numpy as np
 
 from pylix.errors import ArgumentError, StateError, MathError
-from pylix.algebra import Polynomial
+from pylix.algebra import Polynomial, Vector, Matrix
 
 def test___init__():
     p: Polynomial = Polynomial(2, [2, 0, 1])
@@ -39,6 +40,30 @@ def test_y_at_x():
         p.y_at_x([1])
         p.y_at_x(None)
 
+def test_y_at_x_vectorized():
+    p: Polynomial = Polynomial(3, (1, -2, 0, 4))
+    x: np.ndarray = np.linspace(-3, 3, 1_000_001)
+    assert np.allclose(p.y_at_x(x), x ** 3 - 2 * x ** 2 + 4)
+    assert p.y_at_x([0, 1, 2]).tolist() == [4, 3, 4]
+    v: Vector = p.y_at_x(Vector([0, 1, 2]))
+    assert isinstance(v, Vector) and v == Vector([4, 3, 4])
+    m: Matrix = p.y_at_x(Matrix([[0, 1], [2, -1]]))
+    assert isinstance(m, Matrix) and m == Matrix([[4, 3], [4, 1]])
+    assert Polynomial(0, [3]).y_at_x(np.zeros((2, 2))).tolist() == [[3, 3], [3, 3]]
+    big: Polynomial = Polynomial(4, [1, 0, 0, 0, 0])
+    assert big.y_at_x([100000]).tolist() == [big.y_at_x(100000)] == [1e20]
+    assert big.y_at_x(Vector([100000, 2]))[0] == 1e20
+
+    # a negative degree is evaluated in 1 / x: 2 / x**2 + 1 / x + 3
+    n: Polynomial = Polynomial(-2, [2, 1, 3], integrate_derive=False)
+    assert n.y_at_x(2) == 4
+    assert n.y_at_x(np.array([1, 2])).tolist() == [6, 4]
+
+    with pytest.raises(ArgumentError):
+        p.y_at_x(["a"])
+    with pytest.raises(MathError):
+        n.y_at_x(0)
+
 def test_area():
     p: Polynomial = Polynomial(1, (1, 0))
     assert p.area(0, 1) == 0.5
@@ -51,6 +76,14 @@ def test_area():
         p.area((["a"]), 2)
         p.area(False, 3)
 
+def test_area_vectorized():
+    p: Polynomial = Polynomial(1, (1, 0))
+    assert p.area(np.array([0, 0, 0, 3.5]), np.array([1, 2, 3.5, 4])).tolist() == [0.5, 2, 6.125, 1.875]
+    assert p.area(0, [1, 2]).tolist() == [0.5, 2]
+
+    with pytest.raises(MathError):
+        p.area([0, 1, 2], [1, 2])
+
 def test_get_roots():
     p: Polynomial = Polynomial(1, [1])
     roots: tuple = p.get_roots()
@@ -76,6 +109,44 @@ def test_derivative():
         p.get_derivative(0)
         p.get_derivative(-1)
 
+def test_derivative_chain():
+    p: Polynomial = Polynomial(4, (1, 0, 1, 0, 2))
+    assert p.get_derivative() == Polynomial(3, [4, 0, 2, 0])
+    assert p.get_derivative(3) == Polynomial(1, [24, 0])
+    assert p.get_derivative(5) == Polynomial(0, [0])
+    assert p.get_derivative(7) == Polynomial(0, [0])
+    assert p._derive(2) is p._derive(2)
+
+    n: Polynomial = Polynomial(-1, [2, 1])
+    assert n.get_derivative() == Polynomial(-2, [-2, 0, 0])
+    assert n.get_derivative(2) == Polynomial(-3, [4, 0, 0, 0])
+
+def test_integral():
+    p: Polynomial = Polynomial(2, (3, 0, 1))
+    assert p.get_integral() == Polynomial(3, [1, 0, 1, 0])
+    assert p.get_integral(2) == Polynomial(4, [0.25, 0, 0.5, 0, 0])
+    assert p.get_integral(2).get_derivative(2) == p
+    assert p._integrate() is p._integrate()
+
+    with pytest.raises(MathError):
+        Polynomial(-1, [1]).get_integral()
+    with pytest.raises(MathError):
+        p.get_integral(0)
+
+def test_integrate_derive():
+    p: Polynomial = Polynomial(2, (-1, 0, 1), integrate_derive=False)
+    assert p.get_equation() == "-1 * x**2 + 1"
+    assert str(p) == "-1 * x**2 + 1"
+    assert p.get_derivative() == Polynomial(1, [-2, 0])
+    assert p.get_derivative().area(0, 1) == -1
+
+    with pytest.raises(StateError):
+        p.area(0, 1)
+    with pytest.raises(StateError):
+        p.get_local_maximum()
+    with pytest.raises(StateError):
+        p.get_infliction_point()
+
 def test_get_local_maximum():
     p: Polynomial = Polynomial(2, (-1, 0, 1))
     maximums: list = p.get_local_maximum()
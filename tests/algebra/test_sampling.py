@@ -0,0 +1,141 @@
+import pytest
+import numpy as np
+
+from pylix.algebra import Vector, AliasSampler, spawn_rngs
+from pylix.algebra.sampling import heat_probabilities, sample_batch
+from pylix.errors import ArgumentError, MathError
+
+
+def test_heat_probabilities():
+    assert heat_probabilities([1, 1, 2]).tolist() == [0.25, 0.25, 0.5]
+    assert heat_probabilities([0.2, 0.3, 0.5], -1).tolist() == [0, 0, 1]
+    hot: np.ndarray = heat_probabilities([0.2, 0.3, 0.5], 1)
+    assert np.isclose(hot.sum(), 1)
+    assert hot.max() < 0.5
+
+    with pytest.raises(ArgumentError):
+        heat_probabilities([1, 2], 2)
+    with pytest.raises(ArgumentError):
+        heat_probabilities([])
+    with pytest.raises(MathError):
+        heat_probabilities([1, -1])
+    with pytest.raises(MathError):
+        heat_probabilities([0, 0])
+
+def test_alias_sampler():
+    weights: list = [0.1, 0.0, 0.4, 0.2, 0.3]
+    sampler: AliasSampler = AliasSampler(weights)
+    assert len(sampler) == 5
+    assert 0 <= sampler.draw() <= 4 and isinstance(sampler.draw(), int)
+    draws: np.ndarray = sampler.draw(200_000, rng=0)
+    assert draws.shape == (200_000,)
+    frequencies: np.ndarray = np.bincount(draws, minlength=5) / len(draws)
+    assert np.allclose(frequencies, weights, atol=0.005)
+    assert frequencies[1] == 0
+    assert len(sampler.draw(0)) == 0
+
+    assert set(AliasSampler(weights, heat=-1).draw(1000).tolist()) == {2}
+
+    with pytest.raises(ArgumentError):
+        sampler.draw(-1)
+    with pytest.raises(ArgumentError):
+        sampler.draw(1.5)
+
+def test_vector_sampler():
+    v: Vector = Vector([0.5, .6, .03, .3, .4])
+    sampler: AliasSampler = v.sampler()
+    assert np.allclose(sampler.get_probabilities(), v.get_data() / v.sum())
+    assert v.sampler(-1).draw() == v.rand_choice(-1) == 1
+    assert 0 <= v.sampler(.5).draw(10).max() <= 4
+
+def test_rng():
+    v: Vector = Vector([0.1, 0.2, 0.3, 0.4])
+    assert [v.rand_choice(rng=7) for _ in range(5)] == [v.rand_choice(rng=7) for _ in range(5)]
+    # a Generator is advanced by every call, so the same seed gives the same sequence of draws
+    rng: np.random.Generator = np.random.default_rng(1)
+    other: np.random.Generator = np.random.default_rng(1)
+    assert [v.rand_choice(rng=rng) for _ in range(20)] == [v.rand_choice(rng=other) for _ in range(20)]
+    assert v.sampler().draw(10, rng=3).tolist() == v.sampler().draw(10, rng=3).tolist()
+    assert Vector.sample(v, 3, rng=5) == Vector.sample(v, 3, rng=5)
+
+    a: Vector = Vector(list(range(10)))
+    b: Vector = Vector(list(range(10)))
+    data = a._data
+    a.randomise(3, rng=11)
+    b.randomise(3, rng=np.random.default_rng(11))
+    assert a == b
+    assert a._data is data
+    assert sorted(a.get_data().tolist()) == list(range(10))
+
+    with pytest.raises(ArgumentError):
+        v.rand_choice(rng="seed")
+    with pytest.raises(ArgumentError):
+        v.rand_choice(rng=-1)
+    with pytest.raises(ArgumentError):
+        Vector.sample(v, 5)
+
+def test_spawn_rngs():
+    streams: list = spawn_rngs(42, 3)
+    assert len(streams) == 3
+    draws: list = [stream.random(4).tolist() for stream in streams]
+    assert draws == [stream.random(4).tolist() for stream in spawn_rngs(42, 3)]
+    assert draws[0] != draws[1]
+    assert len(spawn_rngs(np.random.default_rng(0), 2)) == 2
+    assert len(spawn_rngs(np.random.SeedSequence(1), 2)) == 2
+
+    with pytest.raises(ArgumentError):
+        spawn_rngs("seed", 2)
+    with pytest.raises(ArgumentError):
+        spawn_rngs(1, -1)
+
+def test_sample_batch():
+    probabilities: np.ndarray = np.array([[0.1, 0.0, 0.6, 0.3], [0.25, 0.25, 0.25, 0.25]])
+    n: int = 100_000
+    batch: np.ndarray = np.tile(probabilities, (n // 2, 1))
+    indices: np.ndarray = sample_batch(batch, rng=0)
+    assert indices.shape == (n,)
+    for row in range(2):
+        frequencies: np.ndarray = np.bincount(indices[row::2], minlength=4) / (n // 2)
+        assert np.allclose(frequencies, probabilities[row], atol=0.01)
+    assert np.all(indices[::2] != 1)
+
+    # logits give the same distribution, heat -1 is the argmax
+    with np.errstate(divide="ignore"):
+        logits: np.ndarray = np.log(batch)
+    assert np.array_equal(sample_batch(logits, logits=True, rng=0), indices)
+    assert sample_batch(probabilities, heat=-1).tolist() == [2, 0]
+    assert sample_batch(probabilities, heat=[-1, 0], rng=1)[0] == 2
+
+    # a hotter row is flatter
+    hot: np.ndarray = sample_batch(np.repeat(probabilities[:1], 20_000, axis=0), heat=1, rng=2)
+    assert np.mean(hot == 2) < 0.6
+
+    assert set(sample_batch(batch, top_k=1, rng=0)[::2].tolist()) == {2}
+    assert set(sample_batch(batch, top_k=2, rng=0)[::2].tolist()) == {2, 3}
+    # ties with the k-th score do not survive
+    assert len(set(sample_batch(np.full((4000, 4), .25), 0, top_k=1, rng=0).tolist())) == 1
+    assert len(set(sample_batch(np.full((4000, 4), .25), 0, top_k=2, rng=0).tolist())) == 2
+    assert set(sample_batch(batch, top_p=0.8, rng=0)[::2].tolist()) == {2, 3}
+    assert set(sample_batch(batch, top_p=0.5, rng=0)[::2].tolist()) == {2}
+
+    with pytest.raises(ArgumentError):
+        sample_batch([0.5, 0.5])
+    with pytest.raises(ArgumentError):
+        sample_batch(probabilities, heat=[0, 0, 0])
+    with pytest.raises(ArgumentError):
+        sample_batch(probabilities, top_k=5)
+    with pytest.raises(ArgumentError):
+        sample_batch(probabilities, top_p=0)
+    with pytest.raises(MathError):
+        sample_batch([[0, 0], [1, 1]])
+    with pytest.raises(MathError):
+        sample_batch([[-1, 2]])
+    with pytest.raises(MathError):
+        sample_batch([[np.nan, 1]], logits=True)
+
+def test_vector_array_rand_choice():
+    from pylix.algebra import VectorArray
+    a: VectorArray = VectorArray([[0.1, 0.9], [1, 0], [0, 3]])
+    assert a.rand_choice(heat=-1).tolist() == [1, 0, 1]
+    assert a.rand_choice(rng=0).shape == (3,)
+    assert a.rand_choice(top_k=1).tolist() == [1, 0, 1]
@@ -0,0 +1,134 @@
+import pytest
+import numpy as np
+
+from pylix.algebra import Matrix, Vector, SparseMatrix
+from pylix.errors import ArgumentError, MathError
+
+
+DENSE: list = [[1, 0, 0, 2], [0, 0, 0, 0], [0, 3, 0, -4]]
+
+def make_sparse() -> SparseMatrix:
+    return SparseMatrix(DENSE)
+
+def test_init():
+    s: SparseMatrix = make_sparse()
+    assert s.get_dimension() == (3, 4)
+    assert s.get_nnz() == 4
+    assert s.to_matrix() == Matrix(DENSE)
+    assert SparseMatrix.from_matrix(Matrix(DENSE)) == s
+    assert SparseMatrix(rows=5, columns=3).get_nnz() == 0
+
+    with pytest.raises(ArgumentError):
+        SparseMatrix(rows=0, columns=3)
+    with pytest.raises(ArgumentError):
+        SparseMatrix([[1, 2], [3]])
+
+def test_from_coo():
+    s: SparseMatrix = SparseMatrix.from_coo([2, 0, 2, 0, 1], [3, 0, 1, 0, 1], [-4, 1, 3, 0, 0], (3, 4))
+    assert s.to_matrix() == Matrix([[1, 0, 0, 0], [0, 0, 0, 0], [0, 3, 0, -4]])
+    assert s.get_component(0, 0) == 1
+    # duplicates are summed up and zeros are not stored
+    assert s.get_nnz() == 3
+    rows, columns, values = s.to_coo()
+    assert rows.tolist() == [0, 2, 2]
+    assert columns.tolist() == [0, 1, 3]
+    assert values.tolist() == [1, 3, -4]
+
+    with pytest.raises(ArgumentError):
+        SparseMatrix.from_coo([3], [0], [1], (3, 4))
+    with pytest.raises(ArgumentError):
+        SparseMatrix.from_coo([0, 1], [0], [1], (3, 4))
+    with pytest.raises(ArgumentError):
+        SparseMatrix.from_coo([0], [0], [1], [3, 4])
+
+def test_components():
+    s: SparseMatrix = make_sparse()
+    assert s[0].tolist() == [1, 0, 0, 2]
+    assert s[-1].tolist() == [0, 3, 0, -4]
+    assert s[2, 1] == 3
+    assert s[1, 1] == 0
+
+    s.set_component(1, 2, 7)
+    s.set_component(0, 0, 0)
+    s.set_component(2, 3, 5)
+    assert s.get_nnz() == 4
+    assert s.to_matrix() == Matrix([[0, 0, 0, 2], [0, 0, 7, 0], [0, 3, 0, 5]])
+
+    # negative indices count from the end
+    assert s[-1, 1] == 3
+    assert s[-1, -1] == 5
+    s.set_component(-2, -1, 6)
+    s.set_component(-3, -1, 0)
+    assert s.to_matrix() == Matrix([[0, 0, 0, 0], [0, 0, 7, 6], [0, 3, 0, 5]])
+
+    with pytest.raises(ArgumentError):
+        _ = s[3]
+    with pytest.raises(ArgumentError):
+        _ = s[-4, 0]
+    with pytest.raises(ArgumentError):
+        s.get_component(0, 4)
+
+def test_add_sub():
+    s: SparseMatrix = make_sparse()
+    assert (s + s).to_matrix() == Matrix(DENSE) * 2
+    assert (s - s).get_nnz() == 0
+    assert s + Matrix(rows=3, columns=4, default_value=1) == Matrix(DENSE) + Matrix(rows=3, columns=4,
+                                                                                     default_value=1)
+    assert isinstance(s - Matrix(DENSE), Matrix)
+
+    with pytest.raises(MathError):
+        _ = s + SparseMatrix(rows=4, columns=3)
+    with pytest.raises(MathError):
+        _ = s + 1
+
+def test_mul():
+    s: SparseMatrix = make_sparse()
+    dense: Matrix = Matrix(DENSE)
+    assert (s * 2).to_matrix() == dense * 2
+    assert (2 * s).to_matrix() == dense * 2
+    assert (s * 0).get_nnz() == 0
+    assert (s / 2).to_matrix() == dense / 2
+
+    v: Vector = Vector([1, 2, 3, 4])
+    product = s * v
+    assert isinstance(product, Vector)
+    assert product == dense * v
+
+    other: Matrix = Matrix([[1, 0], [0, 1], [2, 2], [1, -1]])
+    assert s * other == dense * other
+    assert (s * SparseMatrix(other)).to_matrix() == dense * other
+    assert (s * s.transpose()).to_matrix() == dense * s.transpose().to_matrix()
+
+    with pytest.raises(MathError):
+        _ = s * s
+    with pytest.raises(MathError):
+        _ = s * "2"
+
+def test_reductions():
+    s: SparseMatrix = make_sparse()
+    dense: Matrix = Matrix(DENSE)
+    for axis in (None, 0, 1):
+        assert s.sum(axis) == dense.sum(axis)
+        assert s.max(axis) == dense.max(axis)
+        assert s.min(axis) == dense.min(axis)
+        assert s.mean(axis) == dense.mean(axis)
+        assert s.norm(axis) == dense.norm(axis)
+
+    with pytest.raises(ArgumentError):
+        s.sum(2)
+
+def test_where():
+    s: SparseMatrix = make_sparse()
+    assert s.where([[1, 1, 1, 0], [1, 1, 1, 1], [1, 0, 1, 1]]).to_matrix() == Matrix([[1, 0, 0, 0], [0, 0, 0, 0],
+                                                                                       [0, 0, 0, -4]])
+    assert s.where(SparseMatrix.from_coo([0], [3], [1], (3, 4))).to_coo()[2].tolist() == [2]
+
+    with pytest.raises(ArgumentError):
+        s.where([[1, 1], [1, 1]])
+
+def test_large():
+    n: int = 100_000
+    diagonal: SparseMatrix = SparseMatrix.from_coo(np.arange(n), np.arange(n), np.full(n, 2.0), (n, n))
+    v: Vector = Vector.from_numpy(np.ones(n))
+    assert (diagonal * v).sum() == 2 * n
+    assert (diagonal * diagonal).get_nnz() == n
@@ -1,6 +1,8 @@
 import pytest
+import numpy as np
 
-from pylix.algebra.statics import rnd, variance, average, std
+from pylix.algebra import Matrix
+from pylix.algebra.statics import rnd, variance, average, std, Rounding, get_precision, set_precision, precision
 from pylix.errors.useful_errors import ArgumentError
 
 def test_rnd():
@@ -8,6 +10,9 @@ def test_rnd():
     assert 5.200_021_895 == rnd(5.200_021_894_6)
     assert 5.20002 == rnd(5.200021, 5)
     assert 5.20002 == rnd(5.200016, 5)
+    assert rnd(np.array([0.123_456_789_9, 1.5])).tolist() == [0.123_456_79, 1.5]
+    big: np.ndarray = np.array([1e20, -3e17, 1.234_567_891_234e8])
+    assert rnd(big).tolist() == [rnd(float(value)) for value in big] == [1e20, -3e17, 123_456_789.123_4]
 
 def test_average():
     assert 5 == average([5, 5, 5, 5, 5])
@@ -26,3 +31,26 @@ def test_std():
     assert .632_455_532 == std([4, 5, 5, 5, 6])
     assert 1.414_213_562 == std([3, 4, 5, 6, 7])
     assert 6.356_099_433 == std([-5, 4, 5, 6, 15])
+
+def test_precision():
+    assert get_precision() == (Rounding.ALWAYS, 9)
+    a: Matrix = Matrix([[1 / 3, 0], [0, 1]])
+    assert (a * a)[0][0] == 0.111_111_111
+
+    with precision("none"):
+        assert get_precision() == (Rounding.NONE, 9)
+        assert (a * a)[0][0] == (1 / 3) * (1 / 3)
+        assert average([1 / 3, 1 / 3]) == 1 / 3
+    with precision(Rounding.OUTPUT, 3):
+        assert (a * a)[0][0] == 0.111
+        assert rnd(1 / 3) == 0.333
+    assert get_precision() == (Rounding.ALWAYS, 9)
+
+    with pytest.raises(ArgumentError):
+        set_precision("sometimes")
+    with pytest.raises(ArgumentError):
+        set_precision(decimals=1.5)
+    with pytest.raises(ArgumentError):
+        with precision("sometimes"):
+            pass
+    assert get_precision() == (Rounding.ALWAYS, 9)
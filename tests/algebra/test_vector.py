@@ -1,4 +1,6 @@
 import pytest
+import numpy as np
+
 from pylix.algebra.vector import Vector
 from pylix.algebra.statics import rnd
 from pylix.errors import ArgumentError, MathError
@@ -146,3 +148,65 @@ def test_sample():
 def test___len__():
     v: Vector = Vector([1, 2, 3, 5])
     assert len(v) == 4
+
+def test_from_numpy():
+    a = np.array([1.0, 2.0, 3.0])
+    v: Vector = Vector.from_numpy(a)
+    assert isinstance(v, Vector)
+    assert v == Vector([1, 2, 3])
+    a[1] = 7
+    assert v[1] == 7
+    assert Vector.from_numpy(np.array([[1], [2]])) == Vector([1, 2])
+
+    with pytest.raises(ArgumentError):
+        Vector.from_numpy(np.ones((2, 2)))
+    with pytest.raises(ArgumentError):
+        Vector.from_numpy([1, 2])
+
+def test_set_data():
+    v: Vector = Vector([1, 2, 3])
+    v.set_data([4, 5])
+    assert v == Vector([4, 5])
+    assert v.get_rows() == 2
+    v.set_data(np.array([1.5, 2.5]))
+    assert v == Vector([1.5, 2.5])
+
+    with pytest.raises(ArgumentError):
+        v.set_data([1, "a"])
+    with pytest.raises(ArgumentError):
+        v.set_data((1, 2))
+
+def test_get_data():
+    v: Vector = Vector([1, 2, 3])
+    view = v.get_data(copy=False)
+    assert view.shape == (3,)
+    assert not view.flags.writeable
+    v[0] = 7
+    assert view[0] == 7
+    data = v.get_data()
+    data[0] = 1
+    assert v[0] == 7
+
+def test_reductions():
+    v: Vector = Vector([1, 4, 3, 2])
+    assert v.mean() == 2.5
+    assert v.prod() == 24
+    assert v.argmax() == 1
+    assert v.argmin() == 0
+    assert v.norm() == v.length()
+
+def test_dtype():
+    v: Vector = Vector([1, 2, 3], dtype=np.float32)
+    assert v.get_dtype() == np.float32
+    assert Vector(dimension=4, dtype=np.int32).get_dtype() == np.int32
+    assert Vector.from_numpy(np.arange(3), dtype=float).get_dtype() == np.float64
+    assert (v * 2).get_dtype() == np.float32
+    assert v * v == 14
+
+    c: Vector = Vector([1j, 2])
+    assert c[0] == 1j
+    c[1] = 1 + 1j
+    assert c * c == 2j - 1
+
+    with pytest.raises(ArgumentError):
+        Vector([1.5, 2], dtype=np.int32)
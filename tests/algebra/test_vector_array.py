@@ -0,0 +1,84 @@
+import pytest
+import numpy as np
+
+from pylix.algebra import Vector, VectorArray
+from pylix.errors import ArgumentError, MathError
+
+
+def make_array() -> VectorArray:
+    return VectorArray([[1, 0, 0], [0, 2, 0], [3, 4, 0]])
+
+def test_init():
+    a: VectorArray = make_array()
+    assert a.get_size() == 3
+    assert a.get_dimension() == 3
+    assert VectorArray([Vector([1, 2]), Vector([3, 4])]) == np.array([[1, 2], [3, 4]])
+    assert VectorArray(np.ones((5, 2)), dtype=np.float32).get_dtype() == np.float32
+
+    with pytest.raises(ArgumentError):
+        VectorArray([])
+    with pytest.raises(ArgumentError):
+        VectorArray([Vector([1, 2]), Vector([1, 2, 3])])
+    with pytest.raises(ArgumentError):
+        VectorArray(np.ones(3))
+    with pytest.raises(ArgumentError):
+        VectorArray([["a", "b"]])
+
+def test___getitem__():
+    a: VectorArray = make_array()
+    v: Vector = a[2]
+    assert isinstance(v, Vector)
+    assert v == Vector([3, 4, 0])
+    # the vector is a view into the array
+    v[0] = 7
+    assert a[-1][0] == 7
+    a[0] = Vector([1, 1, 1])
+    assert a.get_components()[0].tolist() == [1, 1, 1]
+    assert a[1:].get_size() == 2
+    assert [vector.length() for vector in a] == a.length().tolist()
+
+    with pytest.raises(ArgumentError):
+        _ = a[3]
+    with pytest.raises(ArgumentError):
+        a[0] = Vector([1, 1])
+
+def test_dot_cross():
+    a: VectorArray = make_array()
+    b: VectorArray = VectorArray([[0, 1, 0], [1, 1, 1], [1, 0, 0]])
+    assert a.dot(b).tolist() == [0, 2, 3]
+    assert (a * b).tolist() == [0, 2, 3]
+    assert a.dot(Vector([1, 1, 1])).tolist() == [1, 2, 7]
+    for i in range(3):
+        assert a.cross(b)[i] == a[i].cross(b[i])
+    assert a.cross(Vector([0, 0, 1])) == np.array([[0, -1, 0], [2, 0, 0], [4, -3, 0]])
+
+    with pytest.raises(MathError):
+        a.dot(b[:2])
+    with pytest.raises(MathError):
+        a.dot(Vector([1, 1]))
+    with pytest.raises(MathError):
+        VectorArray([[1, 2]]).cross(Vector([1, 2]))
+
+def test_length_normalize():
+    a: VectorArray = make_array()
+    assert a.length().tolist() == [1, 2, 5]
+    assert a.normalize() == np.array([[1, 0, 0], [0, 1, 0], [0.6, 0.8, 0]])
+    assert np.allclose(VectorArray(np.random.default_rng(0).normal(size=(1000, 3))).normalize().length(), 1)
+
+    with pytest.raises(MathError):
+        VectorArray([[1, 0], [0, 0]]).normalize()
+
+def test_arithmetic():
+    a: VectorArray = make_array()
+    assert (a + a) == a.get_components() * 2
+    assert (a - Vector([1, 0, 0])) == np.array([[0, 0, 0], [-1, 2, 0], [2, 4, 0]])
+    assert (2 * a) == a * 2
+    assert (a / 2) == a.get_components() / 2
+    assert a.scale([1, 0, 2]) == np.array([[1, 0, 0], [0, 0, 0], [6, 8, 0]])
+
+    with pytest.raises(MathError):
+        _ = a + VectorArray([[1, 2, 3]])
+    with pytest.raises(MathError):
+        a.scale([1, 2])
+    with pytest.raises(MathError):
+        _ = a / 0
@@ -0,0 +1,60 @@
+import pytest
+
+from pylix.algebra import Vector, Matrix
+from pylix.errors import assertion, validation, set_validation_level, get_validation_level, ValidationLevel
+from pylix.errors import ArgumentError, ArgumentCodes, TypesTuple
+
+
+def test_assert_types():
+    assertion.assert_types(1, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+    with pytest.raises(ArgumentError):
+        assertion.assert_types(1.5, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+
+def test_validation_full():
+    assert get_validation_level() == ValidationLevel.FULL
+    with pytest.raises(ArgumentError):
+        Vector([1, 2])["0"]
+
+def test_validation_off():
+    with validation("off") as level:
+        assert level == ValidationLevel.OFF
+        assertion.assert_types(1.5, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assert Vector([1, 2])[1] == 2
+    assert get_validation_level() == ValidationLevel.FULL
+    with pytest.raises(ArgumentError):
+        assertion.assert_types(1.5, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+
+def test_validation_boundary():
+    with validation(ValidationLevel.BOUNDARY):
+        with pytest.raises(ArgumentError):
+            assertion.assert_types(1.5, TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        with pytest.raises(ArgumentError):
+            Vector([1, 2])["0"]
+        with pytest.raises(ArgumentError):
+            assertion.assert_types_list([1, 1.5], TypesTuple.INT.value, ArgumentError, code=ArgumentCodes.NOT_INT)
+        assert Vector([1, 2]) + Vector([1, 1]) == Vector([2, 3])
+        assert Matrix([[1, 2], [3, 4]]) * Vector([1, 1]) == Vector([3, 7])
+    assert get_validation_level() == ValidationLevel.FULL
+
+def test_validation_boundary_constructors():
+    with validation("boundary"):
+        with pytest.raises(ArgumentError):
+            Matrix([[1, None], [2, 3]])
+        with pytest.raises(ArgumentError):
+            Vector([1, None, "x"])
+        m: Matrix = Matrix([[1, 2], [3, 4]])
+        with pytest.raises(ArgumentError):
+            m.set_components([[1, None], [2, 3]])
+        v: Vector = Vector([1, 2])
+        with pytest.raises(ArgumentError):
+            v.set_data([1, None])
+
+def test_set_validation_level():
+    set_validation_level("off")
+    assert get_validation_level() == ValidationLevel.OFF
+    set_validation_level(ValidationLevel.FULL)
+    assert get_validation_level() == ValidationLevel.FULL
+    with pytest.raises(ArgumentError):
+        set_validation_level("sometimes")
+    with pytest.raises(ArgumentError):
+        set_validation_level(1)